@@ -0,0 +1,145 @@
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, Any
+
+from fastapi import Header
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
+
+from app.application.http_exceptions import UnprocessableEntityException
+from app.application.use_case_factory.factory import UseCaseFactory
+from app.core.config import settings
+from app.domain.entities.idempotency.entities import IdempotencyRecord
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+IdempotencyKey = Annotated[
+    str | None,
+    Header(
+        min_length=1,
+        max_length=IDEMPOTENCY_KEY_MAX_LENGTH,
+        description="Unique per operation; retries with the same key are replayed",
+    ),
+]
+
+IDEMPOTENCY_RESPONSES: dict[int | str, dict] = {
+    422: {"description": "Idempotency-Key reused with a different request"},
+}
+
+# Keys being executed by this process, so that concurrent duplicates wait for
+# the first request instead of racing it to the unique constraint
+_in_flight: dict[str, asyncio.Event] = {}
+
+
+def request_fingerprint(body: Any) -> str:
+    """Hash of a request body, to detect a key reused for another request."""
+    payload = json.dumps(jsonable_encoder(body), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def run_idempotent[U](
+    key: str | None,
+    *,
+    scope: str,
+    request_body: Any,
+    use_case: UseCaseFactory[U],
+    call: Callable[[U], Awaitable[Any]],
+    response_model: Any,
+    status_code: int,
+) -> Any:
+    """
+    Run `call` on a new `use_case` context, at most once per `key`.
+
+    The response is stored in the use case's own transaction, so it is saved if
+    and only if the use case's writes are. A retry with the same key gets the
+    stored status and body back (with `Idempotent-Replayed: true`) without the
+    use case running again. Failed requests store nothing and can be retried.
+
+    Concurrent duplicates wait for the first request in this process. Across
+    processes, the unique key makes all but one commit fail; their writes are
+    rolled back and the winner's response is replayed instead.
+
+    Without a key, `call`'s result is returned as is.
+    """
+    if key is None:
+        async with use_case() as uc:
+            return await call(uc)
+
+    scoped_key = f"{scope}:{key}"
+    fingerprint = request_fingerprint(request_body)
+
+    while (pending := _in_flight.get(scoped_key)) is not None:
+        await pending.wait()
+
+    done = _in_flight[scoped_key] = asyncio.Event()
+    try:
+        record, replayed = await _execute(
+            scoped_key, fingerprint, use_case, call, response_model, status_code
+        )
+    finally:
+        del _in_flight[scoped_key]
+        done.set()
+
+    if record.fingerprint != fingerprint:
+        raise UnprocessableEntityException(
+            "Idempotency-Key was already used with a different request."
+        )
+    return JSONResponse(
+        record.response_body,
+        status_code=record.status_code,
+        headers={"Idempotent-Replayed": "true"} if replayed else None,
+    )
+
+
+async def _execute[U](
+    scoped_key: str,
+    fingerprint: str,
+    use_case: UseCaseFactory[U],
+    call: Callable[[U], Awaitable[Any]],
+    response_model: Any,
+    status_code: int,
+) -> tuple[IdempotencyRecord, bool]:
+    not_before = datetime.now(UTC) - timedelta(
+        seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS
+    )
+    try:
+        ctx = use_case()
+        async with ctx as uc:
+            idempotency_service = ctx.get_service("idempotency_service")
+            record = await idempotency_service.get_response(
+                scoped_key, not_before=not_before
+            )
+            if record is not None:
+                return record, True
+
+            result = await call(uc)
+            body = _encode(response_model, result)
+            record = await idempotency_service.save_response(
+                scoped_key,
+                fingerprint=fingerprint,
+                status_code=status_code,
+                body=body,
+            )
+        return record, False
+    except IntegrityError:
+        # Another process stored a response for this key first
+        ctx = use_case()
+        async with ctx:
+            record = await ctx.get_service("idempotency_service").get_response(
+                scoped_key, not_before=not_before
+            )
+        if record is None:
+            raise
+        return record, True
+
+
+def _encode(response_model: Any, result: Any) -> Any:
+    """Serialize `result` as FastAPI would through `response_model`."""
+    if isinstance(response_model, type) and issubclass(response_model, BaseModel):
+        result = response_model.model_validate(result, from_attributes=True)
+    return jsonable_encoder(result)
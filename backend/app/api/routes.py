@@ -1,10 +1,31 @@
-from fastapi import APIRouter
+from fastapi import FastAPI
 
 from app.api.v1.routers.event_router import router as event_router
 from app.api.v1.routers.health_router import router as health_router
+from app.api.v1.routers.internal_router import router as internal_router
+from app.api.v1.routers.ticket_router import router as ticket_router
+from app.api.v1.routers.waiting_room_router import router as waiting_room_router
 from app.core.config import settings
 
-api_v1_router = APIRouter(prefix=settings.API_V1_PREFIX, tags=["API v1"])
+# (router, path prefix, tag) of every v1 router
+API_V1_ROUTERS = [
+    (health_router, "/health-check", "Health"),
+    (event_router, "/events", "Events"),
+    (ticket_router, "", "Tickets"),
+    (waiting_room_router, "", "Waiting Room"),
+    (internal_router, "/internal", "Internal"),
+]
 
-api_v1_router.include_router(health_router, prefix="/health-check", tags=["Health"])
-api_v1_router.include_router(event_router, prefix="/events", tags=["Events"])
+
+def include_api_v1(app: FastAPI) -> None:
+    """
+    Mount the v1 routers on `app` under the v1 prefix.
+
+    Each router is included directly rather than through an intermediate v1
+    router: every `include_router` rebuilds the routes it copies, a noticeable
+    part of the app's import time.
+    """
+    for router, prefix, tag in API_V1_ROUTERS:
+        app.include_router(
+            router, prefix=f"{settings.API_V1_PREFIX}{prefix}", tags=["API v1", tag]
+        )
@@ -1,7 +1,8 @@
 from collections.abc import Iterable
+from copy import copy
 from typing import Annotated, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 from pydantic.fields import FieldInfo
 from pydantic.json_schema import SkipJsonSchema
 
@@ -17,11 +18,14 @@ def _get_model_fields(class_bases: Iterable[type]) -> dict[str, FieldInfo]:
     return merged_fields
 
 
-class IgnoreSchemaMixin(BaseModel):
+class IgnoreSchemaMixin:
     """
     A mixin for Pydantic models that allows subclasses to specify fields to be
     excluded from the generated JSON schema via `ignore_in_schema`.
 
+    The mixins are plain classes, not models: every model base adds to the
+    work Pydantic does when building each subclass.
+
     To use this, define a `ignore_in_schema` attribute of type `ClassVar`
 
     Usage:
@@ -37,7 +41,8 @@ class IgnoreSchemaMixin(BaseModel):
     def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
 
-        ignore_fields: Iterable[str] | None = getattr(cls, "ignore_in_schema", None)
+        # Only where declared: subclasses inherit the rewritten fields as they are
+        ignore_fields: Iterable[str] | None = cls.__dict__.get("ignore_in_schema")
         if ignore_fields is None:
             return
 
@@ -72,7 +77,7 @@ class IgnoreSchemaMixin(BaseModel):
             setattr(cls, name, None)
 
 
-class AllOptionalMixin(BaseModel):
+class AllOptionalMixin:
     """
     Mixin for Pydantic models that makes all defined and inherited fields optional
     while preserving existing Field metadata, validators, constraints, etc.
@@ -95,7 +100,9 @@ class AllOptionalMixin(BaseModel):
             if type(ann) is type(None) or type(None) in get_args(ann):
                 continue
 
-            # Set default to None without losing other metadata
+            # Set default to None without losing other metadata, on a copy: the
+            # field info belongs to the base model
+            field = copy(field)
             field.default = None
             field.default_factory = None
 
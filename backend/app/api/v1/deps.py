@@ -0,0 +1,83 @@
+import hmac
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import Header, Query
+from pydantic import AwareDatetime
+
+from app.api.idempotency import IdempotencyKey
+from app.application.http_exceptions import ForbiddenException
+from app.application.use_cases import waiting_room
+from app.core.config import settings
+from app.domain.entities.events.entities import EventFilters
+
+
+async def require_admission(
+    x_queue_token: Annotated[
+        str | None, Header(description="Token from joining the event's queue")
+    ] = None,
+    idempotency_key: IdempotencyKey = None,
+) -> AsyncIterator[int | None]:
+    """
+    Reject clients the waiting room has not admitted yet, before any use case or
+    database session is created. Yields the event the token admits to, or
+    None when the waiting room is disabled.
+
+    Each token buys once: its place is claimed here and given back if the
+    purchase fails. With an Idempotency-Key, the token is bound to that key
+    instead, so the purchase can be retried (and replayed) with it.
+    """
+    if not settings.WAITING_ROOM_ENABLED:
+        yield None
+        return
+
+    status = await waiting_room.admit(x_queue_token, owner=idempotency_key)
+    try:
+        yield status.event_id
+    except Exception:
+        if idempotency_key is None:
+            await waiting_room.release(x_queue_token)
+        raise
+
+
+async def require_admin(
+    x_admin_key: Annotated[
+        str | None, Header(description="Key set in the ADMIN_API_KEY setting")
+    ] = None,
+) -> None:
+    """Guard for operator endpoints. They are disabled when no key is configured."""
+    expected = settings.ADMIN_API_KEY
+    if not (
+        expected
+        and x_admin_key
+        and hmac.compare_digest(x_admin_key.encode(), expected.encode())
+    ):
+        raise ForbiddenException("A valid admin key is required.")
+
+
+def event_filters(
+    event_type: Annotated[
+        str | None, Query(max_length=255, description="Only events of this type")
+    ] = None,
+    venue: Annotated[
+        str | None, Query(max_length=255, description="Only events at this venue")
+    ] = None,
+    starts_from: Annotated[
+        AwareDatetime | None,
+        Query(description="Only events starting at or after this time"),
+    ] = None,
+    starts_before: Annotated[
+        AwareDatetime | None, Query(description="Only events starting before this time")
+    ] = None,
+    upcoming: Annotated[
+        bool, Query(description="Only events that have not started yet")
+    ] = False,
+) -> EventFilters:
+    """Filters shared by the event listing and export endpoints."""
+    return EventFilters(
+        event_type=event_type,
+        venue=venue,
+        starts_from=starts_from,
+        starts_before=starts_before,
+        upcoming=upcoming,
+    )
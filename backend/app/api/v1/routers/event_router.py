@@ -1,29 +1,102 @@
-from typing import Annotated
+from collections.abc import AsyncIterator
+from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Body, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import WithJsonSchema
 
+from app.api.http_cache import (
+    is_conditional,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    set_validators,
+)
+from app.api.idempotency import IDEMPOTENCY_RESPONSES, IdempotencyKey, run_idempotent
+from app.api.v1.deps import event_filters
 from app.api.v1.schemas.events_schema import (
+    BulkEventCreateResponse,
     EventCreateRequest,
     EventResponse,
     EventUpdateRequest,
     PaginatedEventResponse,
 )
+from app.api.v1.serializers import (
+    event_page_response,
+    event_response,
+    events_to_csv,
+    events_to_ndjson,
+)
 from app.application.use_cases import EventUseCases
+from app.core.config import settings
+from app.domain.entities.events.entities import EventFilters, EventSort
 
 router = APIRouter()
 
+BULK_CREATE_MAX_ITEMS = 1000
+
+# Accepted as plain objects and validated one at a time by the use case, so an
+# invalid item fails alone; documented as what each item must be
+BulkEventCreateItem = Annotated[
+    dict[str, Any],
+    WithJsonSchema({"$ref": "#/components/schemas/EventCreateRequest"}),
+]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
 
 @router.post(
     "/",
     response_model=EventResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new event",
+    responses=IDEMPOTENCY_RESPONSES,
 )
 async def create_event(
     data: EventCreateRequest,
+    idempotency_key: IdempotencyKey = None,
 ):
-    async with EventUseCases.create_event() as use_case:
-        return await use_case.execute(data)
+    return await run_idempotent(
+        idempotency_key,
+        scope="POST /events/",
+        request_body=data,
+        use_case=EventUseCases.create_event,
+        call=lambda use_case: use_case.execute(data),
+        response_model=EventResponse,
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkEventCreateResponse,
+    status_code=status.HTTP_207_MULTI_STATUS,
+    summary="Create events in bulk",
+    responses=IDEMPOTENCY_RESPONSES,
+)
+async def bulk_create_events(
+    items: Annotated[
+        list[BulkEventCreateItem],
+        Body(
+            min_length=1,
+            max_length=BULK_CREATE_MAX_ITEMS,
+            description="Events to create; each is validated as EventCreateRequest",
+        ),
+    ],
+    idempotency_key: IdempotencyKey = None,
+):
+    return await run_idempotent(
+        idempotency_key,
+        scope="POST /events/bulk",
+        request_body=items,
+        use_case=EventUseCases.bulk_create_events,
+        call=lambda use_case: use_case.execute(items),
+        response_model=BulkEventCreateResponse,
+        status_code=status.HTTP_207_MULTI_STATUS,
+    )
 
 
 @router.get(
@@ -33,11 +106,111 @@ async def create_event(
     summary="Generate a paginated list of events",
 )
 async def list_events(
+    request: Request,
+    filters: Annotated[EventFilters, Depends(event_filters)],
+    sort: Annotated[
+        EventSort, Query(description="Sort field, `-` for descending; ties by id")
+    ] = EventSort.START_TIME,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 10,
+    cursor: Annotated[
+        str | None,
+        Query(
+            description="Keyset cursor from `next_cursor`; overrides `page`. "
+            "Send it with the same `sort` and filters, or get a 400"
+        ),
+    ] = None,
+    estimate_total: Annotated[
+        bool,
+        Query(description="Use a cheap planner estimate for `total` when available"),
+    ] = False,
 ):
     async with EventUseCases.list_events() as use_case:
-        return await use_case.execute(page=page, page_size=page_size)
+        result = await use_case.execute(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            estimate_total=estimate_total,
+            filters=filters,
+            sort=sort,
+        )
+
+    # Validate against the page itself, loaded in its single round trip. No
+    # Last-Modified: rows shifting between pages do not bump any timestamp.
+    etag = make_etag(
+        "events",
+        *sorted(request.query_params.multi_items()),
+        result["total"],
+        result["next_cursor"],
+        *((event.id, event.updated_at) for event in result["items"]),
+    )
+    if is_not_modified(request, etag=etag, last_modified=None):
+        return not_modified(etag=etag, last_modified=None)
+
+    response = event_page_response(result)
+    set_validators(response, etag=etag, last_modified=None)
+    return response
+
+
+@router.get(
+    "/search",
+    response_model=PaginatedEventResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search events by title, description, venue and type",
+)
+async def search_events(
+    q: Annotated[
+        str,
+        Query(
+            min_length=1,
+            max_length=200,
+            description="Words to search for; events matching all of them are "
+            "returned, most relevant first",
+        ),
+    ],
+    page_size: Annotated[int, Query(ge=1, le=100)] = 10,
+    cursor: Annotated[
+        str | None, Query(description="Keyset cursor from `next_cursor`")
+    ] = None,
+):
+    async with EventUseCases.search_events() as use_case:
+        result = await use_case.execute(q, page_size=page_size, cursor=cursor)
+    return event_page_response(result)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream all events as NDJSON or CSV",
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+)
+async def export_events(
+    filters: Annotated[EventFilters, Depends(event_filters)],
+    format: Annotated[Literal["ndjson", "csv"], Query()] = "ndjson",
+):
+    async def content() -> AsyncIterator[str]:
+        # The use case (and its session) must live as long as the stream
+        async with EventUseCases.export_events() as use_case:
+            batches = use_case.execute(
+                batch_size=settings.EVENTS_EXPORT_BATCH_SIZE,
+                filters=filters,
+            )
+            if format == "csv":
+                yield events_to_csv([], header=True)
+                async for events in batches:
+                    yield events_to_csv(events)
+            else:
+                async for events in batches:
+                    yield events_to_ndjson(events)
+
+    return StreamingResponse(
+        content(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="events.{format}"'},
+    )
 
 
 @router.get(
@@ -48,9 +221,27 @@ async def list_events(
 )
 async def get_event(
     event_id: int,
+    request: Request,
 ):
     async with EventUseCases.get_event() as use_case:
-        return await use_case.execute(event_id)
+        # Validate against `updated_at` alone before loading the full row; only
+        # worth a query when the client sent validators
+        if is_conditional(request):
+            updated_at = await use_case.get_last_modified(event_id)
+            etag = make_etag("event", event_id, updated_at)
+            if is_not_modified(request, etag=etag, last_modified=updated_at):
+                return not_modified(etag=etag, last_modified=updated_at)
+
+        event = await use_case.execute(event_id)
+
+    # Derive validators from the body: the row may have changed since the check
+    response = event_response(event)
+    set_validators(
+        response,
+        etag=make_etag("event", event_id, event.updated_at),
+        last_modified=event.updated_at,
+    )
+    return response
 
 
 @router.patch(
@@ -64,4 +255,5 @@ async def update_event(
     data: EventUpdateRequest,
 ):
     async with EventUseCases.update_event() as use_case:
-        return await use_case.execute(event_id, data)
+        event = await use_case.execute(event_id, data)
+    return event_response(event)
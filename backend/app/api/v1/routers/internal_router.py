@@ -0,0 +1,83 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, status
+
+from app.api.v1.deps import require_admin
+from app.api.v1.schemas.waiting_room_schema import QueueConfigRequest
+from app.application.use_cases import (
+    TicketUseCases,
+    event_cache,
+    hold_sweeper,
+    outbox_dispatcher,
+    price_cache,
+    search_index,
+    waiting_room,
+)
+from app.infrastructure.db.pool import pool_stats
+from app.infrastructure.db.session import database
+
+router = APIRouter()
+
+
+@router.get(
+    "/stats",
+    status_code=status.HTTP_200_OK,
+    summary="Runtime statistics for monitoring",
+)
+async def get_stats() -> dict[str, Any]:
+    return {
+        "event_cache": event_cache.stats() if event_cache is not None else None,
+        "db_pool": pool_stats(database.engine.pool),
+        "db_replica_pool": (
+            pool_stats(database.replica_engine.pool)
+            if database.replica_engine is not None
+            else None
+        ),
+        "price_cache": price_cache.stats(),
+        "search_index": search_index.stats(),
+        "hold_sweeper": hold_sweeper.stats(),
+        "outbox_dispatcher": outbox_dispatcher.stats(),
+        "waiting_room": waiting_room.stats(),
+    }
+
+
+@router.get(
+    "/outbox",
+    status_code=status.HTTP_200_OK,
+    summary="Outbox backlog: pending and dead messages per topic",
+)
+async def get_outbox_backlog() -> dict[str, Any]:
+    return await outbox_dispatcher.backlog()
+
+
+@router.put(
+    "/waiting-room/{event_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Set an event's waiting room admission rate",
+    dependencies=[Depends(require_admin)],
+    responses={403: {"description": "Missing or invalid admin key"}},
+)
+async def configure_waiting_room(
+    event_id: int,
+    data: QueueConfigRequest,
+) -> dict[str, Any]:
+    config = waiting_room.configure(
+        event_id, rate=data.rate_per_second, burst=data.burst
+    )
+    return {
+        "event_id": event_id,
+        "rate_per_second": config.rate,
+        "burst": config.burst,
+    }
+
+
+@router.post(
+    "/pricing/reprice",
+    status_code=status.HTTP_200_OK,
+    summary="Reprice every upcoming event's ticket types in one batch",
+    dependencies=[Depends(require_admin)],
+    responses={403: {"description": "Missing or invalid admin key"}},
+)
+async def reprice_events() -> dict[str, Any]:
+    async with TicketUseCases.reprice_events() as use_case:
+        return {"events": await use_case.execute()}
@@ -0,0 +1,240 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response, status
+
+from app.api.idempotency import IDEMPOTENCY_RESPONSES, IdempotencyKey, run_idempotent
+from app.api.v1.deps import require_admission
+from app.api.v1.schemas.tickets_schema import (
+    HoldCreateRequest,
+    HoldResponse,
+    ReservationCreateRequest,
+    ReservationResponse,
+    TicketPriceResponse,
+    TicketTypeCreateRequest,
+    TicketTypeResponse,
+    TicketTypeShardRequest,
+)
+from app.application.use_cases import TicketUseCases
+
+router = APIRouter()
+
+PURCHASE_RESPONSES: dict[int | str, dict] = {
+    403: {"description": "Missing, invalid or used queue token (waiting room on)"},
+    409: {"description": "Not enough tickets available"},
+    429: {"description": "Not admitted by the waiting room yet"},
+    **IDEMPOTENCY_RESPONSES,
+}
+
+
+@router.post(
+    "/events/{event_id}/ticket-types",
+    response_model=TicketTypeResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Put a ticket type on sale for an event",
+)
+async def create_ticket_type(
+    event_id: int,
+    data: TicketTypeCreateRequest,
+):
+    async with TicketUseCases.create_ticket_type() as use_case:
+        return await use_case.execute(event_id, data)
+
+
+@router.get(
+    "/events/{event_id}/ticket-types",
+    response_model=list[TicketTypeResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List the ticket types of an event",
+)
+async def list_ticket_types(
+    event_id: int,
+):
+    async with TicketUseCases.list_ticket_types() as use_case:
+        return await use_case.execute(event_id)
+
+
+@router.get(
+    "/events/{event_id}/prices",
+    response_model=list[TicketPriceResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Current prices of an event's ticket types",
+)
+async def get_event_prices(
+    event_id: int,
+):
+    async with TicketUseCases.get_event_prices() as use_case:
+        prices = await use_case.execute(event_id)
+    return [
+        {"ticket_type_id": ticket_type_id, "price_cents": price_cents}
+        for ticket_type_id, price_cents in prices
+    ]
+
+
+@router.get(
+    "/ticket-types/{ticket_type_id}",
+    response_model=TicketTypeResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get a ticket type",
+)
+async def get_ticket_type(
+    ticket_type_id: int,
+):
+    async with TicketUseCases.get_ticket_type() as use_case:
+        return await use_case.execute(ticket_type_id)
+
+
+@router.post(
+    "/ticket-types/{ticket_type_id}/shards",
+    response_model=TicketTypeResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Split a ticket type's inventory across counter shards",
+    responses={409: {"description": "Ticket type is already sharded"}},
+)
+async def shard_ticket_type(
+    ticket_type_id: int,
+    data: TicketTypeShardRequest,
+):
+    async with TicketUseCases.shard_ticket_type() as use_case:
+        return await use_case.execute(ticket_type_id, data.shards)
+
+
+@router.post(
+    "/ticket-types/{ticket_type_id}/shards/rebalance",
+    response_model=TicketTypeResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Spread a sharded ticket type's remaining stock evenly",
+    responses={409: {"description": "Ticket type is not sharded"}},
+)
+async def rebalance_ticket_type_shards(
+    ticket_type_id: int,
+):
+    async with TicketUseCases.rebalance_ticket_type_shards() as use_case:
+        return await use_case.execute(ticket_type_id)
+
+
+@router.post(
+    "/ticket-types/{ticket_type_id}/reservations",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Reserve tickets",
+    responses=PURCHASE_RESPONSES,
+)
+async def reserve_tickets(
+    ticket_type_id: int,
+    data: ReservationCreateRequest,
+    admitted_event_id: Annotated[int | None, Depends(require_admission)],
+    idempotency_key: IdempotencyKey = None,
+):
+    return await run_idempotent(
+        idempotency_key,
+        scope="POST /ticket-types/{ticket_type_id}/reservations",
+        request_body={"ticket_type_id": ticket_type_id, **data.model_dump()},
+        use_case=TicketUseCases.reserve_tickets,
+        call=lambda use_case: use_case.execute(
+            ticket_type_id, data.quantity, admitted_event_id
+        ),
+        response_model=ReservationResponse,
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get(
+    "/reservations/{reservation_id}",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get a reservation",
+)
+async def get_reservation(
+    reservation_id: int,
+):
+    async with TicketUseCases.get_reservation() as use_case:
+        return await use_case.execute(reservation_id)
+
+
+@router.post(
+    "/reservations/{reservation_id}/cancel",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cancel a reservation and release its tickets",
+    responses={409: {"description": "Reservation is not active"}},
+)
+async def cancel_reservation(
+    reservation_id: int,
+):
+    async with TicketUseCases.cancel_reservation() as use_case:
+        return await use_case.execute(reservation_id)
+
+
+@router.post(
+    "/ticket-types/{ticket_type_id}/holds",
+    response_model=HoldResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Hold tickets during checkout",
+    responses=PURCHASE_RESPONSES,
+)
+async def hold_tickets(
+    ticket_type_id: int,
+    data: HoldCreateRequest,
+    admitted_event_id: Annotated[int | None, Depends(require_admission)],
+    idempotency_key: IdempotencyKey = None,
+):
+    return await run_idempotent(
+        idempotency_key,
+        scope="POST /ticket-types/{ticket_type_id}/holds",
+        request_body={"ticket_type_id": ticket_type_id, **data.model_dump()},
+        use_case=TicketUseCases.hold_tickets,
+        call=lambda use_case: use_case.execute(
+            ticket_type_id, data.quantity, admitted_event_id
+        ),
+        response_model=HoldResponse,
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get(
+    "/holds/{hold_id}",
+    response_model=HoldResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get a hold",
+)
+async def get_hold(
+    hold_id: int,
+):
+    async with TicketUseCases.get_hold() as use_case:
+        return await use_case.execute(hold_id)
+
+
+@router.post(
+    "/holds/{hold_id}/confirm",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Confirm a hold as a reservation",
+    responses={409: {"description": "Hold has expired"}, **IDEMPOTENCY_RESPONSES},
+)
+async def confirm_hold(
+    hold_id: int,
+    idempotency_key: IdempotencyKey = None,
+):
+    return await run_idempotent(
+        idempotency_key,
+        scope="POST /holds/{hold_id}/confirm",
+        request_body={"hold_id": hold_id},
+        use_case=TicketUseCases.confirm_hold,
+        call=lambda use_case: use_case.execute(hold_id),
+        response_model=ReservationResponse,
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.delete(
+    "/holds/{hold_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Release a hold and its tickets",
+    responses={409: {"description": "Hold has expired"}},
+)
+async def release_hold(
+    hold_id: int,
+):
+    async with TicketUseCases.release_hold() as use_case:
+        await use_case.execute(hold_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
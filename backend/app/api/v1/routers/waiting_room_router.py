@@ -0,0 +1,55 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Header, status
+
+from app.api.v1.schemas.waiting_room_schema import (
+    QueueJoinResponse,
+    QueueStatusResponse,
+)
+from app.application.http_exceptions import ForbiddenException
+from app.application.use_cases import waiting_room
+
+router = APIRouter()
+
+
+@router.post(
+    "/events/{event_id}/queue",
+    response_model=QueueJoinResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Join an event's waiting room",
+)
+async def join_queue(
+    event_id: int,
+):
+    # Deliberately no database access: this is the path every client hits at
+    # once when an on-sale opens
+    token, queue_status = await waiting_room.join(event_id)
+    return {
+        "token": token,
+        "event_id": event_id,
+        "admitted": queue_status.admitted,
+        "position": queue_status.position,
+        "eta_seconds": queue_status.eta_seconds,
+    }
+
+
+@router.get(
+    "/events/{event_id}/queue",
+    response_model=QueueStatusResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Check your place in an event's waiting room",
+    responses={403: {"description": "Missing or invalid queue token"}},
+)
+async def get_queue_status(
+    event_id: int,
+    x_queue_token: Annotated[str | None, Header()] = None,
+):
+    queue_status = await waiting_room.status(x_queue_token)
+    if queue_status.event_id != event_id:
+        raise ForbiddenException("Queue token is for another event.")
+    return {
+        "event_id": event_id,
+        "admitted": queue_status.admitted,
+        "position": queue_status.position,
+        "eta_seconds": queue_status.eta_seconds,
+    }
@@ -1,5 +1,5 @@
 from datetime import UTC, datetime
-from typing import Annotated, ClassVar
+from typing import Annotated, Any, ClassVar, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -53,10 +53,39 @@ class EventResponse(EventBase): ...
 
 class PaginatedEventResponse(BaseModel):
     items: list[EventResponse]
-    total: int
-    page: int
+    total: Annotated[
+        int | None, Field(description="Total number of events (page mode only)")
+    ] = None
+    total_estimated: Annotated[
+        bool | None,
+        Field(description="Whether `total` and `total_pages` are planner estimates"),
+    ] = None
+    page: Annotated[
+        int | None, Field(description="Current page number (page mode only)")
+    ] = None
     page_size: int
-    total_pages: int
+    total_pages: Annotated[
+        int | None, Field(description="Total number of pages (page mode only)")
+    ] = None
+    next_cursor: Annotated[
+        str | None,
+        Field(description="Opaque cursor for the next page, null on the last page"),
+    ] = None
+
+
+class BulkEventCreateItem(BaseModel):
+    index: Annotated[int, Field(description="Position of the item in the request")]
+    status: Literal["created", "invalid"]
+    event: EventResponse | None = None
+    errors: Annotated[
+        list[dict[str, Any]] | None, Field(description="Validation errors")
+    ] = None
+
+
+class BulkEventCreateResponse(BaseModel):
+    created: int
+    failed: int
+    items: list[BulkEventCreateItem]
 
 
 class EventUpdateRequest(EventCreateRequest, AllOptionalMixin, EventValidators): ...
@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Annotated, ClassVar
+
+from pydantic import BaseModel, Field
+
+from app.api.utils import IgnoreSchemaMixin
+from app.domain.entities.tickets.entities import ReservationStatus
+
+RESERVATION_MAX_QUANTITY = 10
+TICKET_TYPE_MAX_SHARDS = 64
+
+
+class TicketTypeBase(BaseModel):
+    id: Annotated[int, Field(description="Ticket type ID")]
+    event_id: Annotated[int, Field(description="Event the tickets are for")]
+    name: Annotated[str, Field(min_length=1, max_length=255)]
+    price_cents: Annotated[
+        int, Field(ge=0, description="Ticket price in the smallest currency unit")
+    ]
+    capacity: Annotated[int, Field(gt=0, description="Number of tickets on sale")]
+    sold: Annotated[int, Field(description="Number of tickets reserved")]
+    created_at: Annotated[datetime, Field(description="Creation timestamp")]
+    updated_at: Annotated[datetime, Field(description="Last update timestamp")]
+
+
+class TicketTypeCreateRequest(TicketTypeBase, IgnoreSchemaMixin):
+    ignore_in_schema: ClassVar[list[str]] = [
+        "id",
+        "event_id",
+        "sold",
+        "created_at",
+        "updated_at",
+    ]
+
+
+class TicketTypeResponse(TicketTypeBase):
+    available: Annotated[int, Field(description="Number of tickets left")]
+    shard_count: Annotated[
+        int, Field(description="Inventory counter shards, 0 when not sharded")
+    ]
+
+
+class TicketTypeShardRequest(BaseModel):
+    shards: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=TICKET_TYPE_MAX_SHARDS,
+            description="Counters to split the remaining stock across",
+        ),
+    ]
+
+
+class TicketPriceResponse(BaseModel):
+    ticket_type_id: int
+    price_cents: Annotated[
+        int, Field(description="Current dynamic price in the smallest currency unit")
+    ]
+
+
+class ReservationCreateRequest(BaseModel):
+    quantity: Annotated[
+        int,
+        Field(gt=0, le=RESERVATION_MAX_QUANTITY, description="Tickets to reserve"),
+    ]
+
+
+class ReservationResponse(BaseModel):
+    id: Annotated[int, Field(description="Reservation ID")]
+    ticket_type_id: int
+    quantity: int
+    unit_price_cents: Annotated[
+        int, Field(description="Price per ticket when reserved, in cents")
+    ]
+    status: ReservationStatus
+    created_at: datetime
+    updated_at: datetime
+
+
+class HoldCreateRequest(ReservationCreateRequest): ...
+
+
+class HoldResponse(BaseModel):
+    id: Annotated[int, Field(description="Hold ID")]
+    ticket_type_id: int
+    quantity: int
+    expires_at: Annotated[
+        datetime, Field(description="Tickets go back on sale after this time")
+    ]
+    created_at: datetime
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class QueueStatusResponse(BaseModel):
+    event_id: int
+    admitted: Annotated[bool, Field(description="Whether purchases are open to you")]
+    position: Annotated[
+        int, Field(description="Admissions still needed before yours, 0 if admitted")
+    ]
+    eta_seconds: Annotated[float, Field(description="Estimated wait in seconds")]
+
+
+class QueueJoinResponse(QueueStatusResponse):
+    token: Annotated[
+        str, Field(description="Send as the X-Queue-Token header when purchasing")
+    ]
+
+
+class QueueConfigRequest(BaseModel):
+    rate_per_second: Annotated[float, Field(gt=0, description="Admissions per second")]
+    burst: Annotated[
+        int, Field(ge=0, description="Admissions banked while the queue is quiet")
+    ]
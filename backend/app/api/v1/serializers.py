@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+from collections.abc import Iterable
+from dataclasses import fields
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, TypedDict
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.domain.entities.events.entities import Event
+
+EVENT_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Event))
+
+_get_event_values = attrgetter(*EVENT_FIELDS)
+
+
+def _format_datetime(value: datetime) -> str:
+    # Match Pydantic's rendering of UTC offsets
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _to_values(event: Event) -> list[Any]:
+    return [
+        _format_datetime(value) if isinstance(value, datetime) else value
+        for value in _get_event_values(event)
+    ]
+
+
+def events_to_ndjson(events: Iterable[Event]) -> str:
+    """Render events as newline-delimited JSON, one object per line."""
+    return "".join(
+        json.dumps(dict(zip(EVENT_FIELDS, _to_values(event), strict=True))) + "\n"
+        for event in events
+    )
+
+
+def events_to_csv(events: Iterable[Event], *, header: bool = False) -> str:
+    """Render events as CSV rows, optionally preceded by the header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EVENT_FIELDS)
+    writer.writerows(_to_values(event) for event in events)
+    return buffer.getvalue()
+
+
+class EventPage(TypedDict):
+    """A page of events as the listing use cases return it."""
+
+    items: list[Event]
+    total: int | None
+    total_estimated: bool | None
+    page: int | None
+    page_size: int
+    total_pages: int | None
+    next_cursor: str | None
+
+
+# Serialize the domain types directly: nothing is validated or copied into
+# response models on the way to JSON bytes
+_event_json = TypeAdapter(Event).dump_json
+_event_page_json = TypeAdapter(EventPage).dump_json
+
+
+class TrustedJSONResponse(Response):
+    """
+    JSON response for trusted values rendered to bytes by the caller.
+
+    Returning any `Response` from a route skips FastAPI's validation against
+    the route's `response_model`, which still documents the body in OpenAPI.
+    """
+
+    media_type = "application/json"
+
+
+def event_response(event: Event, **kwargs: Any) -> TrustedJSONResponse:
+    """
+    Render an event as `EventResponse` would, byte for byte. Datetimes are
+    rendered as they are, i.e. in `settings.DEFAULT_TIMEZONE` once mapped from
+    the database.
+    """
+    return TrustedJSONResponse(_event_json(event), **kwargs)
+
+
+def event_page_response(page: EventPage, **kwargs: Any) -> TrustedJSONResponse:
+    """Render a page of events as `PaginatedEventResponse` would, byte for byte."""
+    return TrustedJSONResponse(_event_page_json(page), **kwargs)
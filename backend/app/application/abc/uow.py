@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 
 
 class UnitOfWork(ABC):
@@ -7,3 +8,11 @@ class UnitOfWork(ABC):
     @abstractmethod
     async def get_session_wrapped_repo(self, *args, **kwargs):
         raise NotImplementedError
+
+    @abstractmethod
+    def add_pre_commit_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_commit_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        raise NotImplementedError
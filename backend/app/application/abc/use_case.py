@@ -1,5 +1,6 @@
 import inspect
 from abc import ABC, ABCMeta
+from typing import ClassVar
 
 from app.domain.abc.service import Service
 
@@ -46,7 +47,14 @@ class UseCaseMeta(ABCMeta):
 
 
 class UseCase(ABC, metaclass=UseCaseMeta):
-    """Base UseCase: execute has flexible arguments."""
+    """
+    Base UseCase: execute has flexible arguments.
+
+    Set `read_only = True` on use cases that never write, so services are wired
+    with their read-only repository when one is registered.
+    """
+
+    read_only: ClassVar[bool] = False
 
     async def execute(self, *args, **kwargs):
         raise NotImplementedError
@@ -1,9 +1,21 @@
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from datetime import datetime
 from typing import Any
 
+from pydantic import ValidationError
+
 from app.api.v1.schemas.events_schema import EventCreateRequest, EventUpdateRequest
 from app.application.abc.use_case import UseCase
 from app.application.http_exceptions import NotFoundException
-from app.domain.entities.events.entities import Event
+from app.application.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+    hash_filters,
+)
+from app.domain.entities.events.entities import Event, EventFilters, EventSort
 from app.domain.entities.events.services import EventService
 
 
@@ -15,7 +27,46 @@ class CreateEventUseCase(UseCase):
         return await self.event_service.create_event(data)
 
 
+class BulkCreateEventsUseCase(UseCase):
+    def __init__(self, event_service: EventService):
+        self.event_service = event_service
+
+    async def execute(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Validate every item, insert the valid ones in one batch and report a
+        result per item, in request order.
+        """
+        results: list[dict[str, Any]] = []
+        valid: list[EventCreateRequest] = []
+        valid_results: list[dict[str, Any]] = []
+
+        for index, item in enumerate(items):
+            try:
+                data = EventCreateRequest.model_validate(item)
+            except ValidationError as e:
+                errors = e.errors(include_url=False, include_context=False)
+                results.append({"index": index, "status": "invalid", "errors": errors})
+                continue
+
+            result = {"index": index, "status": "created"}
+            results.append(result)
+            valid.append(data)
+            valid_results.append(result)
+
+        events = await self.event_service.create_events(valid)
+        for result, event in zip(valid_results, events, strict=True):
+            result["event"] = event
+
+        return {
+            "created": len(events),
+            "failed": len(items) - len(events),
+            "items": results,
+        }
+
+
 class GetEventUseCase(UseCase):
+    read_only = True
+
     def __init__(self, event_service: EventService):
         self.event_service = event_service
 
@@ -25,31 +76,186 @@ class GetEventUseCase(UseCase):
             raise NotFoundException("Event not found.")
         return event
 
+    async def get_last_modified(self, event_id: int) -> datetime:
+        """Cheap validator lookup used for conditional requests."""
+        updated_at = await self.event_service.get_event_last_modified(event_id)
+        if updated_at is None:
+            raise NotFoundException("Event not found.")
+        return updated_at
+
 
 class ListEventsUseCase(UseCase):
+    read_only = True
+
     def __init__(self, event_service: EventService):
         self.event_service = event_service
 
-    async def execute(self, page: int = 1, page_size: int = 10) -> dict[str, Any]:
+    async def execute(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        cursor: str | None = None,
+        estimate_total: bool = False,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> dict[str, Any]:
+        if cursor is not None:
+            return await self._execute_keyset(page_size, cursor, filters, sort)
+
         offset = (page - 1) * page_size
         limit = page_size
 
-        events, total = await self.event_service.list_events(offset=offset, limit=limit)
+        if estimate_total:
+            result = await self.event_service.list_events_with_estimated_total(
+                offset=offset, limit=limit, filters=filters, sort=sort
+            )
+            events, total, total_estimated = result
+        else:
+            events, total = await self.event_service.list_events(
+                offset=offset, limit=limit, filters=filters, sort=sort
+            )
+            total_estimated = False
+
+        # An estimated total cannot tell whether this is the last page
+        if total_estimated:
+            has_more = len(events) == page_size
+        else:
+            has_more = offset + len(events) < total
+
         return {
             "items": events,
             "total": total,
+            "total_estimated": total_estimated,
             "page": page,
             "page_size": page_size,
             "total_pages": (total + page_size - 1) // page_size,
+            "next_cursor": (
+                self._next_cursor(events, filters, sort) if has_more else None
+            ),
         }
 
+    async def _execute_keyset(
+        self,
+        page_size: int,
+        cursor: str,
+        filters: EventFilters | None,
+        sort: EventSort,
+    ) -> dict[str, Any]:
+        """
+        Seek past the cursor position instead of skipping rows with OFFSET.
+        Totals are not computed in this mode.
+        """
+        after = decode_cursor(
+            cursor, sort=sort.value, filters_hash=self._filters_hash(filters)
+        )
+
+        # Fetch one extra row to know whether another page exists
+        events = await self.event_service.list_events_after(
+            after=after, limit=page_size + 1, filters=filters, sort=sort
+        )
+        has_more = len(events) > page_size
+        events = events[:page_size]
+        return {
+            "items": events,
+            "total": None,
+            "total_estimated": None,
+            "page": None,
+            "page_size": page_size,
+            "total_pages": None,
+            "next_cursor": (
+                self._next_cursor(events, filters, sort) if has_more else None
+            ),
+        }
+
+    @classmethod
+    def _next_cursor(
+        cls, events: list[Event], filters: EventFilters | None, sort: EventSort
+    ) -> str | None:
+        if not events:
+            return None
+        last = events[-1]
+        return encode_cursor(
+            getattr(last, sort.field),
+            last.id,
+            sort=sort.value,
+            filters_hash=cls._filters_hash(filters),
+        )
+
+    @staticmethod
+    def _filters_hash(filters: EventFilters | None) -> str:
+        # No filters and empty filters are the same listing
+        return hash_filters(asdict(filters or EventFilters()))
+
+
+class SearchEventsUseCase(UseCase):
+    read_only = True
+
+    def __init__(self, event_service: EventService):
+        self.event_service = event_service
+
+    async def execute(
+        self, query: str, page_size: int = 10, cursor: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Events matching `query`, most relevant first, paginated by keyset on
+        `(rank, id)`. Totals are not computed.
+        """
+        after = decode_rank_cursor(cursor) if cursor is not None else None
+
+        # Fetch one extra match to know whether another page exists
+        matches = await self.event_service.search_events(
+            query, after=after, limit=page_size + 1
+        )
+        has_more = len(matches) > page_size
+        matches = matches[:page_size]
+
+        next_cursor = None
+        if has_more and matches:
+            last, rank = matches[-1]
+            next_cursor = encode_rank_cursor(rank, last.id)
+        return {
+            "items": [event for event, _ in matches],
+            "total": None,
+            "total_estimated": None,
+            "page": None,
+            "page_size": page_size,
+            "total_pages": None,
+            "next_cursor": next_cursor,
+        }
+
+
+class RebuildSearchIndexUseCase(UseCase):
+    read_only = True
+
+    def __init__(self, event_service: EventService):
+        self.event_service = event_service
+
+    async def execute(self, batch_size: int) -> int:
+        return await self.event_service.rebuild_search_index(batch_size=batch_size)
+
+
+class ExportEventsUseCase(UseCase):
+    read_only = True
+
+    def __init__(self, event_service: EventService):
+        self.event_service = event_service
+
+    async def execute(
+        self, batch_size: int, filters: EventFilters | None = None
+    ) -> AsyncIterator[list[Event]]:
+        stream = self.event_service.stream_events(
+            batch_size=batch_size, filters=filters
+        )
+        async for events in stream:
+            yield events
+
 
 class UpdateEventUseCase(UseCase):
     def __init__(self, event_service: EventService):
         self.event_service = event_service
 
     async def execute(self, event_id: int, data: EventUpdateRequest) -> Event:
-        event = await self.event_service.get_event_by_id(event_id)
-        if not event:
+        event = await self.event_service.update_event(event_id, data)
+        if event is None:
             raise NotFoundException("Event not found.")
-        return await self.event_service.update_event(event_id, data)
+        return event
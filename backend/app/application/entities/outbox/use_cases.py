@@ -0,0 +1,48 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from app.application.abc.use_case import UseCase
+from app.domain.entities.outbox.entities import OutboxMessage
+from app.domain.entities.outbox.services import OutboxService
+
+
+class ClaimOutboxMessagesUseCase(UseCase):
+    def __init__(self, outbox_service: OutboxService):
+        self.outbox_service = outbox_service
+
+    async def execute(
+        self,
+        topics: Sequence[str],
+        *,
+        now: datetime,
+        claimed_until: datetime,
+        limit: int,
+    ) -> list[OutboxMessage]:
+        """Claim a batch in its own short transaction, committed on exit."""
+        return await self.outbox_service.claim(
+            topics, now=now, claimed_until=claimed_until, limit=limit
+        )
+
+
+class SettleOutboxMessagesUseCase(UseCase):
+    def __init__(self, outbox_service: OutboxService):
+        self.outbox_service = outbox_service
+
+    async def execute(
+        self,
+        delivered: Sequence[int],
+        retries: Sequence[tuple[int, datetime, str]] = (),
+        dead: Sequence[tuple[int, str]] = (),
+    ) -> None:
+        await self.outbox_service.settle(delivered, retries, dead)
+
+
+class GetOutboxBacklogUseCase(UseCase):
+    read_only = True
+
+    def __init__(self, outbox_service: OutboxService):
+        self.outbox_service = outbox_service
+
+    async def execute(self, now: datetime) -> dict[str, Any]:
+        return await self.outbox_service.get_backlog(now=now)
@@ -0,0 +1,427 @@
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+from app.api.v1.schemas.tickets_schema import TicketTypeCreateRequest
+from app.application.abc.use_case import UseCase
+from app.application.http_exceptions import (
+    ConflictException,
+    ForbiddenException,
+    NotFoundException,
+)
+from app.core.config import settings
+from app.domain.entities.events.services import EventService
+from app.domain.entities.outbox.services import OutboxService
+from app.domain.entities.tickets.entities import (
+    Hold,
+    Reservation,
+    ReservationEvent,
+    TicketType,
+)
+from app.domain.entities.tickets.services import (
+    HoldService,
+    PricingService,
+    ReservationService,
+    TicketTypeService,
+)
+
+
+async def _get_event_id(
+    ticket_type_service: TicketTypeService,
+    ticket_type_id: int,
+    admitted_event_id: int | None = None,
+) -> int:
+    """
+    Event of a ticket type, from cache after the first lookup.
+
+    `admitted_event_id` is the event the waiting room admitted the client to,
+    if any; tickets of other events are refused.
+    """
+    event_id = await ticket_type_service.get_event_id(ticket_type_id)
+    if event_id is None:
+        raise NotFoundException("Ticket type not found.")
+    if admitted_event_id is not None and event_id != admitted_event_id:
+        raise ForbiddenException("Queue token is for another event.")
+    return event_id
+
+
+async def _get_price(
+    pricing_service: PricingService, event_id: int, ticket_type_id: int
+) -> int:
+    price = await pricing_service.get_price(event_id, ticket_type_id)
+    if price is None:
+        raise NotFoundException("Ticket type not found.")
+    return price
+
+
+def _publish(
+    outbox_service: OutboxService, topic: ReservationEvent, reservation: Reservation
+) -> None:
+    """Queue a reservation change for delivery after the commit."""
+    outbox_service.publish(
+        topic,
+        {
+            "reservation_id": reservation.id,
+            "ticket_type_id": reservation.ticket_type_id,
+            "quantity": reservation.quantity,
+            "unit_price_cents": reservation.unit_price_cents,
+        },
+        key=f"reservation:{reservation.id}",
+    )
+
+
+async def _take_tickets(
+    ticket_type_service: TicketTypeService,
+    pricing_service: PricingService,
+    event_id: int,
+    ticket_type_id: int,
+    quantity: int,
+) -> None:
+    """Take tickets out of inventory for a reservation or hold."""
+    reserved = await ticket_type_service.reserve_tickets(
+        ticket_type_id, quantity, rebalance=settings.TICKET_SHARD_AUTO_REBALANCE
+    )
+    if not reserved:
+        raise ConflictException("Not enough tickets available.")
+    pricing_service.record_sold(event_id, ticket_type_id, quantity)
+
+
+async def _return_tickets(
+    ticket_type_service: TicketTypeService,
+    pricing_service: PricingService,
+    ticket_type_id: int,
+    quantity: int,
+) -> None:
+    """Put the tickets of a cancelled reservation or released hold back on sale."""
+    event_id = await _get_event_id(ticket_type_service, ticket_type_id)
+    await ticket_type_service.release_tickets(ticket_type_id, quantity)
+    pricing_service.record_sold(event_id, ticket_type_id, -quantity)
+
+
+class CreateTicketTypeUseCase(UseCase):
+    def __init__(
+        self, event_service: EventService, ticket_type_service: TicketTypeService
+    ):
+        self.event_service = event_service
+        self.ticket_type_service = ticket_type_service
+
+    async def execute(self, event_id: int, data: TicketTypeCreateRequest) -> TicketType:
+        if not await self.event_service.event_exists(event_id):
+            raise NotFoundException("Event not found.")
+        return await self.ticket_type_service.create_ticket_type(event_id, data)
+
+
+class ListTicketTypesUseCase(UseCase):
+    read_only = True
+
+    def __init__(
+        self, event_service: EventService, ticket_type_service: TicketTypeService
+    ):
+        self.event_service = event_service
+        self.ticket_type_service = ticket_type_service
+
+    async def execute(self, event_id: int) -> list[TicketType]:
+        ticket_types = await self.ticket_type_service.list_ticket_types(event_id)
+        if not ticket_types and not await self.event_service.event_exists(event_id):
+            raise NotFoundException("Event not found.")
+        return ticket_types
+
+
+class GetTicketTypeUseCase(UseCase):
+    read_only = True
+
+    def __init__(self, ticket_type_service: TicketTypeService):
+        self.ticket_type_service = ticket_type_service
+
+    async def execute(self, ticket_type_id: int) -> TicketType:
+        ticket_type = await self.ticket_type_service.get_ticket_type(ticket_type_id)
+        if ticket_type is None:
+            raise NotFoundException("Ticket type not found.")
+        return ticket_type
+
+
+class ReserveTicketsUseCase(UseCase):
+    def __init__(
+        self,
+        ticket_type_service: TicketTypeService,
+        reservation_service: ReservationService,
+        pricing_service: PricingService,
+        outbox_service: OutboxService,
+    ):
+        self.ticket_type_service = ticket_type_service
+        self.reservation_service = reservation_service
+        self.pricing_service = pricing_service
+        self.outbox_service = outbox_service
+
+    async def execute(
+        self,
+        ticket_type_id: int,
+        quantity: int,
+        admitted_event_id: int | None = None,
+    ) -> Reservation:
+        """Reserve tickets at the current price, taken before inventory changes."""
+        event_id = await _get_event_id(
+            self.ticket_type_service, ticket_type_id, admitted_event_id
+        )
+        unit_price = await _get_price(self.pricing_service, event_id, ticket_type_id)
+
+        await _take_tickets(
+            self.ticket_type_service,
+            self.pricing_service,
+            event_id,
+            ticket_type_id,
+            quantity,
+        )
+        reservation = await self.reservation_service.create_reservation(
+            ticket_type_id, quantity, unit_price_cents=unit_price
+        )
+        _publish(self.outbox_service, ReservationEvent.CREATED, reservation)
+        return reservation
+
+
+class GetEventPricesUseCase(UseCase):
+    def __init__(self, event_service: EventService, pricing_service: PricingService):
+        self.event_service = event_service
+        self.pricing_service = pricing_service
+
+    async def execute(self, event_id: int) -> list[tuple[int, int]]:
+        """Current `(ticket_type_id, price_cents)` of an event's ticket types."""
+        prices = await self.pricing_service.get_event_prices(event_id)
+        if prices is None:
+            if not await self.event_service.event_exists(event_id):
+                raise NotFoundException("Event not found.")
+            return []
+        return prices.items()
+
+
+class RepriceEventsUseCase(UseCase):
+    def __init__(self, pricing_service: PricingService):
+        self.pricing_service = pricing_service
+
+    async def execute(self) -> int:
+        """Reprice every upcoming event in one pass; returns the events priced."""
+        return len(await self.pricing_service.reprice_events())
+
+
+class ShardTicketTypeUseCase(UseCase):
+    def __init__(self, ticket_type_service: TicketTypeService):
+        self.ticket_type_service = ticket_type_service
+
+    async def execute(self, ticket_type_id: int, shards: int) -> TicketType:
+        """Opt a ticket type into sharded inventory, e.g. before a big on-sale."""
+        if not await self.ticket_type_service.enable_shards(ticket_type_id, shards):
+            if await self.ticket_type_service.get_ticket_type(ticket_type_id) is None:
+                raise NotFoundException("Ticket type not found.")
+            raise ConflictException("Ticket type is already sharded.")
+        return await self.ticket_type_service.get_ticket_type(ticket_type_id)
+
+
+class RebalanceTicketTypeShardsUseCase(UseCase):
+    def __init__(self, ticket_type_service: TicketTypeService):
+        self.ticket_type_service = ticket_type_service
+
+    async def execute(self, ticket_type_id: int) -> TicketType:
+        ticket_type = await self.ticket_type_service.get_ticket_type(ticket_type_id)
+        if ticket_type is None:
+            raise NotFoundException("Ticket type not found.")
+        if not ticket_type.sharded:
+            raise ConflictException("Ticket type is not sharded.")
+
+        await self.ticket_type_service.rebalance_shards(ticket_type_id)
+        return ticket_type
+
+
+class GetReservationUseCase(UseCase):
+    read_only = True
+
+    def __init__(self, reservation_service: ReservationService):
+        self.reservation_service = reservation_service
+
+    async def execute(self, reservation_id: int) -> Reservation:
+        reservation = await self.reservation_service.get_reservation(reservation_id)
+        if reservation is None:
+            raise NotFoundException("Reservation not found.")
+        return reservation
+
+
+class CancelReservationUseCase(UseCase):
+    def __init__(
+        self,
+        ticket_type_service: TicketTypeService,
+        reservation_service: ReservationService,
+        pricing_service: PricingService,
+        outbox_service: OutboxService,
+    ):
+        self.ticket_type_service = ticket_type_service
+        self.reservation_service = reservation_service
+        self.pricing_service = pricing_service
+        self.outbox_service = outbox_service
+
+    async def execute(self, reservation_id: int) -> Reservation:
+        reservation = await self.reservation_service.cancel_reservation(reservation_id)
+        if reservation is None:
+            if await self.reservation_service.get_reservation(reservation_id) is None:
+                raise NotFoundException("Reservation not found.")
+            raise ConflictException("Reservation is not active.")
+
+        await _return_tickets(
+            self.ticket_type_service,
+            self.pricing_service,
+            reservation.ticket_type_id,
+            reservation.quantity,
+        )
+        _publish(self.outbox_service, ReservationEvent.CANCELLED, reservation)
+        return reservation
+
+
+class HoldTicketsUseCase(UseCase):
+    def __init__(
+        self,
+        ticket_type_service: TicketTypeService,
+        hold_service: HoldService,
+        pricing_service: PricingService,
+    ):
+        self.ticket_type_service = ticket_type_service
+        self.hold_service = hold_service
+        self.pricing_service = pricing_service
+
+    async def execute(
+        self,
+        ticket_type_id: int,
+        quantity: int,
+        admitted_event_id: int | None = None,
+    ) -> Hold:
+        """
+        Take `quantity` tickets out of inventory and hold them for
+        `TICKET_HOLD_TTL_SECONDS`. Unconfirmed holds are released by the sweeper.
+        The price is set when the hold is confirmed.
+        """
+        event_id = await _get_event_id(
+            self.ticket_type_service, ticket_type_id, admitted_event_id
+        )
+        await _take_tickets(
+            self.ticket_type_service,
+            self.pricing_service,
+            event_id,
+            ticket_type_id,
+            quantity,
+        )
+        return await self.hold_service.place_hold(
+            ticket_type_id,
+            quantity,
+            ttl=timedelta(seconds=settings.TICKET_HOLD_TTL_SECONDS),
+        )
+
+
+class GetHoldUseCase(UseCase):
+    read_only = True
+
+    def __init__(self, hold_service: HoldService):
+        self.hold_service = hold_service
+
+    async def execute(self, hold_id: int) -> Hold:
+        hold = await self.hold_service.get_hold(hold_id)
+        if hold is None:
+            raise NotFoundException("Hold not found.")
+        return hold
+
+
+class ConfirmHoldUseCase(UseCase):
+    def __init__(
+        self,
+        ticket_type_service: TicketTypeService,
+        hold_service: HoldService,
+        reservation_service: ReservationService,
+        pricing_service: PricingService,
+        outbox_service: OutboxService,
+    ):
+        self.ticket_type_service = ticket_type_service
+        self.hold_service = hold_service
+        self.reservation_service = reservation_service
+        self.pricing_service = pricing_service
+        self.outbox_service = outbox_service
+
+    async def execute(self, hold_id: int) -> Reservation:
+        """
+        Turn an unexpired hold into a reservation at the current price;
+        inventory is already taken.
+        """
+        hold = await self.hold_service.claim_hold(hold_id)
+        if hold is None:
+            if await self.hold_service.get_hold(hold_id) is None:
+                raise NotFoundException("Hold not found.")
+            raise ConflictException("Hold has expired.")
+
+        event_id = await _get_event_id(self.ticket_type_service, hold.ticket_type_id)
+        unit_price = await _get_price(
+            self.pricing_service, event_id, hold.ticket_type_id
+        )
+        reservation = await self.reservation_service.create_reservation(
+            hold.ticket_type_id, hold.quantity, unit_price_cents=unit_price
+        )
+        _publish(self.outbox_service, ReservationEvent.CREATED, reservation)
+        return reservation
+
+
+class ReleaseHoldUseCase(UseCase):
+    def __init__(
+        self,
+        ticket_type_service: TicketTypeService,
+        hold_service: HoldService,
+        pricing_service: PricingService,
+    ):
+        self.ticket_type_service = ticket_type_service
+        self.hold_service = hold_service
+        self.pricing_service = pricing_service
+
+    async def execute(self, hold_id: int) -> Hold:
+        hold = await self.hold_service.release_hold(hold_id)
+        if hold is None:
+            if await self.hold_service.get_hold(hold_id) is None:
+                raise NotFoundException("Hold not found.")
+            # Released by the sweeper already
+            raise ConflictException("Hold has expired.")
+
+        await _return_tickets(
+            self.ticket_type_service,
+            self.pricing_service,
+            hold.ticket_type_id,
+            hold.quantity,
+        )
+        return hold
+
+
+class ExpireHoldsUseCase(UseCase):
+    def __init__(
+        self,
+        ticket_type_service: TicketTypeService,
+        hold_service: HoldService,
+        pricing_service: PricingService,
+    ):
+        self.ticket_type_service = ticket_type_service
+        self.hold_service = hold_service
+        self.pricing_service = pricing_service
+
+    async def execute(self, batch_size: int, now: datetime | None = None) -> list[Hold]:
+        """
+        Release one batch of expired holds: a single `UPDATE ... RETURNING` and
+        one inventory credit per ticket type. Holds released longer ago than
+        the retention period are deleted, one batch at a time.
+        """
+        now = now or datetime.now(UTC)
+        holds = await self.hold_service.expire_holds(now=now, limit=batch_size)
+        await self.hold_service.purge_expired_holds(
+            before=now - timedelta(seconds=settings.HOLD_RETENTION_SECONDS),
+            limit=batch_size,
+        )
+
+        quantities: Counter[int] = Counter()
+        for hold in holds:
+            quantities[hold.ticket_type_id] += hold.quantity
+        await self.ticket_type_service.release_many(dict(quantities))
+
+        for ticket_type_id, quantity in quantities.items():
+            event_id = await self.ticket_type_service.get_event_id(ticket_type_id)
+            if event_id is not None:
+                self.pricing_service.record_sold(event_id, ticket_type_id, -quantity)
+
+        return holds
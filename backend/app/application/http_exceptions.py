@@ -1,6 +1,39 @@
+from typing import Any
+
 from fastapi import HTTPException, status
 
 
+class BadRequestException(HTTPException):
+    def __init__(self, message: str):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
+
+
 class NotFoundException(HTTPException):
     def __init__(self, message: str):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=message)
+
+
+class ConflictException(HTTPException):
+    def __init__(self, message: str):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=message)
+
+
+class ForbiddenException(HTTPException):
+    def __init__(self, message: str):
+        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=message)
+
+
+class UnprocessableEntityException(HTTPException):
+    def __init__(self, message: str):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=message
+        )
+
+
+class TooManyRequestsException(HTTPException):
+    def __init__(self, message: Any, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=message,
+            headers={"Retry-After": str(retry_after)},
+        )
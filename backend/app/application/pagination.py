@@ -0,0 +1,96 @@
+import base64
+import binascii
+import hashlib
+import json
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from app.application.http_exceptions import BadRequestException
+
+
+def hash_filters(filters: Mapping[str, Any]) -> str:
+    """
+    Short, stable digest of a listing's filters, for binding cursors to them.
+    Datetimes are normalized to UTC so equal instants hash the same.
+    """
+
+    def default(value: Any) -> str:
+        if isinstance(value, datetime):
+            return value.astimezone(UTC).isoformat()
+        return str(value)
+
+    payload = json.dumps(dict(filters), sort_keys=True, default=default)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def encode_cursor(
+    start_time: datetime, id: int, *, sort: str, filters_hash: str
+) -> str:
+    """
+    Encode a keyset position `(start_time, id)` into an opaque, URL-safe cursor.
+    Listings sorted by another timestamp encode that timestamp instead.
+
+    `start_time` is normalized to UTC so the cursor does not depend on the
+    configured display timezone. The listing's `sort` and `filters_hash` are
+    kept in the cursor, which is only valid for that same listing.
+    """
+    payload = json.dumps(
+        [start_time.astimezone(UTC).isoformat(), id, sort, filters_hash]
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *, sort: str, filters_hash: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by `encode_cursor` for the listing with this
+    `sort` and `filters_hash`.
+
+    Raises `BadRequestException` when the cursor is malformed or was issued
+    for another sort or other filters.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start_time, id, cursor_sort, cursor_filters_hash = json.loads(
+            base64.urlsafe_b64decode(padded)
+        )
+        start_time = datetime.fromisoformat(start_time)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise BadRequestException("Invalid pagination cursor.") from e
+
+    if not isinstance(id, int) or start_time.tzinfo is None:
+        raise BadRequestException("Invalid pagination cursor.")
+    if (cursor_sort, cursor_filters_hash) != (sort, filters_hash):
+        raise BadRequestException(
+            "Pagination cursor does not match the requested sort and filters."
+        )
+
+    return start_time, id
+
+
+def encode_rank_cursor(score: float, id: int) -> str:
+    """Encode a relevance keyset position `(score, id)` into an opaque cursor."""
+    payload = json.dumps([score, id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """
+    Decode a cursor produced by `encode_rank_cursor`.
+
+    Raises `BadRequestException` when the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise BadRequestException("Invalid pagination cursor.") from e
+
+    if (
+        not isinstance(score, int | float)
+        or isinstance(score, bool)
+        or not isinstance(id, int)
+    ):
+        raise BadRequestException("Invalid pagination cursor.")
+
+    return float(score), id
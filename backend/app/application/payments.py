@@ -0,0 +1,37 @@
+from app.application.workers.outbox_dispatcher import OutboxHandler
+from app.domain.abc.payment_provider import PaymentProvider
+from app.domain.entities.outbox.entities import OutboxMessage
+from app.domain.entities.tickets.entities import ReservationEvent
+
+
+def _reference(message: OutboxMessage) -> str:
+    return f"reservation:{message.payload['reservation_id']}"
+
+
+def payment_handlers(provider: PaymentProvider) -> dict[str, OutboxHandler]:
+    """
+    Outbox handlers charging reservations through `provider`, and refunding
+    them once cancelled.
+
+    Idempotency keys are derived from the reservation, so a message delivered
+    twice (after a timeout or a dispatcher crash) is charged once.
+    """
+
+    async def charge(message: OutboxMessage) -> None:
+        payload = message.payload
+        await provider.charge(
+            reference=_reference(message),
+            amount_cents=payload["unit_price_cents"] * payload["quantity"],
+            idempotency_key=f"charge:{_reference(message)}",
+        )
+
+    async def refund(message: OutboxMessage) -> None:
+        await provider.refund(
+            reference=_reference(message),
+            idempotency_key=f"refund:{_reference(message)}",
+        )
+
+    return {
+        ReservationEvent.CREATED: charge,
+        ReservationEvent.CANCELLED: refund,
+    }
@@ -1,24 +1,39 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.abc.uow import UnitOfWork
+from app.core.logging import get_logger
 from app.domain.abc.repository import Repository
 
+logger = get_logger(__name__)
+
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
     """
     Async Unit of Work (UoW) pattern for SQLAlchemy.
 
+    Pre-commit hooks run inside the transaction, right before the commit (a
+    failing one rolls it back); commit hooks run once it has committed.
+
+    A read-only UoW never commits: its transaction is rolled back on exit and
+    no hooks are run. The read-only transaction itself comes from the
+    session factory (see `AsyncReadSessionLocal`).
+
     Usage:
     >>> async with SQLAlchemyUnitOfWork(session_factory) as uow:
     >>>     repo = uow.get_session_wrapped_repo(SomeRepo)
     >>>     await repo.do_something()
     """
 
-    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+    def __init__(
+        self, session_factory: Callable[[], AsyncSession], read_only: bool = False
+    ) -> None:
         self._session_factory = session_factory
+        self.read_only = read_only
         self.session: AsyncSession | None = None
+        self._pre_commit_hooks: list[Callable[[], Awaitable[None]]] = []
+        self._commit_hooks: list[Callable[[], Awaitable[None]]] = []
 
     async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
         self.session = self._session_factory()
@@ -29,13 +44,45 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
             raise RuntimeError("Session was not initialized.")
 
         try:
-            if exc:
+            if exc or self.read_only:
                 await self.session.rollback()
             else:
+                try:
+                    for hook in self._pre_commit_hooks:
+                        await hook()
+                except BaseException:
+                    await self.session.rollback()
+                    raise
                 await self.session.commit()
+                await self._run_commit_hooks()
         finally:
+            self._pre_commit_hooks.clear()
+            self._commit_hooks.clear()
             await self.session.close()
 
+    def add_pre_commit_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """
+        Register a coroutine function to run in the transaction right before
+        it commits, e.g. to write batched rows. Hooks are discarded on rollback.
+        """
+        self._pre_commit_hooks.append(hook)
+
+    def add_commit_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """
+        Register a coroutine function to run after a successful commit.
+        Hooks are discarded on rollback.
+        """
+        self._commit_hooks.append(hook)
+
+    async def _run_commit_hooks(self) -> None:
+        # The transaction is already committed: a failing hook is logged rather
+        # than reported as a failed unit of work.
+        for hook in self._commit_hooks:
+            try:
+                await hook()
+            except Exception:
+                logger.exception("Commit hook %r failed", hook)
+
     def get_session_wrapped_repo(self, repo_class: type[Repository]) -> Repository:
         """
         Return a repository instance bound to the current session.
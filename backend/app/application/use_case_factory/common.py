@@ -1,11 +1,33 @@
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.domain.abc.cache import Cache
 
 
 @dataclass(frozen=True)
 class ServiceSpec:
     """
     Specification for a service and its associated repository.
+
+    `read_repo_class` is an optional read-only repository used instead of
+    `repo_class` by use cases declared with `read_only = True`.
+    `cache` is passed to the service as its `cache` argument when set, and
+    `dependencies` as further keyword arguments.
     """
 
     service_class: type
     repo_class: type
+    read_repo_class: type | None = None
+    cache: Cache | None = None
+    dependencies: Mapping[str, Any] = field(default_factory=dict)
+
+    def get_repo_class(self, read_only: bool = False) -> type:
+        if read_only and self.read_repo_class is not None:
+            return self.read_repo_class
+        return self.repo_class
+
+    def create_service(self, repo: Any) -> Any:
+        if self.cache is not None:
+            return self.service_class(repo, cache=self.cache, **self.dependencies)
+        return self.service_class(repo, **self.dependencies)
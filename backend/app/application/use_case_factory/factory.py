@@ -5,7 +5,6 @@ from typing import Any, Generic, TypeVar
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 
-from app.application.abc.uow import UnitOfWork
 from app.application.abc.use_case import UseCase
 from app.application.uow.sqlalchemy_uow import SQLAlchemyUnitOfWork
 from app.domain.abc.repository import Repository
@@ -14,6 +13,9 @@ from .common import ServiceSpec
 
 T = TypeVar("T")
 
+# (service argument name, spec, repository class to wrap)
+ServicePlan = tuple[tuple[str, ServiceSpec, type], ...]
+
 
 class UseCaseFactory(Generic[T]):  # noqa
     """
@@ -24,11 +26,19 @@ class UseCaseFactory(Generic[T]):  # noqa
     database session. This guarantees that commit and rollback occur at the
     UseCase level rather than per-service.
 
+    The mapping from use case arguments to services is resolved once and
+    cached. The factory itself holds no per-request state: each call returns a
+    new `UseCaseContext` with its own Unit of Work, so a single factory can be
+    shared by concurrent requests.
+
+    Read-only use cases get a read-only Unit of Work on `read_session_factory`
+    (e.g. a replica), falling back to `session_factory` when it is not set.
+
     Usage:
         >>> MyFactory = UseCaseFactory.register_services(SERVICE_REGISTRY)
         >>>
         >>> # Create and use a use case instance inside an async context
-        >>> async with MyFactory(MyUseCase, session_factory) as use_case:
+        >>> async with MyFactory(MyUseCase, session_factory)() as use_case:
         ...     await use_case.execute()
     """
 
@@ -38,12 +48,14 @@ class UseCaseFactory(Generic[T]):  # noqa
         self,
         uc_class: type[T],
         session_factory: sessionmaker,
+        read_session_factory: sessionmaker | None = None,
     ):
         self._uc_class = uc_class
-        self._uc_services: dict[str, ServiceSpec] = {}
-
-        self._uow: UnitOfWork | None = None
+        self._plan: ServicePlan | None = None
         self._session_factory: Callable[[], AsyncSession] | None = session_factory
+        self._read_session_factory: Callable[[], AsyncSession] | None = (
+            read_session_factory
+        )
 
     @classmethod
     def register_services(
@@ -61,23 +73,24 @@ class UseCaseFactory(Generic[T]):  # noqa
         new_cls._registred_services = registry_services
         return new_cls
 
-    def __call__(self):
-        """Prepare internal service mapping for the use case."""
-        self._setup_uc_services()
-        return self
+    def __call__(self) -> "UseCaseContext[T]":
+        """Return a fresh, per-request context for the use case."""
+        return UseCaseContext(self, self.prepare())
 
-    async def __aenter__(self) -> T:
-        """Enter async context: initialize the Unit of Work and inject services."""
-        if self._session_factory is None:
-            raise RuntimeError("Session factory is not provided.")
-
-        self._uow = SQLAlchemyUnitOfWork(self._session_factory)
-        await self._uow.__aenter__()
+    def prepare(self) -> ServicePlan:
+        """
+        Resolve the services the use case needs from the registry.
+        Done on first use (or eagerly at registration) and cached afterwards.
+        """
+        if self._plan is None:
+            self._plan = self._build_plan()
+        return self._plan
 
-        uc_services = await self._get_resolved_uc_services()
-        return self._uc_class(**uc_services)
+    @property
+    def read_only(self) -> bool:
+        return getattr(self._uc_class, "read_only", False)
 
-    def _setup_uc_services(self) -> None:
+    def _build_plan(self) -> ServicePlan:
         """
         Inspect the UseCase constructor and map required services from the registry.
         """
@@ -86,36 +99,19 @@ class UseCaseFactory(Generic[T]):  # noqa
                 "Service registry is not set. Call 'register_services' first."
             )
 
-        for service in self._get_use_case_services():
+        read_only = self.read_only
+
+        plan = []
+        for name in sorted(self._get_use_case_services()):
             try:
-                self._uc_services[service] = self._registred_services[service]
+                spec = self._registred_services[name]
             except KeyError as e:
                 raise RuntimeError(
-                    f"Class service not found in the registry for `{service}`."
+                    f"Class service not found in the registry for `{name}`."
                 ) from e
+            plan.append((name, spec, spec.get_repo_class(read_only)))
 
-    async def __aexit__(self, exc_type, exc, tb):
-        await self._uow.__aexit__(exc_type, exc, tb)
-
-    async def _get_resolved_uc_services(self) -> dict[str, Any]:
-        """
-        Instantiate service classes with their corresponding repository from the
-        Unit of Work.
-        """
-        if self._uow is None:
-            raise RuntimeError("Unit of Work is not initialized.")
-
-        uc_services = {}
-
-        for name, spec in self._uc_services.items():
-            repo: Repository = self._uow.get_session_wrapped_repo(spec.repo_class)
-            if not hasattr(repo, "session"):
-                raise RuntimeError(
-                    f"Repository for service {name} does not have a session attribute."
-                )
-            uc_services[name] = spec.service_class(repo)
-
-        return uc_services
+        return tuple(plan)
 
     def _get_use_case_services(self) -> set[str]:
         """Inspect the use case constructor to determine required services."""
@@ -134,15 +130,101 @@ class UseCaseFactory(Generic[T]):  # noqa
         return set(req_services)
 
 
+class UseCaseContext(Generic[T]):  # noqa
+    """
+    Per-request async context created by `UseCaseFactory.__call__`.
+
+    Entering opens a Unit of Work and builds the use case with its services;
+    exiting commits or rolls back that Unit of Work.
+    """
+
+    __slots__ = ("_factory", "_plan", "uow")
+
+    def __init__(self, factory: UseCaseFactory[T], plan: ServicePlan) -> None:
+        self._factory = factory
+        self._plan = plan
+        self.uow: SQLAlchemyUnitOfWork | None = None
+
+    async def __aenter__(self) -> T:
+        """Enter async context: initialize the Unit of Work and inject services."""
+        factory = self._factory
+        read_only = factory.read_only
+        session_factory = factory._session_factory
+        if read_only and factory._read_session_factory is not None:
+            session_factory = factory._read_session_factory
+        if session_factory is None:
+            raise RuntimeError("Session factory is not provided.")
+
+        self.uow = SQLAlchemyUnitOfWork(session_factory, read_only=read_only)
+        await self.uow.__aenter__()
+
+        try:
+            uc_services = self._get_resolved_uc_services(self.uow)
+        except BaseException as e:
+            await self.uow.__aexit__(type(e), e, e.__traceback__)
+            raise
+
+        return self._factory._uc_class(**uc_services)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.uow is None:
+            raise RuntimeError("Unit of Work is not initialized.")
+        await self.uow.__aexit__(exc_type, exc, tb)
+
+    def get_service(self, name: str) -> Any:
+        """
+        Build a registered service on this context's Unit of Work, for writes
+        that must commit or roll back together with the use case.
+        """
+        if self.uow is None:
+            raise RuntimeError("Unit of Work is not initialized.")
+        try:
+            spec = self._factory._registred_services[name]
+        except KeyError as e:
+            raise RuntimeError(
+                f"Class service not found in the registry for `{name}`."
+            ) from e
+        repo_class = spec.get_repo_class(self._factory.read_only)
+        return self._create_service(self.uow, name, spec, repo_class)
+
+    def _get_resolved_uc_services(self, uow: SQLAlchemyUnitOfWork) -> dict[str, Any]:
+        """
+        Instantiate service classes with their corresponding repository from the
+        Unit of Work.
+        """
+        return {
+            name: self._create_service(uow, name, spec, repo_class)
+            for name, spec, repo_class in self._plan
+        }
+
+    @staticmethod
+    def _create_service(
+        uow: SQLAlchemyUnitOfWork, name: str, spec: ServiceSpec, repo_class: type
+    ) -> Any:
+        repo: Repository = uow.get_session_wrapped_repo(repo_class)
+        if not hasattr(repo, "session"):
+            raise RuntimeError(
+                f"Repository for service {name} does not have a session attribute."
+            )
+        service = spec.create_service(repo)
+        uow.add_pre_commit_hook(service.before_commit)
+        uow.add_commit_hook(service.on_commit)
+        return service
+
+
 def make_use_case_factory(
     uc_factory_cls: type[UseCaseFactory],
     use_case_cls: type[UseCase],
     session_factory: Callable[[], AsyncSession],
+    read_session_factory: Callable[[], AsyncSession] | None = None,
 ) -> UseCaseFactory:
     """
     Create a UseCaseFactory instance for the given use case class.
 
     This function helps instantiate a UseCaseFactory while preserving
-    type information for type checkers and IDEs.
+    type information for type checkers and IDEs. The service plan is resolved
+    here, so wiring errors surface at registration rather than on first request.
     """
-    return uc_factory_cls(use_case_cls, session_factory)
+    factory = uc_factory_cls(use_case_cls, session_factory, read_session_factory)
+    factory.prepare()
+    return factory
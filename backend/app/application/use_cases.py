@@ -1,19 +1,128 @@
+import secrets
+
 from app.application.abc.use_case import UseCase
 from app.application.entities.events import use_cases as events_uc
+from app.application.entities.outbox import use_cases as outbox_uc
+from app.application.entities.tickets import use_cases as tickets_uc
 from app.application.use_case_factory.common import ServiceSpec
 from app.application.use_case_factory.factory import (
     UseCaseFactory,
     make_use_case_factory,
 )
+from app.application.waiting_room import WaitingRoom
+from app.application.workers.hold_sweeper import HoldSweeper
+from app.application.workers.outbox_dispatcher import OutboxDispatcher
+from app.core.config import settings
 from app.domain.entities.events.services import EventService
+from app.domain.entities.idempotency.services import IdempotencyService
+from app.domain.entities.outbox.services import OutboxService
+from app.domain.entities.tickets.services import (
+    HoldService,
+    PricingService,
+    ReservationService,
+    TicketTypeService,
+)
+from app.infrastructure.cache.memory_cache import InMemoryCache
 from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventReadRepository,
     SqlAlchemyEventRepository,
 )
-from app.infrastructure.db.session import AsyncSessionLocal
+from app.infrastructure.db.repositories.sqlalchemy.idempotency_repo import (
+    SqlAlchemyIdempotencyRepository,
+)
+from app.infrastructure.db.repositories.sqlalchemy.outbox_repo import (
+    SqlAlchemyOutboxRepository,
+)
+from app.infrastructure.db.repositories.sqlalchemy.ticket_repo import (
+    SqlAlchemyHoldRepository,
+    SqlAlchemyReservationRepository,
+    SqlAlchemyTicketTypeRepository,
+)
+from app.infrastructure.db.session import AsyncReadSessionLocal, AsyncSessionLocal
+from app.infrastructure.search.memory_index import InMemorySearchIndex
+from app.infrastructure.waiting_room.memory_queue import InMemoryAdmissionQueue
+
+event_cache = (
+    InMemoryCache(
+        max_size=settings.EVENT_CACHE_MAX_SIZE,
+        ttl=settings.EVENT_CACHE_TTL_SECONDS,
+    )
+    if settings.EVENT_CACHE_ENABLED
+    else None
+)
+
+# A separate cache, far larger and longer-lived than the event cache: a
+# version evicted while a stale read is in flight would let that read be cached
+event_version_cache = (
+    InMemoryCache(
+        max_size=settings.EVENT_VERSION_CACHE_MAX_SIZE,
+        ttl=settings.EVENT_VERSION_CACHE_TTL_SECONDS,
+    )
+    if settings.EVENT_CACHE_ENABLED
+    else None
+)
+
+waiting_room = WaitingRoom(
+    InMemoryAdmissionQueue(),
+    secret=(settings.WAITING_ROOM_SECRET.encode() or secrets.token_bytes(32)),
+    rate=settings.WAITING_ROOM_RATE_PER_SECOND,
+    burst=settings.WAITING_ROOM_BURST,
+    token_ttl=settings.WAITING_ROOM_TOKEN_TTL_SECONDS,
+)
+
+# Ticket type attributes that never change (owning event, shard count once
+# sharded), so they can be cached for long
+ticket_type_cache = InMemoryCache(max_size=10_000, ttl=3600)
+
+# Prices are recomputed once older than the policy allows, whether or not they
+# were updated incrementally since
+price_cache = InMemoryCache(
+    max_size=settings.PRICING_CACHE_MAX_EVENTS,
+    ttl=PricingService.policy.max_age_seconds,
+)
+
+# Event search for databases without full-text search of their own (SQLite);
+# unused on PostgreSQL. Field weights rank title matches above the others.
+search_index = InMemorySearchIndex(
+    weights={"title": 10, "event_type": 4, "venue": 4, "description": 2}
+)
+
+idempotency_cache = InMemoryCache(
+    max_size=settings.IDEMPOTENCY_CACHE_MAX_SIZE,
+    ttl=settings.IDEMPOTENCY_KEY_TTL_SECONDS,
+)
 
 # Store all services here
 SERVICE_REGISTRY = {
-    "event_service": ServiceSpec(EventService, SqlAlchemyEventRepository),
+    "event_service": ServiceSpec(
+        EventService,
+        SqlAlchemyEventRepository,
+        read_repo_class=SqlAlchemyEventReadRepository,
+        cache=event_cache,
+        dependencies={
+            "search_index": search_index,
+            "version_cache": event_version_cache,
+        },
+    ),
+    "ticket_type_service": ServiceSpec(
+        TicketTypeService,
+        SqlAlchemyTicketTypeRepository,
+        cache=ticket_type_cache,
+    ),
+    "reservation_service": ServiceSpec(
+        ReservationService, SqlAlchemyReservationRepository
+    ),
+    "hold_service": ServiceSpec(HoldService, SqlAlchemyHoldRepository),
+    "outbox_service": ServiceSpec(OutboxService, SqlAlchemyOutboxRepository),
+    "pricing_service": ServiceSpec(
+        PricingService, SqlAlchemyTicketTypeRepository, cache=price_cache
+    ),
+    # Not injected into use cases: used through `UseCaseContext.get_service`
+    "idempotency_service": ServiceSpec(
+        IdempotencyService,
+        SqlAlchemyIdempotencyRepository,
+        cache=idempotency_cache,
+    ),
 }
 _UseCaseFactory = UseCaseFactory.register_services(SERVICE_REGISTRY)
 
@@ -21,16 +130,71 @@ _UseCaseFactory = UseCaseFactory.register_services(SERVICE_REGISTRY)
 def _make_use_case(use_case_cls: type[UseCase]) -> UseCaseFactory:
     """
     Creates a UseCase instance using the provided UseCase class,
-    binding it to the appropriate factory and session.
+    binding it to the appropriate factory and session. Read-only use cases
+    are routed to the read replica session.
     """
     if not issubclass(use_case_cls, UseCase):
         raise TypeError(f"{use_case_cls.__name__} must be a subclass of UseCase.")
 
-    return make_use_case_factory(_UseCaseFactory, use_case_cls, AsyncSessionLocal)
+    return make_use_case_factory(
+        _UseCaseFactory, use_case_cls, AsyncSessionLocal, AsyncReadSessionLocal
+    )
 
 
 class EventUseCases:
     create_event = _make_use_case(events_uc.CreateEventUseCase)
+    bulk_create_events = _make_use_case(events_uc.BulkCreateEventsUseCase)
     get_event = _make_use_case(events_uc.GetEventUseCase)
     list_events = _make_use_case(events_uc.ListEventsUseCase)
+    search_events = _make_use_case(events_uc.SearchEventsUseCase)
+    rebuild_search_index = _make_use_case(events_uc.RebuildSearchIndexUseCase)
+    export_events = _make_use_case(events_uc.ExportEventsUseCase)
     update_event = _make_use_case(events_uc.UpdateEventUseCase)
+
+
+class TicketUseCases:
+    create_ticket_type = _make_use_case(tickets_uc.CreateTicketTypeUseCase)
+    list_ticket_types = _make_use_case(tickets_uc.ListTicketTypesUseCase)
+    get_ticket_type = _make_use_case(tickets_uc.GetTicketTypeUseCase)
+    shard_ticket_type = _make_use_case(tickets_uc.ShardTicketTypeUseCase)
+    rebalance_ticket_type_shards = _make_use_case(
+        tickets_uc.RebalanceTicketTypeShardsUseCase
+    )
+    get_event_prices = _make_use_case(tickets_uc.GetEventPricesUseCase)
+    reprice_events = _make_use_case(tickets_uc.RepriceEventsUseCase)
+    reserve_tickets = _make_use_case(tickets_uc.ReserveTicketsUseCase)
+    get_reservation = _make_use_case(tickets_uc.GetReservationUseCase)
+    cancel_reservation = _make_use_case(tickets_uc.CancelReservationUseCase)
+    hold_tickets = _make_use_case(tickets_uc.HoldTicketsUseCase)
+    get_hold = _make_use_case(tickets_uc.GetHoldUseCase)
+    confirm_hold = _make_use_case(tickets_uc.ConfirmHoldUseCase)
+    release_hold = _make_use_case(tickets_uc.ReleaseHoldUseCase)
+    expire_holds = _make_use_case(tickets_uc.ExpireHoldsUseCase)
+
+
+class OutboxUseCases:
+    claim_messages = _make_use_case(outbox_uc.ClaimOutboxMessagesUseCase)
+    settle_messages = _make_use_case(outbox_uc.SettleOutboxMessagesUseCase)
+    get_backlog = _make_use_case(outbox_uc.GetOutboxBacklogUseCase)
+
+
+hold_sweeper = HoldSweeper(
+    TicketUseCases.expire_holds,
+    batch_size=settings.HOLD_SWEEPER_BATCH_SIZE,
+    interval=settings.HOLD_SWEEPER_INTERVAL_SECONDS,
+)
+
+# Handlers are registered with `outbox_dispatcher.register`, e.g. those of
+# `app.application.payments.payment_handlers` once a payment provider is set up
+outbox_dispatcher = OutboxDispatcher(
+    OutboxUseCases.claim_messages,
+    OutboxUseCases.settle_messages,
+    OutboxUseCases.get_backlog,
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+    concurrency=settings.OUTBOX_CONCURRENCY,
+    handler_timeout=settings.OUTBOX_HANDLER_TIMEOUT_SECONDS,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    retry_base=settings.OUTBOX_RETRY_BASE_SECONDS,
+    retry_max=settings.OUTBOX_RETRY_MAX_SECONDS,
+)
@@ -0,0 +1,211 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.application.http_exceptions import (
+    ForbiddenException,
+    TooManyRequestsException,
+)
+from app.domain.abc.admission_queue import AdmissionQueue
+
+
+@dataclass(frozen=True, slots=True)
+class QueueConfig:
+    rate: float
+    burst: int
+
+
+@dataclass(frozen=True, slots=True)
+class QueueStatus:
+    event_id: int
+    # Admissions still needed before this client is let in; 0 once admitted
+    position: int
+    eta_seconds: float
+
+    @property
+    def admitted(self) -> bool:
+        return self.position == 0
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class WaitingRoom:
+    """
+    Virtual waiting room in front of the purchase routes.
+
+    Joining an event's queue hands out a signed token carrying the client's
+    place in line. Places are admitted in order at the event's configured rate
+    (with `burst` admissions banked while the queue is quiet). Checking a
+    token needs only the signature and the queue counters, never the database.
+
+    An admitted token is good for one purchase: `admit` claims its place and
+    `release` gives it back when the purchase fails, so a token can be neither
+    replayed nor shared to get more purchases through than the rate allows.
+    A place claimed with an `owner` (an idempotency key) stays bound to it, so
+    retries of that one purchase are let through again.
+
+    Usage:
+        >>> room = WaitingRoom(InMemoryAdmissionQueue(), secret=b"...", rate=50)
+        >>> token, status = await room.join(event_id)
+        >>> status = await room.admit(token)  # raises 429 until admitted
+        >>> await room.release(token)  # the purchase failed
+    """
+
+    def __init__(
+        self,
+        queue: AdmissionQueue,
+        *,
+        secret: bytes,
+        rate: float,
+        burst: int = 0,
+        token_ttl: float = 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("`rate` must be positive.")
+
+        self._queue = queue
+        self._secret = secret
+        self._default = QueueConfig(rate=rate, burst=burst)
+        self._configs: dict[int, QueueConfig] = {}
+        self.token_ttl = token_ttl
+        self._clock = clock
+
+        self.joined = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.invalid_tokens = 0
+        self.reused_tokens = 0
+
+    def configure(self, event_id: int, *, rate: float, burst: int) -> QueueConfig:
+        """Override the admission rate for one event."""
+        if rate <= 0:
+            raise ValueError("`rate` must be positive.")
+        config = self._configs[event_id] = QueueConfig(rate=rate, burst=burst)
+        return config
+
+    def get_config(self, event_id: int) -> QueueConfig:
+        return self._configs.get(event_id, self._default)
+
+    async def join(self, event_id: int) -> tuple[str, QueueStatus]:
+        """Put a client in the event's queue; returns its token and status."""
+        now = self._clock()
+        config = self.get_config(event_id)
+        position = await self._queue.join(
+            f"event:{event_id}", rate=config.rate, burst=config.burst, now=now
+        )
+        self.joined += 1
+        token = self._encode_token(event_id, position, now)
+        return token, await self._status(event_id, position, now)
+
+    async def status(self, token: str | None) -> QueueStatus:
+        """Return the status of a token. Raises 403 when it is not valid."""
+        event_id, position, _ = self._decode_token(token)
+        return await self._status(event_id, position, self._clock())
+
+    async def admit(
+        self, token: str | None, *, owner: str | None = None
+    ) -> QueueStatus:
+        """
+        Let an admitted token through, once. Raises 403 when the token is not
+        valid or was already used and 429, with a Retry-After, while it is still
+        waiting.
+        """
+        event_id, position, issued_at = self._decode_token(token)
+        now = self._clock()
+        status = await self._status(event_id, position, now)
+        if not status.admitted:
+            self.rejected += 1
+            raise TooManyRequestsException(
+                {
+                    "message": "Waiting for admission.",
+                    "position": status.position,
+                    "eta_seconds": status.eta_seconds,
+                },
+                retry_after=max(math.ceil(status.eta_seconds), 1),
+            )
+        claimed = await self._queue.claim(
+            f"event:{event_id}",
+            position,
+            owner,
+            # Past this the token is refused anyway, so the claim can go
+            expires_at=issued_at + self.token_ttl,
+            now=now,
+        )
+        if not claimed:
+            self.reused_tokens += 1
+            raise ForbiddenException("Queue token has already been used.")
+        self.admitted += 1
+        return status
+
+    async def release(self, token: str | None) -> None:
+        """Give back the place claimed by `admit`, e.g. when the purchase failed."""
+        event_id, position, _ = self._decode_token(token)
+        await self._queue.release(f"event:{event_id}", position)
+        self.admitted -= 1
+
+    async def _status(self, event_id: int, position: int, now: float) -> QueueStatus:
+        config = self.get_config(event_id)
+        admitted = await self._queue.admitted(
+            f"event:{event_id}", rate=config.rate, burst=config.burst, now=now
+        )
+        waiting = position - admitted
+        if waiting <= 0:
+            return QueueStatus(event_id=event_id, position=0, eta_seconds=0.0)
+        return QueueStatus(
+            event_id=event_id,
+            position=math.ceil(waiting),
+            # Rounded up, so polling at the ETA never comes back too early
+            eta_seconds=math.ceil(waiting / config.rate * 1000) / 1000,
+        )
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()
+
+    def _encode_token(self, event_id: int, position: int, issued_at: float) -> str:
+        payload = json.dumps([event_id, position, int(issued_at)]).encode()
+        return f"{_b64encode(payload)}.{_b64encode(self._sign(payload))}"
+
+    def _decode_token(self, token: str | None) -> tuple[int, int, float]:
+        try:
+            if not token:
+                raise ValueError("missing token")
+            payload_part, signature_part = token.split(".")
+            payload = _b64decode(payload_part)
+            if not hmac.compare_digest(self._sign(payload), _b64decode(signature_part)):
+                raise ValueError("bad signature")
+            event_id, position, issued_at = json.loads(payload)
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            self.invalid_tokens += 1
+            raise ForbiddenException("A valid queue token is required.") from e
+
+        if issued_at + self.token_ttl < self._clock():
+            self.invalid_tokens += 1
+            raise ForbiddenException("Queue token has expired.")
+        return event_id, position, issued_at
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "rate_per_second": self._default.rate,
+            "burst": self._default.burst,
+            "configured_events": len(self._configs),
+            "joined": self.joined,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "invalid_tokens": self.invalid_tokens,
+            "reused_tokens": self.reused_tokens,
+            **self._queue.stats(),
+        }
@@ -0,0 +1,123 @@
+import asyncio
+import time
+from contextlib import suppress
+from datetime import UTC, datetime
+from typing import Any
+
+from app.application.use_case_factory.factory import UseCaseFactory
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class HoldSweeper:
+    """
+    Background task that returns expired ticket holds to inventory.
+
+    Every `interval` seconds it runs the `ExpireHoldsUseCase` in batches of at
+    most `batch_size` holds, each batch in its own short transaction, until a
+    batch comes back short. Nothing is cleaned up on the request path.
+
+    Lag is how long the oldest hold of a sweep had been expired when it was
+    released; a growing lag means the sweeper is falling behind.
+
+    Usage:
+        >>> sweeper = HoldSweeper(TicketUseCases.expire_holds, batch_size=500)
+        >>> sweeper.start()
+        >>> ...
+        >>> await sweeper.stop()
+    """
+
+    def __init__(
+        self,
+        expire_holds: UseCaseFactory,
+        *,
+        batch_size: int,
+        interval: float,
+    ) -> None:
+        self._expire_holds = expire_holds
+        self.batch_size = batch_size
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+        self._runs = 0
+        self._batches = 0
+        self._errors = 0
+        self._holds_released = 0
+        self._tickets_released = 0
+        self._last_run_at: datetime | None = None
+        self._last_duration = 0.0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="hold-sweeper")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def sweep(self) -> int:
+        """Release every hold expired by now, batch by batch. Returns the count."""
+        start = time.perf_counter()
+        released = 0
+        lag = 0.0
+        while True:
+            now = datetime.now(UTC)
+            async with self._expire_holds() as use_case:
+                holds = await use_case.execute(self.batch_size, now=now)
+
+            self._batches += 1
+            released += len(holds)
+            self._holds_released += len(holds)
+            self._tickets_released += sum(hold.quantity for hold in holds)
+            if holds:
+                oldest = min(hold.expires_at for hold in holds)
+                lag = max(lag, (now - oldest).total_seconds())
+
+            if len(holds) < self.batch_size:
+                break
+            # Let request handlers in between batches
+            await asyncio.sleep(0)
+
+        self._runs += 1
+        self._last_run_at = datetime.now(UTC)
+        self._last_duration = time.perf_counter() - start
+        self._last_lag = lag
+        self._max_lag = max(self._max_lag, lag)
+        return released
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                self._errors += 1
+                logger.exception("Hold sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "batch_size": self.batch_size,
+            "interval_seconds": self.interval,
+            "runs": self._runs,
+            "batches": self._batches,
+            "errors": self._errors,
+            "holds_released": self._holds_released,
+            "tickets_released": self._tickets_released,
+            "last_run_at": self._last_run_at,
+            "last_duration_ms": round(self._last_duration * 1000, 3),
+            "last_lag_seconds": round(self._last_lag, 3),
+            "max_lag_seconds": round(self._max_lag, 3),
+        }
@@ -0,0 +1,212 @@
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.application.use_case_factory.factory import UseCaseFactory
+from app.core.logging import get_logger
+from app.domain.entities.outbox.entities import OutboxMessage
+
+logger = get_logger(__name__)
+
+OutboxHandler = Callable[[OutboxMessage], Awaitable[None]]
+
+
+class OutboxDispatcher:
+    """
+    Background task that delivers outbox messages to their topic's handler.
+
+    Every `interval` seconds it claims due messages in batches of at most
+    `batch_size`, each claim in its own short transaction, and delivers a
+    batch with up to `concurrency` handlers running at once, outside any
+    transaction. The outcome of the batch is then recorded in one more
+    transaction: delivered messages are deleted and failed ones are retried
+    with exponential backoff (with jitter) until `max_attempts`, after which
+    they are marked dead.
+
+    Delivery is at least once: a claim lasts long enough for the whole batch
+    to time out, after which the messages of a dispatcher that died are
+    claimed again. Handlers must be idempotent.
+
+    Only topics with a registered handler are claimed; messages of other
+    topics wait in the backlog.
+
+    Usage:
+        >>> dispatcher = OutboxDispatcher(claim, settle, backlog, batch_size=100)
+        >>> dispatcher.register("reservation.created", charge)
+        >>> dispatcher.start()
+        >>> ...
+        >>> await dispatcher.stop()
+    """
+
+    def __init__(
+        self,
+        claim_messages: UseCaseFactory,
+        settle_messages: UseCaseFactory,
+        get_backlog: UseCaseFactory,
+        *,
+        batch_size: int,
+        interval: float,
+        concurrency: int,
+        handler_timeout: float,
+        max_attempts: int,
+        retry_base: float,
+        retry_max: float,
+    ) -> None:
+        self._claim_messages = claim_messages
+        self._settle_messages = settle_messages
+        self._get_backlog = get_backlog
+        self.batch_size = batch_size
+        self.interval = interval
+        self.concurrency = concurrency
+        self.handler_timeout = handler_timeout
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self._handlers: dict[str, OutboxHandler] = {}
+        self._task: asyncio.Task | None = None
+
+        self._runs = 0
+        self._batches = 0
+        self._errors = 0
+        self._delivered = 0
+        self._retried = 0
+        self._dead = 0
+        self._last_run_at: datetime | None = None
+        self._last_duration = 0.0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def claim_duration(self) -> float:
+        """How long claimed messages are reserved: a batch's worst case."""
+        rounds = math.ceil(self.batch_size / self.concurrency)
+        return self.handler_timeout * (rounds + 1)
+
+    def register(self, topic: str, handler: OutboxHandler) -> None:
+        self._handlers[topic] = handler
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="outbox-dispatcher")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def dispatch(self) -> int:
+        """Deliver every message due by now, batch by batch. Returns the count."""
+        start = time.perf_counter()
+        delivered = 0
+        lag = 0.0
+        while True:
+            now = datetime.now(UTC)
+            async with self._claim_messages() as use_case:
+                messages = await use_case.execute(
+                    list(self._handlers),
+                    now=now,
+                    claimed_until=now + timedelta(seconds=self.claim_duration),
+                    limit=self.batch_size,
+                )
+            if messages:
+                delivered += await self._deliver_batch(messages)
+                oldest = min(message.created_at for message in messages)
+                lag = max(lag, (now - oldest).total_seconds())
+
+            self._batches += 1
+            if len(messages) < self.batch_size:
+                break
+            # Let request handlers in between batches
+            await asyncio.sleep(0)
+
+        self._runs += 1
+        self._last_run_at = datetime.now(UTC)
+        self._last_duration = time.perf_counter() - start
+        self._last_lag = lag
+        self._max_lag = max(self._max_lag, lag)
+        return delivered
+
+    async def backlog(self) -> dict[str, Any]:
+        """Pending and dead message counts, from the database."""
+        async with self._get_backlog() as use_case:
+            return await use_case.execute(datetime.now(UTC))
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next attempt, after `attempts` failed ones."""
+        delay = min(self.retry_max, self.retry_base * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _deliver_batch(self, messages: list[OutboxMessage]) -> int:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def deliver(message: OutboxMessage) -> str | None:
+            async with semaphore:
+                try:
+                    async with asyncio.timeout(self.handler_timeout):
+                        await self._handlers[message.topic](message)
+                except Exception as e:
+                    logger.warning("Delivery of %r failed: %r", message, e)
+                    return repr(e)
+                return None
+
+        errors = await asyncio.gather(*(deliver(message) for message in messages))
+
+        now = datetime.now(UTC)
+        delivered, retries, dead = [], [], []
+        for message, error in zip(messages, errors, strict=True):
+            if error is None:
+                delivered.append(message.id)
+            elif message.attempts >= self.max_attempts:
+                dead.append((message.id, error))
+            else:
+                retry_at = now + timedelta(seconds=self.retry_delay(message.attempts))
+                retries.append((message.id, retry_at, error))
+
+        async with self._settle_messages() as use_case:
+            await use_case.execute(delivered, retries, dead)
+
+        self._delivered += len(delivered)
+        self._retried += len(retries)
+        self._dead += len(dead)
+        return len(delivered)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.dispatch()
+            except Exception:
+                self._errors += 1
+                logger.exception("Outbox dispatch failed")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "topics": sorted(self._handlers),
+            "batch_size": self.batch_size,
+            "interval_seconds": self.interval,
+            "concurrency": self.concurrency,
+            "runs": self._runs,
+            "batches": self._batches,
+            "errors": self._errors,
+            "delivered": self._delivered,
+            "retried": self._retried,
+            "dead": self._dead,
+            "last_run_at": self._last_run_at,
+            "last_duration_ms": round(self._last_duration * 1000, 3),
+            "last_lag_seconds": round(self._last_lag, 3),
+            "max_lag_seconds": round(self._max_lag, 3),
+        }
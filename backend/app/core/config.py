@@ -65,8 +65,95 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    # Read replica for read-only use cases; unset routes reads to the primary.
+    # Credentials and database name are shared with the primary.
+    POSTGRES_REPLICA_SERVER: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def REPLICA_DATABASE_URI(self) -> PostgresDsn | None:
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        return PostgresDsn.build(
+            scheme="postgresql+asyncpg",
+            username=self.POSTGRES_USER,
+            password=self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_REPLICA_SERVER,
+            port=self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT,
+            path=self.POSTGRES_DB,
+        )
+
     DATABASE_ECHO: bool = False
 
+    # Connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    # Seconds before a connection is replaced; -1 disables recycling
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # asyncpg prepared statements cached per connection; 0 disables the cache
+    # (required behind PgBouncer in transaction pooling mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # Events
+    EVENTS_EXPORT_BATCH_SIZE: int = 1000
+    EVENT_CACHE_ENABLED: bool = True
+    EVENT_CACHE_MAX_SIZE: int = 10_000
+    EVENT_CACHE_TTL_SECONDS: float = 30.0
+    # Versions of updated events, which keep reads that raced an update out of
+    # the event cache. They must outlive the slowest such read.
+    EVENT_VERSION_CACHE_MAX_SIZE: int = 100_000
+    EVENT_VERSION_CACHE_TTL_SECONDS: float = 600.0
+    # Without PostgreSQL full-text search, events are searched through an
+    # in-process index built at startup in batches of this size
+    SEARCH_INDEX_REBUILD_BATCH_SIZE: int = 5000
+
+    # Idempotency-Key support on write routes: stored responses are replayed
+    # for this long, and the most recent ones are also kept in memory
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = 86_400
+    IDEMPOTENCY_CACHE_MAX_SIZE: int = 10_000
+
+    # Tickets
+    TICKET_HOLD_TTL_SECONDS: int = 600
+    # Rebalance sharded inventory when stock is only left spread over shards
+    TICKET_SHARD_AUTO_REBALANCE: bool = True
+    # Dynamic prices are cached per event for the pricing policy's max age
+    PRICING_CACHE_MAX_EVENTS: int = 10_000
+    # Transactional outbox: messages are claimed in batches and delivered with
+    # up to OUTBOX_CONCURRENCY handlers at once, retried with exponential
+    # backoff and marked dead after OUTBOX_MAX_ATTEMPTS
+    OUTBOX_DISPATCHER_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_CONCURRENCY: int = 10
+    OUTBOX_HANDLER_TIMEOUT_SECONDS: float = 30.0
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETRY_BASE_SECONDS: float = 1.0
+    OUTBOX_RETRY_MAX_SECONDS: float = 600.0
+    # Background release of expired holds
+    HOLD_SWEEPER_ENABLED: bool = True
+    HOLD_SWEEPER_BATCH_SIZE: int = 500
+    HOLD_SWEEPER_INTERVAL_SECONDS: float = 5.0
+    # How long the sweeper keeps expired holds, so that a late confirmation is
+    # told the hold expired rather than that it does not exist
+    HOLD_RETENTION_SECONDS: int = 3600
+
+    # Waiting room in front of the purchase routes (reservations and holds)
+    WAITING_ROOM_ENABLED: bool = False
+    # Signs queue tokens; must be shared by all workers. A random per-process
+    # secret is used when unset.
+    WAITING_ROOM_SECRET: str = ""
+    # Default admissions per second, per event
+    WAITING_ROOM_RATE_PER_SECOND: float = 50.0
+    WAITING_ROOM_BURST: int = 100
+    WAITING_ROOM_TOKEN_TTL_SECONDS: int = 3600
+
+    # Operator endpoints (e.g. waiting room rates) require this key in the
+    # X-Admin-Key header; they are disabled when unset
+    ADMIN_API_KEY: str = ""
+
     # Frontend
     FRONTEND_HOST: str = "http://localhost:5173"
 
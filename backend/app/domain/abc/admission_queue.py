@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class AdmissionQueue(ABC):
+    """
+    Admission queue port backing the waiting room.
+
+    Each queue hands out consecutive positions (1, 2, ...) and admits them in
+    order at `rate` positions per second. Unused admissions accumulate while a
+    queue is quiet, but never to more than `burst` positions ahead of the last
+    one handed out.
+
+    Methods are async so that shared (network) backends can implement the same
+    interface as the in-process one; each call must be atomic per queue.
+    """
+
+    @abstractmethod
+    async def join(self, key: str, *, rate: float, burst: int, now: float) -> int:
+        """Hand out the next position in the queue."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def admitted(self, key: str, *, rate: float, burst: int, now: float) -> float:
+        """Return how many positions are admitted as of `now`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim(
+        self,
+        key: str,
+        position: int,
+        owner: str | None = None,
+        *,
+        expires_at: float,
+        now: float,
+    ) -> bool:
+        """
+        Mark an admitted position as used; False if it already was, unless by
+        the same (non-None) `owner`. The claim may be forgotten after
+        `expires_at`, once the position's token is no longer accepted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(self, key: str, position: int) -> None:
+        """Make a claimed position usable again."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        raise NotImplementedError
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Cache(ABC):
+    """
+    Key-value cache port.
+
+    Methods are async so that shared (network) backends can implement the same
+    interface as the in-process one.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        raise NotImplementedError
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class PaymentProvider(ABC):
+    """
+    Payment gateway port. Calls may be retried after a timeout or a crash, so
+    implementations must treat a repeated `idempotency_key` as the same call.
+    """
+
+    @abstractmethod
+    async def charge(
+        self, *, reference: str, amount_cents: int, idempotency_key: str
+    ) -> str:
+        """Capture `amount_cents` for `reference`; returns the payment's id."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refund(self, *, reference: str, idempotency_key: str) -> None:
+        """Refund what was captured for `reference`, if anything."""
+        raise NotImplementedError
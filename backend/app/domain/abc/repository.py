@@ -18,7 +18,7 @@ class Repository(Generic[T], ABC):  # noqa
         raise NotImplementedError
 
     @abstractmethod
-    async def update(self, id: int, data: dict[str, Any]) -> T:
+    async def update(self, id: int, data: dict[str, Any]) -> T | None:
         raise NotImplementedError
 
     @abstractmethod
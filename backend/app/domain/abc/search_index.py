@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+
+class SearchIndex(ABC):
+    """
+    Full-text index port, for backends without full-text search of their own.
+
+    Documents are a few named text fields. A query matches documents that
+    contain all of its terms; matches are ranked by relevance, best first, and
+    paginated with a `(score, doc_id)` keyset.
+
+    Methods are async so that shared (network) backends can implement the same
+    interface as the in-process one.
+    """
+
+    @abstractmethod
+    async def add(
+        self, doc_id: int, fields: Mapping[str, str], *, version: datetime
+    ) -> None:
+        """
+        Index or re-index a document. A `version` older than the indexed one is
+        ignored, so late writers cannot roll a document back.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(
+        self, query: str, *, after: tuple[float, int] | None, limit: int
+    ) -> list[tuple[int, float]]:
+        """
+        Return up to `limit` `(doc_id, score)` matches ordered by score
+        descending then id, strictly after the `after` position.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        raise NotImplementedError
@@ -53,4 +53,14 @@ class ServiceMeta(ABCMeta):
 class Service(metaclass=ServiceMeta):
     """Base class for all services."""
 
-    ...
+    async def before_commit(self) -> None:
+        """
+        Hook run in the unit of work's transaction, just before it commits.
+        Override to flush writes the service batches up, e.g. outbox messages.
+        """
+
+    async def on_commit(self) -> None:
+        """
+        Hook run after the unit of work the service belongs to has committed.
+        Override to apply side effects that must not happen before the commit.
+        """
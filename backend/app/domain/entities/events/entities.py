@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
+from enum import StrEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     id: int
     title: str
@@ -20,3 +21,47 @@ class Event:
             f"title={self.title!r}, "
             f"event_type={self.event_type!r})"
         )
+
+
+class EventSort(StrEnum):
+    """Orderings of event listings; `-` sorts descending. Ties break on id."""
+
+    START_TIME = "start_time"
+    START_TIME_DESC = "-start_time"
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+
+    @property
+    def field(self) -> str:
+        return self.value.removeprefix("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
+
+
+@dataclass(frozen=True, slots=True)
+class EventFilters:
+    """
+    Criteria of an event listing; unset criteria match every event.
+
+    `starts_from` is inclusive and `starts_before` exclusive. `upcoming`
+    keeps events that have not started yet.
+    """
+
+    event_type: str | None = None
+    venue: str | None = None
+    starts_from: datetime | None = None
+    starts_before: datetime | None = None
+    upcoming: bool = False
+
+    def __bool__(self) -> bool:
+        return any(
+            (
+                self.event_type is not None,
+                self.venue is not None,
+                self.starts_from is not None,
+                self.starts_before is not None,
+                self.upcoming,
+            )
+        )
@@ -1,15 +1,66 @@
-from typing import TypeVar
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
 
 from app.domain.abc.repository import Repository
 
-from .entities import Event
+from .entities import Event, EventFilters, EventSort
 
 T = TypeVar("T")
 
 
 class EventRepository(Repository[Event]):  # noqa
+    async def create_many(self, create_data: list[dict[str, Any]]) -> list[Event]:
+        raise NotImplementedError
+
+    async def get_many(self, event_ids: Sequence[int]) -> list[Event]:
+        raise NotImplementedError
+
+    async def exists(self, event_id: int) -> bool:
+        raise NotImplementedError
+
+    async def get_updated_at(self, event_id: int) -> datetime | None:
+        raise NotImplementedError
+
     async def get_paginated_events(self, *args, **kwargs) -> list[Event]:
         raise NotImplementedError
 
-    async def count(self) -> int:
+    async def get_paginated_events_with_total(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> tuple[list[Event], int]:
+        raise NotImplementedError
+
+    async def estimate_count(self) -> int | None:
+        raise NotImplementedError
+
+    async def get_events_after(
+        self,
+        *,
+        after: tuple[datetime, int] | None,
+        limit: int,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> list[Event]:
+        raise NotImplementedError
+
+    @property
+    def has_full_text_search(self) -> bool:
+        raise NotImplementedError
+
+    async def search(
+        self, query: str, *, after: tuple[float, int] | None, limit: int
+    ) -> list[tuple[Event, float]]:
+        raise NotImplementedError
+
+    def stream_events(
+        self, *, batch_size: int, filters: EventFilters | None = None
+    ) -> AsyncIterator[list[Event]]:
+        raise NotImplementedError
+
+    async def count(self, filters: EventFilters | None = None) -> int:
         raise NotImplementedError
@@ -1,27 +1,226 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from app.api.v1.schemas.events_schema import EventCreateRequest, EventUpdateRequest
+from app.domain.abc.cache import Cache
+from app.domain.abc.search_index import SearchIndex
 from app.domain.abc.service import Service
 
-from .entities import Event
+from .entities import Event, EventFilters, EventSort
 from .repositories import EventRepository
 
 
+def _cache_key(event_id: int) -> str:
+    return f"event:{event_id}"
+
+
+def _version_key(event_id: int) -> str:
+    return f"event_version:{event_id}"
+
+
+def _search_fields(event: Event) -> dict[str, str]:
+    return {
+        "title": event.title,
+        "event_type": event.event_type,
+        "venue": event.venue,
+        "description": event.description,
+    }
+
+
 class EventService(Service):
-    def __init__(self, repo: EventRepository):
+    def __init__(
+        self,
+        repo: EventRepository,
+        cache: Cache | None = None,
+        search_index: SearchIndex | None = None,
+        version_cache: Cache | None = None,
+    ):
         self._repo = repo
+        self._cache = cache
+        # Latest committed `updated_at` of recently updated events, guarding
+        # `cache` against stale fills. Kept apart from `cache` so that evicting
+        # or expiring an entry never takes its guard with it.
+        self._version_cache = version_cache
+        # Only used when the database cannot search events itself
+        self._search_index = search_index if not repo.has_full_text_search else None
+        # Events written in the current unit of work, evicted on commit, with
+        # their new `updated_at`
+        self._updated_events: dict[int, datetime] = {}
+        # Events written in the current unit of work, indexed on commit
+        self._written_events: list[Event] = []
 
     async def create_event(self, data: EventCreateRequest) -> Event:
         create_data = data.model_dump()
-        return await self._repo.create(create_data)
+        event = await self._repo.create(create_data)
+        self._written(event)
+        return event
+
+    async def create_events(self, data: list[EventCreateRequest]) -> list[Event]:
+        create_data = [item.model_dump() for item in data]
+        events = await self._repo.create_many(create_data)
+        for event in events:
+            self._written(event)
+        return events
+
+    def _written(self, event: Event) -> None:
+        if self._search_index is not None:
+            self._written_events.append(event)
+
+    async def search_events(
+        self, query: str, *, after: tuple[float, int] | None, limit: int
+    ) -> list[tuple[Event, float]]:
+        """
+        Events matching `query`, with their relevance, best first. Searched by
+        the database when it can, otherwise by the search index.
+        """
+        if self._search_index is None:
+            return await self._repo.search(query, after=after, limit=limit)
+
+        matches = await self._search_index.search(query, after=after, limit=limit)
+        events = await self._repo.get_many([event_id for event_id, _ in matches])
+        scores = dict(matches)
+        return [(event, scores[event.id]) for event in events]
+
+    async def rebuild_search_index(self, *, batch_size: int) -> int:
+        """
+        Index every stored event, e.g. at startup. Returns how many were
+        indexed; none when the database searches events itself.
+        """
+        if self._search_index is None:
+            return 0
+        indexed = 0
+        async for events in self._repo.stream_events(batch_size=batch_size):
+            for event in events:
+                await self._search_index.add(
+                    event.id, _search_fields(event), version=event.updated_at
+                )
+            indexed += len(events)
+        return indexed
 
     async def get_event_by_id(self, event_id: int) -> Event | None:
-        return await self._repo.get(event_id)
+        if self._cache is None:
+            return await self._repo.get(event_id)
 
-    async def list_events(self, *, offset: int, limit: int) -> tuple[list[Event], int]:
-        events = await self._repo.get_paginated_events(offset=offset, limit=limit)
-        total = await self._repo.count()
-        return events, total
+        key = _cache_key(event_id)
+        event = await self._cache.get(key)
+        if event is None:
+            event = await self._repo.get(event_id)
+            if event is not None and await self._is_current(event):
+                await self._cache.set(key, event)
+        return event
 
-    async def update_event(self, event_id: int, data: EventUpdateRequest) -> Event:
+    async def _is_current(self, event: Event) -> bool:
+        """
+        Whether a row read from the database may be cached.
+
+        A read that started before an update committed, or that was served by a
+        lagging replica, returns the row as it was before the update. `on_commit`
+        leaves the committed `updated_at` behind, and older rows are not cached.
+        """
+        if self._version_cache is None:
+            return True
+        version = await self._version_cache.get(_version_key(event.id))
+        return version is None or event.updated_at >= version
+
+    async def event_exists(self, event_id: int) -> bool:
+        """Whether the event exists, without loading it unless it is cached."""
+        if self._cache is not None and await self._cache.get(_cache_key(event_id)):
+            return True
+        return await self._repo.exists(event_id)
+
+    async def get_event_last_modified(self, event_id: int) -> datetime | None:
+        """Return the event's `updated_at` without loading the full row."""
+        if self._cache is not None:
+            event = await self._cache.get(_cache_key(event_id))
+            if event is not None:
+                return event.updated_at
+        return await self._repo.get_updated_at(event_id)
+
+    async def list_events(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> tuple[list[Event], int]:
+        return await self._repo.get_paginated_events_with_total(
+            offset=offset, limit=limit, filters=filters, sort=sort
+        )
+
+    async def list_events_with_estimated_total(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> tuple[list[Event], int, bool]:
+        """
+        List events using the planner's row estimate as the total when available.
+
+        Returns `(events, total, is_estimated)`; falls back to an exact count when
+        the backend has no statistics, or when filtering (the estimate is for the
+        whole table).
+        """
+        estimate = await self._repo.estimate_count() if not filters else None
+        if estimate is None:
+            events, total = await self.list_events(
+                offset=offset, limit=limit, filters=filters, sort=sort
+            )
+            return events, total, False
+
+        events = await self._repo.get_paginated_events(
+            offset=offset, limit=limit, sort=sort
+        )
+        # Never report fewer rows than were actually seen
+        return events, max(estimate, offset + len(events)), True
+
+    async def list_events_after(
+        self,
+        *,
+        after: tuple[datetime, int] | None,
+        limit: int,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> list[Event]:
+        return await self._repo.get_events_after(
+            after=after, limit=limit, filters=filters, sort=sort
+        )
+
+    def stream_events(
+        self, *, batch_size: int, filters: EventFilters | None = None
+    ) -> AsyncIterator[list[Event]]:
+        return self._repo.stream_events(batch_size=batch_size, filters=filters)
+
+    async def update_event(
+        self, event_id: int, data: EventUpdateRequest
+    ) -> Event | None:
         # Update only fields provided
         filtered_data = data.model_dump(exclude_unset=True)
-        return await self._repo.update(event_id, filtered_data)
+        event = await self._repo.update(event_id, filtered_data)
+        if event is not None:
+            self._updated_events[event_id] = event.updated_at
+            self._written(event)
+        return event
+
+    async def on_commit(self) -> None:
+        """
+        Evict cached events that were updated, and index the events written,
+        once the writes are committed.
+        """
+        if self._search_index is not None:
+            for event in self._written_events:
+                await self._search_index.add(
+                    event.id, _search_fields(event), version=event.updated_at
+                )
+            self._written_events.clear()
+
+        if self._cache is not None and self._updated_events:
+            # Record the version first, so a concurrent fill never sees the
+            # entry gone without it
+            if self._version_cache is not None:
+                for event_id, updated_at in self._updated_events.items():
+                    await self._version_cache.set(_version_key(event_id), updated_at)
+            await self._cache.delete(*map(_cache_key, self._updated_events))
+        self._updated_events.clear()
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(slots=True)
+class IdempotencyRecord:
+    id: int
+    key: str
+    # Hash of the request the key was first used with
+    fingerprint: str
+    status_code: int
+    response_body: Any
+    created_at: datetime
+    updated_at: datetime
+
+    def __repr__(self) -> str:
+        return (
+            f"IdempotencyRecord(id={self.id!r}, "
+            f"key={self.key!r}, "
+            f"status_code={self.status_code!r})"
+        )
@@ -0,0 +1,11 @@
+from app.domain.abc.repository import Repository
+
+from .entities import IdempotencyRecord
+
+
+class IdempotencyRepository(Repository[IdempotencyRecord]):  # noqa
+    async def get_by_key(self, key: str) -> IdempotencyRecord | None:
+        raise NotImplementedError
+
+    async def delete_by_key(self, key: str) -> None:
+        raise NotImplementedError
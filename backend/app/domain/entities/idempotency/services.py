@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Any
+
+from app.domain.abc.cache import Cache
+from app.domain.abc.service import Service
+
+from .entities import IdempotencyRecord
+from .repositories import IdempotencyRepository
+
+
+def _cache_key(key: str) -> str:
+    return f"idempotency:{key}"
+
+
+class IdempotencyService(Service):
+    def __init__(self, repo: IdempotencyRepository, cache: Cache | None = None):
+        self._repo = repo
+        # Records never change once committed, so cached entries never go stale
+        self._cache = cache
+        # Records saved in the current unit of work, cached on commit
+        self._saved: list[IdempotencyRecord] = []
+
+    async def get_response(
+        self, key: str, *, not_before: datetime
+    ) -> IdempotencyRecord | None:
+        """
+        Return the response stored for `key`, if any. Records created before
+        `not_before` have expired: they are deleted and None is returned.
+        """
+        record = None
+        if self._cache is not None:
+            record = await self._cache.get(_cache_key(key))
+        if record is None:
+            record = await self._repo.get_by_key(key)
+
+        if record is None:
+            return None
+        if record.created_at < not_before:
+            await self._repo.delete_by_key(key)
+            return None
+
+        if self._cache is not None:
+            await self._cache.set(_cache_key(key), record)
+        return record
+
+    async def save_response(
+        self, key: str, *, fingerprint: str, status_code: int, body: Any
+    ) -> IdempotencyRecord:
+        """
+        Store the response for `key` in the current unit of work. Committing
+        fails if another request stored a response for the same key first.
+        """
+        record = await self._repo.create(
+            {
+                "key": key,
+                "fingerprint": fingerprint,
+                "status_code": status_code,
+                "response_body": body,
+            }
+        )
+        self._saved.append(record)
+        return record
+
+    async def on_commit(self) -> None:
+        """Cache the saved responses once they are committed."""
+        if self._cache is not None:
+            for record in self._saved:
+                await self._cache.set(_cache_key(record.key), record)
+        self._saved.clear()
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+
+class OutboxStatus(StrEnum):
+    PENDING = "pending"
+    # Out of attempts, or no way to deliver it; kept for inspection
+    DEAD = "dead"
+
+
+@dataclass(slots=True)
+class OutboxMessage:
+    """A side effect to run once the transaction that recorded it commits."""
+
+    id: int
+    topic: str
+    # Messages with the same key are delivered one at a time, in order
+    key: str | None
+    payload: Any
+    status: str
+    # Deliveries started so far, including one in progress
+    attempts: int
+    # Not claimed before this time: the retry time, or the end of a claim
+    available_at: datetime
+    last_error: str | None
+    created_at: datetime
+    updated_at: datetime
+
+    def __repr__(self) -> str:
+        return (
+            f"OutboxMessage(id={self.id!r}, "
+            f"topic={self.topic!r}, "
+            f"attempts={self.attempts!r})"
+        )
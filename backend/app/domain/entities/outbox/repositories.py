@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from app.domain.abc.repository import Repository
+
+from .entities import OutboxMessage
+
+
+class OutboxRepository(Repository[OutboxMessage]):  # noqa
+    async def create_many(self, messages: Sequence[dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    async def claim(
+        self,
+        topics: Sequence[str],
+        *,
+        now: datetime,
+        claimed_until: datetime,
+        limit: int,
+    ) -> list[OutboxMessage]:
+        raise NotImplementedError
+
+    async def delete_many(self, message_ids: Sequence[int]) -> None:
+        raise NotImplementedError
+
+    async def reschedule(
+        self, message_id: int, *, available_at: datetime, error: str
+    ) -> None:
+        raise NotImplementedError
+
+    async def mark_dead(self, message_id: int, *, error: str) -> None:
+        raise NotImplementedError
+
+    async def get_backlog(self, *, now: datetime) -> dict[str, Any]:
+        raise NotImplementedError
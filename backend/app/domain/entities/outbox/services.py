@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from app.domain.abc.service import Service
+
+from .entities import OutboxMessage, OutboxStatus
+from .repositories import OutboxRepository
+
+
+class OutboxService(Service):
+    """
+    Transactional outbox: messages published during a unit of work are written
+    in its own transaction, so they exist if and only if its other writes do.
+    A dispatcher delivers them afterwards, outside any request.
+    """
+
+    def __init__(self, repo: OutboxRepository):
+        self._repo = repo
+        self._staged: list[dict[str, Any]] = []
+
+    def publish(self, topic: str, payload: Any, *, key: str | None = None) -> None:
+        """
+        Record a message to deliver once the current unit of work commits.
+        `payload` must be JSON serializable. Messages sharing a `key` are
+        delivered in the order they were published.
+        """
+        self._staged.append(
+            {
+                "topic": topic,
+                "key": key,
+                "payload": payload,
+                "status": OutboxStatus.PENDING,
+            }
+        )
+
+    async def before_commit(self) -> None:
+        """Write the published messages, in one statement, before committing."""
+        if self._staged:
+            await self._repo.create_many(self._staged)
+            self._staged = []
+
+    async def claim(
+        self,
+        topics: Sequence[str],
+        *,
+        now: datetime,
+        claimed_until: datetime,
+        limit: int,
+    ) -> list[OutboxMessage]:
+        """
+        Take up to `limit` due messages of `topics` for delivery. They are not
+        handed out again before `claimed_until`, so messages of a dispatcher
+        that died are retried once that passes. A message waits while an
+        earlier one with the same key is pending.
+        """
+        if not topics:
+            return []
+        return await self._repo.claim(
+            topics, now=now, claimed_until=claimed_until, limit=limit
+        )
+
+    async def settle(
+        self,
+        delivered: Sequence[int],
+        retries: Sequence[tuple[int, datetime, str]] = (),
+        dead: Sequence[tuple[int, str]] = (),
+    ) -> None:
+        """
+        Record the outcome of a batch: delivered messages are deleted, `retries`
+        (id, retry time, error) are rescheduled and `dead` (id, error) are given
+        up on.
+        """
+        if delivered:
+            await self._repo.delete_many(delivered)
+        for message_id, available_at, error in retries:
+            await self._repo.reschedule(
+                message_id, available_at=available_at, error=error
+            )
+        for message_id, error in dead:
+            await self._repo.mark_dead(message_id, error=error)
+
+    async def get_backlog(self, *, now: datetime) -> dict[str, Any]:
+        return await self._repo.get_backlog(now=now)
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+
+class ReservationStatus(StrEnum):
+    RESERVED = "reserved"
+    CANCELLED = "cancelled"
+
+
+class ReservationEvent(StrEnum):
+    """Outbox topics of reservation changes, e.g. for payments."""
+
+    CREATED = "reservation.created"
+    CANCELLED = "reservation.cancelled"
+
+
+@dataclass(slots=True)
+class TicketType:
+    id: int
+    event_id: int
+    name: str
+    price_cents: int
+    capacity: int
+    sold: int
+    shard_count: int
+    created_at: datetime
+    updated_at: datetime
+
+    @property
+    def available(self) -> int:
+        return self.capacity - self.sold
+
+    @property
+    def sharded(self) -> bool:
+        return self.shard_count > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"TicketType(id={self.id!r}, "
+            f"event_id={self.event_id!r}, "
+            f"name={self.name!r})"
+        )
+
+
+@dataclass(slots=True)
+class Hold:
+    """Tickets set aside for a buyer until `expires_at`."""
+
+    id: int
+    ticket_type_id: int
+    quantity: int
+    expires_at: datetime
+    created_at: datetime
+    updated_at: datetime
+    # When the sweeper returned the tickets of the expired hold
+    released_at: datetime | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Hold(id={self.id!r}, "
+            f"ticket_type_id={self.ticket_type_id!r}, "
+            f"quantity={self.quantity!r})"
+        )
+
+
+@dataclass(slots=True)
+class Reservation:
+    id: int
+    ticket_type_id: int
+    quantity: int
+    unit_price_cents: int
+    status: str
+    created_at: datetime
+    updated_at: datetime
+
+    def __repr__(self) -> str:
+        return (
+            f"Reservation(id={self.id!r}, "
+            f"ticket_type_id={self.ticket_type_id!r}, "
+            f"quantity={self.quantity!r}, "
+            f"status={self.status!r})"
+        )
@@ -0,0 +1,251 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+
+SECONDS_PER_DAY = 86_400
+
+
+@dataclass(frozen=True, slots=True)
+class PricingPolicy:
+    """
+    Dynamic price of a ticket type: its base price times
+
+        1 + demand_markup * sell_through ** demand_exponent
+          + urgency_markup * (share of `urgency_window_seconds` already elapsed)
+
+    clipped to `[min_multiplier, max_multiplier]`. The markup is rounded up to
+    whole `rounding_cents` steps. A `demand_exponent` above 1 keeps prices flat
+    early in the sale and ramps them up as stock runs out.
+
+    Prices older than `max_age_seconds` are recomputed, which bounds how far
+    the time-based markup can lag.
+    """
+
+    demand_markup: float = 0.5
+    demand_exponent: float = 2.0
+    urgency_markup: float = 0.25
+    urgency_window_seconds: float = 7 * SECONDS_PER_DAY
+    min_multiplier: float = 1.0
+    max_multiplier: float = 2.0
+    rounding_cents: int = 100
+    max_age_seconds: float = 60.0
+
+
+def compute_prices(
+    base_cents: npt.ArrayLike,
+    capacity: npt.ArrayLike,
+    sold: npt.ArrayLike,
+    seconds_to_start: npt.ArrayLike,
+    policy: PricingPolicy,
+) -> npt.NDArray[np.int64]:
+    """Price many ticket types in one vectorized pass, in cents."""
+    base = np.asarray(base_cents, dtype=np.float64)
+    capacity = np.asarray(capacity, dtype=np.float64)
+    sold = np.asarray(sold, dtype=np.float64)
+    seconds_to_start = np.asarray(seconds_to_start, dtype=np.float64)
+
+    # Sold out when there is no capacity at all
+    sell_through = np.clip(
+        np.divide(
+            sold,
+            capacity,
+            out=np.ones(np.broadcast(sold, capacity).shape),
+            where=capacity > 0,
+        ),
+        0.0,
+        1.0,
+    )
+    elapsed = np.clip(1.0 - seconds_to_start / policy.urgency_window_seconds, 0.0, 1.0)
+
+    multiplier = np.clip(
+        1.0
+        + policy.demand_markup * sell_through**policy.demand_exponent
+        + policy.urgency_markup * elapsed,
+        policy.min_multiplier,
+        policy.max_multiplier,
+    )
+
+    step = policy.rounding_cents
+    # Rounded first so float noise (0.08 * 150000 = 12000.000000000002) does
+    # not add a whole step
+    markup = np.ceil(np.round(base * (multiplier - 1.0) / step, 6)) * step
+    return (base + markup).astype(np.int64)
+
+
+class PricingInputs:
+    """Columnar pricing inputs for many ticket types, possibly of many events."""
+
+    __slots__ = (
+        "ticket_type_ids",
+        "event_ids",
+        "base_cents",
+        "capacity",
+        "sold",
+        "start_ts",
+    )
+
+    def __init__(
+        self,
+        ticket_type_ids: npt.ArrayLike,
+        event_ids: npt.ArrayLike,
+        base_cents: npt.ArrayLike,
+        capacity: npt.ArrayLike,
+        sold: npt.ArrayLike,
+        start_ts: npt.ArrayLike,
+    ) -> None:
+        self.ticket_type_ids = np.asarray(ticket_type_ids, dtype=np.int64)
+        self.event_ids = np.asarray(event_ids, dtype=np.int64)
+        self.base_cents = np.asarray(base_cents, dtype=np.int64)
+        self.capacity = np.asarray(capacity, dtype=np.int64)
+        self.sold = np.asarray(sold, dtype=np.int64)
+        # POSIX timestamps of the events' start times
+        self.start_ts = np.asarray(start_ts, dtype=np.float64)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[tuple[int, int, int, int, int, datetime]]
+    ) -> "PricingInputs":
+        """Build from `(id, event_id, price_cents, capacity, sold, start_time)` rows."""
+        rows = list(rows)
+        count = len(rows)
+        columns = zip(*rows, strict=True) if rows else [()] * 6
+        ids, event_ids, base, capacity, sold, start_times = columns
+        return cls(
+            np.fromiter(ids, dtype=np.int64, count=count),
+            np.fromiter(event_ids, dtype=np.int64, count=count),
+            np.fromiter(base, dtype=np.int64, count=count),
+            np.fromiter(capacity, dtype=np.int64, count=count),
+            np.fromiter(sold, dtype=np.int64, count=count),
+            np.fromiter(
+                (start_time.timestamp() for start_time in start_times),
+                dtype=np.float64,
+                count=count,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ticket_type_ids)
+
+    def __getitem__(self, rows: slice | npt.NDArray[np.intp]) -> "PricingInputs":
+        """
+        The given rows of every column: views for a slice, copies for an index
+        array.
+        """
+        subset = object.__new__(PricingInputs)
+        for name in self.__slots__:
+            setattr(subset, name, getattr(self, name)[rows])
+        return subset
+
+
+class EventPrices:
+    """
+    Current prices of one event's ticket types: rows `start:stop` of a batch
+    priced by `price_events`, shared with the batch's other events.
+
+    Lookups are a dict access plus an array index. `apply_sold_delta` reprices
+    only the ticket type whose inventory changed.
+    """
+
+    __slots__ = (
+        "event_id",
+        "inputs",
+        "prices",
+        "priced_at",
+        "start",
+        "stop",
+        "_row_index",
+    )
+
+    def __init__(
+        self,
+        event_id: int,
+        inputs: PricingInputs,
+        prices: npt.NDArray[np.int64],
+        priced_at: float,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> None:
+        self.event_id = event_id
+        self.inputs = inputs
+        self.prices = prices
+        self.priced_at = priced_at
+        self.start = start
+        self.stop = len(inputs) if stop is None else stop
+        self._row_index: dict[int, int] | None = None
+
+    @property
+    def _rows(self) -> dict[int, int]:
+        # Built on first use: most events of a batch reprice are never looked up
+        if self._row_index is None:
+            ids = self.inputs.ticket_type_ids[self.start : self.stop].tolist()
+            self._row_index = dict(zip(ids, range(self.start, self.stop), strict=True))
+        return self._row_index
+
+    def price_of(self, ticket_type_id: int) -> int | None:
+        row = self._rows.get(ticket_type_id)
+        if row is None:
+            return None
+        return int(self.prices[row])
+
+    def items(self) -> list[tuple[int, int]]:
+        """`(ticket_type_id, price_cents)` pairs."""
+        rows = slice(self.start, self.stop)
+        return list(
+            zip(
+                self.inputs.ticket_type_ids[rows].tolist(),
+                self.prices[rows].tolist(),
+                strict=True,
+            )
+        )
+
+    def apply_sold_delta(
+        self, ticket_type_id: int, delta: int, *, policy: PricingPolicy, now: float
+    ) -> bool:
+        """Adjust one ticket type's sold count and reprice it. False if unknown."""
+        row = self._rows.get(ticket_type_id)
+        if row is None:
+            return False
+
+        inputs = self.inputs
+        inputs.sold[row] = min(max(inputs.sold[row] + delta, 0), inputs.capacity[row])
+        self.prices[row] = compute_prices(
+            inputs.base_cents[row],
+            inputs.capacity[row],
+            inputs.sold[row],
+            inputs.start_ts[row] - now,
+            policy,
+        )
+        return True
+
+
+def price_events(
+    inputs: PricingInputs, policy: PricingPolicy, *, now: float
+) -> list[EventPrices]:
+    """
+    Price all ticket types in `inputs` in one pass and group the result by
+    event.
+
+    Rows are sorted by event once; each event's entry then refers to its range
+    of the sorted batch instead of copying it.
+    """
+    inputs = inputs[np.argsort(inputs.event_ids, kind="stable")]
+    prices = compute_prices(
+        inputs.base_cents,
+        inputs.capacity,
+        inputs.sold,
+        inputs.start_ts - now,
+        policy,
+    )
+
+    event_ids = inputs.event_ids
+    starts = np.flatnonzero(np.diff(event_ids, prepend=-1))
+    bounds = [*starts.tolist(), len(inputs)]
+    return [
+        EventPrices(event_id, inputs, prices, now, start, stop)
+        for event_id, start, stop in zip(
+            event_ids[starts].tolist(), bounds, bounds[1:], strict=False
+        )
+    ]
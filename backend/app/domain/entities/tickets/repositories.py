@@ -0,0 +1,69 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.domain.abc.repository import Repository
+
+from .entities import Hold, Reservation, TicketType
+from .pricing import PricingInputs
+
+
+class TicketTypeRepository(Repository[TicketType]):  # noqa
+    async def get_event_id(self, ticket_type_id: int) -> int | None:
+        raise NotImplementedError
+
+    async def list_for_event(self, event_id: int) -> list[TicketType]:
+        raise NotImplementedError
+
+    async def reserve(self, ticket_type_id: int, quantity: int) -> TicketType | None:
+        raise NotImplementedError
+
+    async def release(self, ticket_type_id: int, quantity: int) -> TicketType | None:
+        raise NotImplementedError
+
+    async def release_many(self, quantities: dict[int, int]) -> None:
+        raise NotImplementedError
+
+    async def enable_shards(
+        self, ticket_type_id: int, shards: int, *, min_per_shard: int = 1
+    ) -> bool:
+        raise NotImplementedError
+
+    async def reserve_from_shard(
+        self, ticket_type_id: int, shard: int, quantity: int
+    ) -> bool:
+        raise NotImplementedError
+
+    async def reserve_from_any_shard(self, ticket_type_id: int, quantity: int) -> bool:
+        raise NotImplementedError
+
+    async def rebalance_shards(
+        self, ticket_type_id: int, *, min_per_shard: int = 1
+    ) -> list[int]:
+        raise NotImplementedError
+
+    async def get_pricing_inputs(
+        self,
+        event_ids: Sequence[int] | None,
+        *,
+        starts_after: datetime | None = None,
+    ) -> PricingInputs:
+        raise NotImplementedError
+
+
+class HoldRepository(Repository[Hold]):  # noqa
+    async def claim(self, hold_id: int, *, now: datetime) -> Hold | None:
+        raise NotImplementedError
+
+    async def release(self, hold_id: int) -> Hold | None:
+        raise NotImplementedError
+
+    async def release_expired(self, *, now: datetime, limit: int) -> list[Hold]:
+        raise NotImplementedError
+
+    async def purge_released(self, *, before: datetime, limit: int) -> int:
+        raise NotImplementedError
+
+
+class ReservationRepository(Repository[Reservation]):  # noqa
+    async def cancel(self, reservation_id: int) -> Reservation | None:
+        raise NotImplementedError
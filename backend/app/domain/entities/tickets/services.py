@@ -0,0 +1,287 @@
+import random
+from collections import Counter
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from app.api.v1.schemas.tickets_schema import (
+    RESERVATION_MAX_QUANTITY,
+    TicketTypeCreateRequest,
+)
+from app.domain.abc.cache import Cache
+from app.domain.abc.service import Service
+
+from .entities import Hold, Reservation, ReservationStatus, TicketType
+from .pricing import EventPrices, PricingPolicy, price_events
+from .repositories import HoldRepository, ReservationRepository, TicketTypeRepository
+
+# Every stocked shard can serve the largest reservation on its own
+SHARD_MIN_STOCK = RESERVATION_MAX_QUANTITY
+
+
+def _shard_count_key(ticket_type_id: int) -> str:
+    return f"ticket_type_shards:{ticket_type_id}"
+
+
+def _event_id_key(ticket_type_id: int) -> str:
+    return f"ticket_type_event:{ticket_type_id}"
+
+
+def _event_prices_key(event_id: int) -> str:
+    return f"event_prices:{event_id}"
+
+
+class TicketTypeService(Service):
+    def __init__(self, repo: TicketTypeRepository, cache: Cache | None = None):
+        self._repo = repo
+        # Only attributes that never change are cached (the owning event, the
+        # shard count once sharded), so entries never go stale
+        self._cache = cache
+
+    async def create_ticket_type(
+        self, event_id: int, data: TicketTypeCreateRequest
+    ) -> TicketType:
+        create_data = data.model_dump()
+        return await self._repo.create({**create_data, "event_id": event_id})
+
+    async def get_ticket_type(self, ticket_type_id: int) -> TicketType | None:
+        return await self._repo.get(ticket_type_id)
+
+    async def get_event_id(self, ticket_type_id: int) -> int | None:
+        """Return the event a ticket type belongs to, usually without a query."""
+        if self._cache is None:
+            return await self._repo.get_event_id(ticket_type_id)
+
+        key = _event_id_key(ticket_type_id)
+        event_id = await self._cache.get(key)
+        if event_id is None:
+            event_id = await self._repo.get_event_id(ticket_type_id)
+            if event_id is not None:
+                await self._cache.set(key, event_id)
+        return event_id
+
+    async def list_ticket_types(self, event_id: int) -> list[TicketType]:
+        return await self._repo.list_for_event(event_id)
+
+    async def reserve_tickets(
+        self, ticket_type_id: int, quantity: int, *, rebalance: bool = False
+    ) -> bool:
+        """
+        Atomically take `quantity` tickets. Returns False when the ticket type
+        does not exist or has fewer than `quantity` tickets left.
+
+        Sharded ticket types are served from a random shard first, then from
+        any shard with enough stock. With `rebalance`, stock that is only
+        available spread over several shards is rebalanced and retried once.
+        """
+        shard_count = await self._get_shard_count(ticket_type_id)
+        if not shard_count:
+            if await self._repo.reserve(ticket_type_id, quantity) is not None:
+                return True
+
+            ticket_type = await self._repo.get(ticket_type_id)
+            if ticket_type is None or not ticket_type.sharded:
+                return False
+            shard_count = ticket_type.shard_count
+            if self._cache is not None:
+                await self._cache.set(_shard_count_key(ticket_type_id), shard_count)
+
+        shard = random.randrange(shard_count)
+        if await self._repo.reserve_from_shard(ticket_type_id, shard, quantity):
+            return True
+        if await self._repo.reserve_from_any_shard(ticket_type_id, quantity):
+            return True
+        # Released tickets go back to the ticket type row until rebalanced
+        if await self._repo.reserve(ticket_type_id, quantity) is not None:
+            return True
+
+        if not rebalance:
+            return False
+        ticket_type = await self._repo.get(ticket_type_id)
+        if ticket_type is None or ticket_type.available < quantity:
+            return False
+        await self.rebalance_shards(ticket_type_id)
+        return await self._repo.reserve_from_any_shard(ticket_type_id, quantity)
+
+    async def enable_shards(self, ticket_type_id: int, shards: int) -> bool:
+        """
+        Split the remaining stock across `shards` counters. Returns False when
+        the ticket type does not exist or is already sharded.
+        """
+        return await self._repo.enable_shards(
+            ticket_type_id, shards, min_per_shard=SHARD_MIN_STOCK
+        )
+
+    async def rebalance_shards(self, ticket_type_id: int) -> list[int]:
+        """Spread the remaining stock evenly over the shards."""
+        return await self._repo.rebalance_shards(
+            ticket_type_id, min_per_shard=SHARD_MIN_STOCK
+        )
+
+    async def _get_shard_count(self, ticket_type_id: int) -> int | None:
+        if self._cache is None:
+            return None
+        return await self._cache.get(_shard_count_key(ticket_type_id))
+
+    async def release_tickets(
+        self, ticket_type_id: int, quantity: int
+    ) -> TicketType | None:
+        """Atomically return `quantity` tickets to the inventory."""
+        return await self._repo.release(ticket_type_id, quantity)
+
+    async def release_many(self, quantities: dict[int, int]) -> None:
+        """Return tickets to several ticket types, `{ticket_type_id: quantity}`."""
+        await self._repo.release_many(quantities)
+
+
+class HoldService(Service):
+    def __init__(self, repo: HoldRepository):
+        self._repo = repo
+
+    async def place_hold(
+        self, ticket_type_id: int, quantity: int, *, ttl: timedelta
+    ) -> Hold:
+        return await self._repo.create(
+            {
+                "ticket_type_id": ticket_type_id,
+                "quantity": quantity,
+                "expires_at": datetime.now(UTC) + ttl,
+            }
+        )
+
+    async def get_hold(self, hold_id: int) -> Hold | None:
+        return await self._repo.get(hold_id)
+
+    async def claim_hold(self, hold_id: int) -> Hold | None:
+        """Consume an unexpired hold. Returns None when it is gone or expired."""
+        return await self._repo.claim(hold_id, now=datetime.now(UTC))
+
+    async def release_hold(self, hold_id: int) -> Hold | None:
+        return await self._repo.release(hold_id)
+
+    async def expire_holds(self, *, now: datetime, limit: int) -> list[Hold]:
+        """
+        Mark up to `limit` holds that expired by `now` as released and return
+        them; their tickets are the caller's to return.
+        """
+        return await self._repo.release_expired(now=now, limit=limit)
+
+    async def purge_expired_holds(self, *, before: datetime, limit: int) -> int:
+        """Delete up to `limit` holds released before `before`."""
+        return await self._repo.purge_released(before=before, limit=limit)
+
+
+class ReservationService(Service):
+    def __init__(self, repo: ReservationRepository):
+        self._repo = repo
+
+    async def create_reservation(
+        self, ticket_type_id: int, quantity: int, *, unit_price_cents: int
+    ) -> Reservation:
+        return await self._repo.create(
+            {
+                "ticket_type_id": ticket_type_id,
+                "quantity": quantity,
+                "unit_price_cents": unit_price_cents,
+                "status": ReservationStatus.RESERVED,
+            }
+        )
+
+    async def get_reservation(self, reservation_id: int) -> Reservation | None:
+        return await self._repo.get(reservation_id)
+
+    async def cancel_reservation(self, reservation_id: int) -> Reservation | None:
+        """
+        Mark an active reservation as cancelled. Returns None when the
+        reservation does not exist or is not active.
+        """
+        return await self._repo.cancel(reservation_id)
+
+
+class PricingService(Service):
+    """
+    Dynamic ticket prices, computed per event in vectorized batches.
+
+    Prices are cached per event and recomputed once older than the policy's
+    `max_age_seconds`. Inventory changes committed by this process reprice the
+    affected ticket type in the cached entry instead of the whole event.
+    """
+
+    policy = PricingPolicy()
+
+    def __init__(self, repo: TicketTypeRepository, cache: Cache | None = None):
+        self._repo = repo
+        self._cache = cache
+        # (event_id, ticket_type_id) -> change in tickets sold, applied on commit
+        self._sold_deltas: Counter[tuple[int, int]] = Counter()
+
+    async def get_price(self, event_id: int, ticket_type_id: int) -> int | None:
+        """
+        Current price of a ticket type, in cents. A cache hit costs a lookup;
+        a miss (or a ticket type added since) reprices the event. Returns None
+        for an unknown ticket type.
+        """
+        prices = await self._get_event_prices(event_id)
+        price = prices.price_of(ticket_type_id) if prices is not None else None
+        if price is None:
+            prices = (await self.reprice_events([event_id])).get(event_id)
+            price = prices.price_of(ticket_type_id) if prices is not None else None
+        return price
+
+    async def get_event_prices(self, event_id: int) -> EventPrices | None:
+        """Current prices of an event's ticket types; None when it has none."""
+        prices = await self._get_event_prices(event_id)
+        if prices is None:
+            prices = (await self.reprice_events([event_id])).get(event_id)
+        return prices
+
+    async def reprice_events(
+        self, event_ids: Sequence[int] | None = None
+    ) -> dict[int, EventPrices]:
+        """
+        Price the ticket types of `event_ids` (every upcoming event when None)
+        in one query and one vectorized pass, and cache the result per event.
+        """
+        now = datetime.now(UTC)
+        inputs = await self._repo.get_pricing_inputs(
+            event_ids, starts_after=now if event_ids is None else None
+        )
+        result = {
+            prices.event_id: prices
+            for prices in price_events(inputs, self.policy, now=now.timestamp())
+        }
+        if self._cache is not None:
+            for event_id, prices in result.items():
+                await self._cache.set(_event_prices_key(event_id), prices)
+        return result
+
+    def record_sold(self, event_id: int, ticket_type_id: int, quantity: int) -> None:
+        """
+        Note tickets taken from (or, negative, returned to) inventory in the
+        current unit of work; cached prices follow once it commits.
+        """
+        self._sold_deltas[(event_id, ticket_type_id)] += quantity
+
+    async def _get_event_prices(self, event_id: int) -> EventPrices | None:
+        if self._cache is None:
+            return None
+        prices = await self._cache.get(_event_prices_key(event_id))
+        if prices is None:
+            return None
+        age = datetime.now(UTC).timestamp() - prices.priced_at
+        return prices if age <= self.policy.max_age_seconds else None
+
+    async def on_commit(self) -> None:
+        """Reprice the cached ticket types whose inventory changed."""
+        if self._cache is not None and self._sold_deltas:
+            now = datetime.now(UTC).timestamp()
+            for (event_id, ticket_type_id), delta in self._sold_deltas.items():
+                prices = await self._get_event_prices(event_id)
+                if (
+                    prices is not None
+                    and delta
+                    and prices.apply_sold_delta(
+                        ticket_type_id, delta, policy=self.policy, now=now
+                    )
+                ):
+                    await self._cache.set(_event_prices_key(event_id), prices)
+        self._sold_deltas.clear()
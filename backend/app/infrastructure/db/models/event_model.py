@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DDL, DateTime, Index, Integer, String, event
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column as _mc
 
@@ -9,6 +9,14 @@ from .base import ModelBase
 
 class EventModel(ModelBase):
     __tablename__ = "events"
+    __table_args__ = (
+        # Backs keyset pagination: WHERE (start_time, id) > (:start_time, :id)
+        Index("ix_events_start_time_id", "start_time", "id"),
+        # Equality filters followed by the default sort (and `start_time` ranges)
+        Index("ix_events_event_type_start_time_id", "event_type", "start_time", "id"),
+        Index("ix_events_venue_start_time_id", "venue", "start_time", "id"),
+        Index("ix_events_created_at_id", "created_at", "id"),
+    )
 
     title: Mapped[str] = _mc(String(255), nullable=False)
     description: Mapped[str] = _mc(String(1000))
@@ -16,3 +24,30 @@ class EventModel(ModelBase):
     venue: Mapped[str] = _mc(String(255), nullable=False)
     capacity: Mapped[int] = _mc(Integer, nullable=False)
     start_time: Mapped[datetime] = _mc(DateTime(timezone=True), nullable=False)
+
+
+# Full-text search on PostgreSQL: a generated, weighted `tsvector` with a GIN
+# index. It is left out of the mapped columns, so rows never carry it; other
+# dialects search through an in-memory index instead.
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_CONFIG = "simple"
+
+_search_vector_ddl = [
+    DDL(
+        f"ALTER TABLE %(table)s ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector "
+        "GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(event_type, '')), 'B') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(venue, '')), 'B') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')"
+        ") STORED"
+    ),
+    DDL(
+        f"CREATE INDEX ix_events_{SEARCH_VECTOR_COLUMN} ON %(table)s "
+        f"USING GIN ({SEARCH_VECTOR_COLUMN})"
+    ),
+]
+for _ddl in _search_vector_ddl:
+    event.listen(
+        EventModel.__table__, "after_create", _ddl.execute_if(dialect="postgresql")
+    )
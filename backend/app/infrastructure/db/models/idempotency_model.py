@@ -0,0 +1,18 @@
+from typing import Any
+
+from sqlalchemy import JSON, Integer, String
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column as _mc
+
+from .base import ModelBase
+
+
+class IdempotencyKeyModel(ModelBase):
+    __tablename__ = "idempotency_keys"
+
+    # Scoped by route, e.g. "POST /events/:<client key>". Unique, so that of
+    # two concurrent requests with the same key only one can commit.
+    key: Mapped[str] = _mc(String(512), nullable=False, unique=True)
+    fingerprint: Mapped[str] = _mc(String(64), nullable=False)
+    status_code: Mapped[int] = _mc(Integer, nullable=False)
+    response_body: Mapped[Any] = _mc(JSON, nullable=False)
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column as _mc
+
+from .base import ModelBase
+
+
+class OutboxMessageModel(ModelBase):
+    __tablename__ = "outbox_messages"
+    __table_args__ = (
+        # Backs claiming: WHERE status = 'pending' AND available_at <= :now
+        Index("ix_outbox_messages_status_available_at", "status", "available_at"),
+        # Backs the check for an earlier pending message with the same key
+        Index("ix_outbox_messages_key_id", "key", "id"),
+    )
+
+    topic: Mapped[str] = _mc(String(255), nullable=False)
+    key: Mapped[str | None] = _mc(String(255))
+    payload: Mapped[Any] = _mc(JSON, nullable=False)
+    status: Mapped[str] = _mc(String(32), nullable=False)
+    attempts: Mapped[int] = _mc(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime] = _mc(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error: Mapped[str | None] = _mc(String(1000))
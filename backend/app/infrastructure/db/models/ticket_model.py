@@ -0,0 +1,83 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column as _mc
+
+from .base import ModelBase
+
+
+class TicketTypeModel(ModelBase):
+    __tablename__ = "ticket_types"
+    __table_args__ = (
+        # Last line of defence against overselling; reservations never get here
+        # because they are a conditional UPDATE
+        CheckConstraint("sold >= 0 AND sold <= capacity", name="ck_ticket_types_sold"),
+    )
+
+    event_id: Mapped[int] = _mc(
+        ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    name: Mapped[str] = _mc(String(255), nullable=False)
+    price_cents: Mapped[int] = _mc(Integer, nullable=False)
+    capacity: Mapped[int] = _mc(Integer, nullable=False)
+    sold: Mapped[int] = _mc(Integer, nullable=False, default=0, server_default="0")
+    # 0 when inventory lives on this row only. Once sharded, the remaining
+    # stock is moved to `ticket_type_shards` (`sold` is set to `capacity`) and
+    # released tickets come back to this row until the next rebalance.
+    shard_count: Mapped[int] = _mc(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+
+class TicketTypeShardModel(ModelBase):
+    __tablename__ = "ticket_type_shards"
+    __table_args__ = (
+        UniqueConstraint("ticket_type_id", "shard", name="uq_ticket_type_shards"),
+        CheckConstraint("available >= 0", name="ck_ticket_type_shards_available"),
+    )
+
+    ticket_type_id: Mapped[int] = _mc(
+        ForeignKey("ticket_types.id", ondelete="CASCADE"), nullable=False
+    )
+    shard: Mapped[int] = _mc(Integer, nullable=False)
+    available: Mapped[int] = _mc(Integer, nullable=False)
+
+
+class HoldModel(ModelBase):
+    __tablename__ = "ticket_holds"
+    __table_args__ = (
+        # Backs the expiry sweeper, both marking expired holds
+        # (WHERE released_at IS NULL AND expires_at <= :now ORDER BY expires_at)
+        # and purging them later (WHERE released_at <= :before)
+        Index("ix_ticket_holds_released_at_expires_at", "released_at", "expires_at"),
+    )
+
+    ticket_type_id: Mapped[int] = _mc(
+        ForeignKey("ticket_types.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    quantity: Mapped[int] = _mc(Integer, nullable=False)
+    expires_at: Mapped[datetime] = _mc(DateTime(timezone=True), nullable=False)
+    # Set by the sweeper when it returns an expired hold's tickets. The row is
+    # kept for a while so that late confirmations get "expired", not "not found"
+    released_at: Mapped[datetime | None] = _mc(DateTime(timezone=True), nullable=True)
+
+
+class ReservationModel(ModelBase):
+    __tablename__ = "reservations"
+
+    ticket_type_id: Mapped[int] = _mc(
+        ForeignKey("ticket_types.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    quantity: Mapped[int] = _mc(Integer, nullable=False)
+    # Price per ticket when the reservation was made
+    unit_price_cents: Mapped[int] = _mc(Integer, nullable=False)
+    status: Mapped[str] = _mc(String(32), nullable=False)
@@ -1,58 +1,301 @@
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Float,
+    Row,
+    Select,
+    and_,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.events.entities import Event
+from app.domain.entities.events.entities import Event, EventFilters, EventSort
 from app.domain.entities.events.repositories import EventRepository
-from app.infrastructure.db.models.event_model import EventModel
-from app.infrastructure.db.utils import from_orm
+from app.infrastructure.db.models.event_model import (
+    SEARCH_CONFIG,
+    SEARCH_VECTOR_COLUMN,
+    EventModel,
+)
+from app.infrastructure.db.utils import normalize_datetime, register_mapper
+
+to_event = register_mapper(EventModel, Event)
+
+
+def _apply_filters(stmt: Select, filters: EventFilters | None) -> Select:
+    """Restrict `stmt` to the events matching `filters`."""
+    if not filters:
+        return stmt
+    if filters.event_type is not None:
+        stmt = stmt.where(EventModel.event_type == filters.event_type)
+    if filters.venue is not None:
+        stmt = stmt.where(EventModel.venue == filters.venue)
+    # Compare in UTC, which is how timestamps are written
+    if filters.starts_from is not None:
+        stmt = stmt.where(EventModel.start_time >= filters.starts_from.astimezone(UTC))
+    if filters.starts_before is not None:
+        stmt = stmt.where(EventModel.start_time < filters.starts_before.astimezone(UTC))
+    if filters.upcoming:
+        stmt = stmt.where(EventModel.start_time >= datetime.now(UTC))
+    return stmt
+
+
+def _apply_sort(stmt: Select, sort: EventSort) -> Select:
+    """Order `stmt` by `sort`, then by id in the same direction."""
+    key = getattr(EventModel, sort.field)
+    if sort.descending:
+        return stmt.order_by(key.desc(), EventModel.id.desc())
+    return stmt.order_by(key, EventModel.id)
 
 
 class SqlAlchemyEventRepository(EventRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, create_data: dict[str, Any]) -> Event:
-        obj = EventModel(**create_data)
+    def _select(self, *extra_columns: Any) -> Select:
+        """Base SELECT that loads events, plus any extra columns."""
+        return select(EventModel, *extra_columns)
 
-        self.session.add(obj)
-        # Flush to get ID without committing
-        await self.session.flush()
-        await self.session.refresh(obj)
+    @staticmethod
+    def _to_event(row: Row) -> Event:
+        return to_event(row[0])
 
-        return from_orm(obj, Event)
-
-    async def _get(self, event_id: int) -> Event | None:
-        stmt = select(EventModel).where(EventModel.id == event_id)
+    async def create(self, create_data: dict[str, Any]) -> Event:
+        """Insert an event in a single `INSERT ... RETURNING` round trip."""
+        table = EventModel.__table__
+        stmt = insert(table).values(**create_data).returning(*table.c)
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return to_event(result.one())
+
+    async def create_many(self, create_data: list[dict[str, Any]]) -> list[Event]:
+        """
+        Insert many events with batched multi-row `INSERT ... RETURNING`
+        statements. Events are returned in the same order as `create_data`.
+        """
+        if not create_data:
+            return []
+
+        table = EventModel.__table__
+        stmt = insert(table).returning(*table.c, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, create_data)
+        return [to_event(row) for row in result]
 
     async def get(self, event_id: int) -> Event | None:
-        event = await self._get(event_id)
-        if event is None:
+        stmt = self._select().where(EventModel.id == event_id)
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
             return None
-        return from_orm(event, Event)
+        return self._to_event(row)
 
-    async def get_paginated_events(self, *, offset: int, limit: int) -> list[Event]:
-        stmt = select(EventModel).offset(offset).limit(limit)
+    async def get_many(self, event_ids: Sequence[int]) -> list[Event]:
+        """Load events by id in one query, in the order of `event_ids`."""
+        if not event_ids:
+            return []
+        stmt = self._select().where(EventModel.id.in_(event_ids))
         result = await self.session.execute(stmt)
-        rows = result.scalars().all()
-        return [from_orm(event, Event) for event in rows]
+        events = {event.id: event for event in map(self._to_event, result)}
+        return [events[event_id] for event_id in event_ids if event_id in events]
 
-    async def count(self) -> int:
-        total = await self.session.execute(select(func.count(EventModel.id)))
-        return total.scalar_one()
+    async def exists(self, event_id: int) -> bool:
+        stmt = select(EventModel.id).where(EventModel.id == event_id)
+        return await self.session.scalar(stmt) is not None
+
+    async def get_updated_at(self, event_id: int) -> datetime | None:
+        """Return only the event's `updated_at`, without loading the row."""
+        stmt = select(EventModel.updated_at).where(EventModel.id == event_id)
+        result = await self.session.execute(stmt)
+        return normalize_datetime(result.scalar_one_or_none())
+
+    async def get_paginated_events(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> list[Event]:
+        stmt = _apply_sort(_apply_filters(self._select(), filters), sort)
+        stmt = stmt.offset(offset).limit(limit)
+        result = await self.session.execute(stmt)
+        return [self._to_event(row) for row in result]
 
-    async def update(self, event_id: int, update_data: dict[str, Any]) -> Event:
-        event = await self._get(event_id)
+    async def get_paginated_events_with_total(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> tuple[list[Event], int]:
+        """
+        Return a page of events together with the total count of matching rows,
+        computed by a `COUNT(*) OVER ()` window in the same statement.
+        """
+        stmt = self._select(func.count().over().label("total"))
+        stmt = _apply_sort(_apply_filters(stmt, filters), sort)
+        stmt = stmt.offset(offset).limit(limit)
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        if rows:
+            return [self._to_event(row) for row in rows], rows[0].total
 
-        for key, value in update_data.items():
-            setattr(event, key, value)
+        # An empty page carries no window value; only past-the-end pages need
+        # a separate count.
+        total = await self.count(filters) if offset else 0
+        return [], total
 
-        await self.session.flush()
-        await self.session.refresh(event)
+    async def estimate_count(self) -> int | None:
+        """
+        Return the planner's row estimate for the events table, or None when the
+        backend has no usable statistics.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return None
 
-        return from_orm(event, Event)
+        stmt = text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = CAST(:table AS regclass)"
+        )
+        result = await self.session.execute(stmt, {"table": EventModel.__tablename__})
+        estimate = result.scalar_one_or_none()
+
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        if estimate is None or estimate < 0:
+            return None
+        return estimate
+
+    async def get_events_after(
+        self,
+        *,
+        after: tuple[datetime, int] | None,
+        limit: int,
+        filters: EventFilters | None = None,
+        sort: EventSort = EventSort.START_TIME,
+    ) -> list[Event]:
+        """
+        Keyset pagination: return up to `limit` events ordered by `sort` (then
+        id) that come strictly after the `after` position.
+        """
+        stmt = _apply_sort(_apply_filters(self._select(), filters), sort)
+        if after is not None:
+            value, event_id = after
+            position = tuple_(getattr(EventModel, sort.field), EventModel.id)
+            # Compare in UTC, which is how timestamps are written
+            bound = tuple_(value.astimezone(UTC), event_id)
+            stmt = stmt.where(position < bound if sort.descending else position > bound)
+        result = await self.session.execute(stmt.limit(limit))
+        return [self._to_event(row) for row in result]
+
+    @property
+    def has_full_text_search(self) -> bool:
+        """Whether `search` is available: the database indexes events itself."""
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    async def search(
+        self, query: str, *, after: tuple[float, int] | None, limit: int
+    ) -> list[tuple[Event, float]]:
+        """
+        Return up to `limit` events matching `query` (web search syntax) with
+        their `ts_rank_cd` relevance, best first, keyset-paginated on
+        `(rank, id)`. Uses the GIN-indexed `search_vector` column (PostgreSQL).
+        """
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        search_vector = literal_column(
+            f"{EventModel.__tablename__}.{SEARCH_VECTOR_COLUMN}"
+        )
+        rank = func.ts_rank_cd(search_vector, ts_query, type_=Float)
+
+        stmt = (
+            self._select(rank.label("rank"))
+            .where(search_vector.op("@@")(ts_query))
+            .order_by(rank.desc(), EventModel.id)
+        )
+        if after is not None:
+            after_rank, event_id = after
+            stmt = stmt.where(
+                or_(
+                    rank < after_rank,
+                    and_(rank == after_rank, EventModel.id > event_id),
+                )
+            )
+        result = await self.session.execute(stmt.limit(limit))
+        return [(self._to_event(row), row.rank) for row in result]
+
+    async def stream_events(
+        self, *, batch_size: int, filters: EventFilters | None = None
+    ) -> AsyncIterator[list[Event]]:
+        """
+        Stream the events matching `filters` ordered by `(start_time, id)` from a
+        server-side cursor, `batch_size` rows at a time.
+        """
+        stmt = _apply_sort(
+            _apply_filters(self._select(), filters), EventSort.START_TIME
+        )
+        stmt = stmt.execution_options(yield_per=batch_size)
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            yield [self._to_event(row) for row in rows]
+
+    async def count(self, filters: EventFilters | None = None) -> int:
+        stmt = _apply_filters(select(func.count(EventModel.id)), filters)
+        total = await self.session.execute(stmt)
+        return total.scalar_one()
+
+    async def update(self, event_id: int, update_data: dict[str, Any]) -> Event | None:
+        """
+        Update an event in a single `UPDATE ... RETURNING` round trip.
+        Returns None when no event matches `event_id`.
+        """
+        if not update_data:
+            return await self.get(event_id)
+
+        table = EventModel.__table__
+        # `updated_at` is filled in by the column's `onupdate` default
+        stmt = (
+            update(table)
+            .where(table.c.id == event_id)
+            .values(**update_data)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_event(row)
 
     async def delete(self): ...  # noqa: E704
+
+
+class SqlAlchemyEventReadRepository(SqlAlchemyEventRepository):
+    """
+    Read-only event repository.
+
+    Selects plain column rows with SQLAlchemy Core and maps them straight to
+    `Event`, so nothing is loaded into (or tracked by) the session identity map.
+    """
+
+    def _select(self, *extra_columns: Any) -> Select:
+        return select(EventModel.__table__, *extra_columns)
+
+    @staticmethod
+    def _to_event(row: Row) -> Event:
+        return to_event(row)
+
+    async def create(self, create_data: dict[str, Any]) -> Event:
+        raise RuntimeError(f"{type(self).__name__} is read-only.")
+
+    async def create_many(self, create_data: list[dict[str, Any]]) -> list[Event]:
+        raise RuntimeError(f"{type(self).__name__} is read-only.")
+
+    async def update(self, event_id: int, update_data: dict[str, Any]) -> Event | None:
+        raise RuntimeError(f"{type(self).__name__} is read-only.")
@@ -0,0 +1,48 @@
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.idempotency.entities import IdempotencyRecord
+from app.domain.entities.idempotency.repositories import IdempotencyRepository
+from app.infrastructure.db.models.idempotency_model import IdempotencyKeyModel
+from app.infrastructure.db.utils import register_mapper
+
+to_record = register_mapper(IdempotencyKeyModel, IdempotencyRecord)
+
+
+class SqlAlchemyIdempotencyRepository(IdempotencyRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, create_data: dict[str, Any]) -> IdempotencyRecord:
+        table = IdempotencyKeyModel.__table__
+        stmt = insert(table).values(**create_data).returning(*table.c)
+        result = await self.session.execute(stmt)
+        return to_record(result.one())
+
+    async def get(self, record_id: int) -> IdempotencyRecord | None:
+        table = IdempotencyKeyModel.__table__
+        result = await self.session.execute(
+            select(table).where(table.c.id == record_id)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return to_record(row)
+
+    async def get_by_key(self, key: str) -> IdempotencyRecord | None:
+        table = IdempotencyKeyModel.__table__
+        result = await self.session.execute(select(table).where(table.c.key == key))
+        row = result.first()
+        if row is None:
+            return None
+        return to_record(row)
+
+    async def delete_by_key(self, key: str) -> None:
+        table = IdempotencyKeyModel.__table__
+        await self.session.execute(delete(table).where(table.c.key == key))
+
+    async def update(self): ...  # noqa: E704
+
+    async def delete(self): ...  # noqa: E704
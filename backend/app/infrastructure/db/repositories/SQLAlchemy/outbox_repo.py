@@ -0,0 +1,152 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.outbox.entities import OutboxMessage, OutboxStatus
+from app.domain.entities.outbox.repositories import OutboxRepository
+from app.infrastructure.db.models.outbox_model import OutboxMessageModel
+from app.infrastructure.db.utils import normalize_datetime, register_mapper
+
+to_message = register_mapper(OutboxMessageModel, OutboxMessage)
+
+# Errors are stored for inspection only
+ERROR_MAX_LENGTH = 1000
+
+
+class SqlAlchemyOutboxRepository(OutboxRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create_many(self, messages: Sequence[dict[str, Any]]) -> None:
+        table = OutboxMessageModel.__table__
+        await self.session.execute(insert(table), list(messages))
+
+    async def claim(
+        self,
+        topics: Sequence[str],
+        *,
+        now: datetime,
+        claimed_until: datetime,
+        limit: int,
+    ) -> list[OutboxMessage]:
+        """
+        Claim up to `limit` due messages, oldest first, with a single
+        `UPDATE ... RETURNING` that pushes their `available_at` to
+        `claimed_until` and counts the attempt. Messages with an earlier
+        pending message of the same key are left for later.
+
+        On PostgreSQL rows locked by a concurrent dispatcher are skipped
+        (`FOR UPDATE SKIP LOCKED`). SQLite has no row locks: the UPDATE takes
+        its database write lock, so concurrent claims run one after the other
+        and each sees the previous one's `available_at`.
+        """
+        table = OutboxMessageModel.__table__
+        earlier = table.alias("earlier")
+        blocked = exists().where(
+            earlier.c.key == table.c.key,
+            earlier.c.id < table.c.id,
+            earlier.c.status == OutboxStatus.PENDING,
+        )
+        due = (
+            select(table.c.id)
+            .where(
+                table.c.status == OutboxStatus.PENDING,
+                table.c.available_at <= now.astimezone(UTC),
+                table.c.topic.in_(topics),
+                ~blocked,
+            )
+            .order_by(table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(table)
+            .where(table.c.id.in_(due))
+            .values(
+                available_at=claimed_until.astimezone(UTC),
+                attempts=table.c.attempts + 1,
+            )
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        return sorted((to_message(row) for row in result), key=lambda m: m.id)
+
+    async def delete_many(self, message_ids: Sequence[int]) -> None:
+        table = OutboxMessageModel.__table__
+        await self.session.execute(delete(table).where(table.c.id.in_(message_ids)))
+
+    async def reschedule(
+        self, message_id: int, *, available_at: datetime, error: str
+    ) -> None:
+        table = OutboxMessageModel.__table__
+        await self.session.execute(
+            update(table)
+            .where(table.c.id == message_id)
+            .values(
+                available_at=available_at.astimezone(UTC),
+                last_error=error[:ERROR_MAX_LENGTH],
+            )
+        )
+
+    async def mark_dead(self, message_id: int, *, error: str) -> None:
+        table = OutboxMessageModel.__table__
+        await self.session.execute(
+            update(table)
+            .where(table.c.id == message_id)
+            .values(status=OutboxStatus.DEAD, last_error=error[:ERROR_MAX_LENGTH])
+        )
+
+    async def get_backlog(self, *, now: datetime) -> dict[str, Any]:
+        """Message counts per status and topic, in one aggregate query."""
+        table = OutboxMessageModel.__table__
+        is_due = table.c.available_at <= now.astimezone(UTC)
+        stmt = select(
+            table.c.status,
+            table.c.topic,
+            func.count(),
+            func.count().filter(is_due),
+            func.min(table.c.created_at),
+        ).group_by(table.c.status, table.c.topic)
+        result = await self.session.execute(stmt)
+
+        backlog: dict[str, Any] = {
+            "pending": 0,
+            "due": 0,
+            "dead": 0,
+            "oldest_pending_at": None,
+            "topics": {},
+        }
+        for status, topic, count, due, oldest in result:
+            backlog[status] = backlog.get(status, 0) + count
+            topic_counts = backlog["topics"].setdefault(
+                topic, {"pending": 0, "dead": 0}
+            )
+            topic_counts[status] = count
+            if status == OutboxStatus.PENDING:
+                backlog["due"] += due
+                oldest = normalize_datetime(oldest)
+                if (
+                    backlog["oldest_pending_at"] is None
+                    or oldest < backlog["oldest_pending_at"]
+                ):
+                    backlog["oldest_pending_at"] = oldest
+        return backlog
+
+    async def get(self, message_id: int) -> OutboxMessage | None:
+        table = OutboxMessageModel.__table__
+        result = await self.session.execute(
+            select(table).where(table.c.id == message_id)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return to_message(row)
+
+    async def create(self): ...  # noqa: E704
+
+    async def update(self): ...  # noqa: E704
+
+    async def delete(self): ...  # noqa: E704
@@ -0,0 +1,513 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Select, bindparam, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.tickets.entities import (
+    Hold,
+    Reservation,
+    ReservationStatus,
+    TicketType,
+)
+from app.domain.entities.tickets.pricing import PricingInputs
+from app.domain.entities.tickets.repositories import (
+    HoldRepository,
+    ReservationRepository,
+    TicketTypeRepository,
+)
+from app.infrastructure.db.models.event_model import EventModel
+from app.infrastructure.db.models.ticket_model import (
+    HoldModel,
+    ReservationModel,
+    TicketTypeModel,
+    TicketTypeShardModel,
+)
+from app.infrastructure.db.utils import normalize_datetime, register_mapper
+
+to_ticket_type = register_mapper(TicketTypeModel, TicketType)
+to_hold = register_mapper(HoldModel, Hold)
+to_reservation = register_mapper(ReservationModel, Reservation)
+
+
+class SqlAlchemyTicketTypeRepository(TicketTypeRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _select() -> Select:
+        """
+        SELECT ticket types with `sold` as buyers see it: the row's own count
+        minus the stock still available on its shards.
+
+        Statements that return rows with `RETURNING` report the row's own count.
+        """
+        table = TicketTypeModel.__table__
+        shards = TicketTypeShardModel.__table__
+        shard_available = (
+            select(func.coalesce(func.sum(shards.c.available), 0))
+            .where(shards.c.ticket_type_id == table.c.id)
+            .scalar_subquery()
+        )
+        return select(
+            *(
+                (table.c.sold - shard_available).label("sold")
+                if column is table.c.sold
+                else column
+                for column in table.c
+            )
+        )
+
+    async def create(self, create_data: dict[str, Any]) -> TicketType:
+        table = TicketTypeModel.__table__
+        stmt = insert(table).values(**create_data).returning(*table.c)
+        result = await self.session.execute(stmt)
+        return to_ticket_type(result.one())
+
+    async def get(self, ticket_type_id: int) -> TicketType | None:
+        table = TicketTypeModel.__table__
+        stmt = self._select().where(table.c.id == ticket_type_id)
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_ticket_type(row)
+
+    async def get_event_id(self, ticket_type_id: int) -> int | None:
+        table = TicketTypeModel.__table__
+        stmt = select(table.c.event_id).where(table.c.id == ticket_type_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def list_for_event(self, event_id: int) -> list[TicketType]:
+        table = TicketTypeModel.__table__
+        stmt = self._select().where(table.c.event_id == event_id).order_by(table.c.id)
+        result = await self.session.execute(stmt)
+        return [to_ticket_type(row) for row in result]
+
+    async def get_pricing_inputs(
+        self,
+        event_ids: Sequence[int] | None,
+        *,
+        starts_after: datetime | None = None,
+    ) -> PricingInputs:
+        """
+        Load what pricing needs for the ticket types of `event_ids` (all events
+        when None), in one query. With `starts_after`, only events starting
+        later are included.
+        """
+        ticket_types = self._select().subquery()
+        events = EventModel.__table__
+        stmt = select(
+            ticket_types.c.id,
+            ticket_types.c.event_id,
+            ticket_types.c.price_cents,
+            ticket_types.c.capacity,
+            ticket_types.c.sold,
+            events.c.start_time,
+        ).join(events, events.c.id == ticket_types.c.event_id)
+        if starts_after is not None:
+            stmt = stmt.where(events.c.start_time > starts_after.astimezone(UTC))
+        if event_ids is not None:
+            stmt = stmt.where(ticket_types.c.event_id.in_(event_ids))
+
+        result = await self.session.execute(stmt)
+        return PricingInputs.from_rows(
+            (*row[:5], normalize_datetime(row[5])) for row in result
+        )
+
+    async def update(
+        self, ticket_type_id: int, update_data: dict[str, Any]
+    ) -> TicketType | None:
+        if not update_data:
+            return await self.get(ticket_type_id)
+
+        table = TicketTypeModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == ticket_type_id)
+            .values(**update_data)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_ticket_type(row)
+
+    async def reserve(self, ticket_type_id: int, quantity: int) -> TicketType | None:
+        """
+        Take `quantity` tickets with a single conditional
+        `UPDATE ... SET sold = sold + :n WHERE sold + :n <= capacity RETURNING`.
+
+        The check and the increment are one statement, so concurrent
+        reservations cannot oversell and the row is locked only for the rest of
+        the (short) transaction. Returns None when no row matched.
+        """
+        table = TicketTypeModel.__table__
+        stmt = (
+            update(table)
+            .where(
+                table.c.id == ticket_type_id,
+                table.c.sold + quantity <= table.c.capacity,
+            )
+            .values(sold=table.c.sold + quantity)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_ticket_type(row)
+
+    async def release(self, ticket_type_id: int, quantity: int) -> TicketType | None:
+        """Return `quantity` tickets with a single `UPDATE ... RETURNING`."""
+        table = TicketTypeModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == ticket_type_id, table.c.sold >= quantity)
+            .values(sold=table.c.sold - quantity)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_ticket_type(row)
+
+    async def release_many(self, quantities: dict[int, int]) -> None:
+        """
+        Return tickets to several ticket types, `{ticket_type_id: quantity}`, in
+        one executemany `UPDATE`.
+        """
+        if not quantities:
+            return
+
+        table = TicketTypeModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("ticket_type_id"))
+            .values(sold=table.c.sold - bindparam("quantity"))
+        )
+        # A fixed order keeps row locks from being taken in conflicting orders
+        params = [
+            {"ticket_type_id": ticket_type_id, "quantity": quantity}
+            for ticket_type_id, quantity in sorted(quantities.items())
+        ]
+        await self.session.execute(stmt, params)
+
+    async def enable_shards(
+        self, ticket_type_id: int, shards: int, *, min_per_shard: int = 1
+    ) -> bool:
+        """
+        Split the remaining stock of a ticket type across `shards` counters (see
+        `rebalance_shards`). Returns False when the ticket type does not exist or
+        is already sharded.
+        """
+        table = TicketTypeModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == ticket_type_id, table.c.shard_count == 0)
+            .values(shard_count=shards)
+            .returning(table.c.id)
+        )
+        result = await self.session.execute(stmt)
+        if result.first() is None:
+            return False
+
+        shard_table = TicketTypeShardModel.__table__
+        await self.session.execute(
+            insert(shard_table),
+            [
+                {"ticket_type_id": ticket_type_id, "shard": shard, "available": 0}
+                for shard in range(shards)
+            ],
+        )
+        await self.rebalance_shards(ticket_type_id, min_per_shard=min_per_shard)
+        return True
+
+    async def reserve_from_shard(
+        self, ticket_type_id: int, shard: int, quantity: int
+    ) -> bool:
+        """Take `quantity` tickets from one shard with a conditional UPDATE."""
+        shards = TicketTypeShardModel.__table__
+        stmt = (
+            update(shards)
+            .where(
+                shards.c.ticket_type_id == ticket_type_id,
+                shards.c.shard == shard,
+                shards.c.available >= quantity,
+            )
+            .values(available=shards.c.available - quantity)
+            .returning(shards.c.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def reserve_from_any_shard(self, ticket_type_id: int, quantity: int) -> bool:
+        """
+        Take `quantity` tickets from the fullest shard that has enough. On
+        PostgreSQL shards locked by concurrent purchases are skipped.
+        """
+        shards = TicketTypeShardModel.__table__
+        candidate = (
+            select(shards.c.id)
+            .where(
+                shards.c.ticket_type_id == ticket_type_id,
+                shards.c.available >= quantity,
+            )
+            .order_by(shards.c.available.desc())
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(shards)
+            .where(shards.c.id == candidate, shards.c.available >= quantity)
+            .values(available=shards.c.available - quantity)
+            .returning(shards.c.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def rebalance_shards(
+        self, ticket_type_id: int, *, min_per_shard: int = 1
+    ) -> list[int]:
+        """
+        Spread all remaining stock (the shards' plus any released back to the
+        ticket type row) evenly over the shards, using only as many shards as
+        can each get at least `min_per_shard` tickets. Locks the row and its
+        shards for the rest of the transaction. Returns the new per-shard
+        availability.
+        """
+        table = TicketTypeModel.__table__
+        shards = TicketTypeShardModel.__table__
+
+        stmt = (
+            select(table.c.capacity, table.c.sold, table.c.shard_count)
+            .where(table.c.id == ticket_type_id)
+            .with_for_update()
+        )
+        ticket_type = (await self.session.execute(stmt)).first()
+        if ticket_type is None or not ticket_type.shard_count:
+            return []
+
+        stmt = (
+            select(shards.c.available)
+            .where(shards.c.ticket_type_id == ticket_type_id)
+            .order_by(shards.c.shard)
+            .with_for_update()
+        )
+        on_shards = sum((await self.session.execute(stmt)).scalars())
+
+        total = ticket_type.capacity - ticket_type.sold + on_shards
+        # Near sell-out, stock is concentrated on fewer shards
+        stocked = min(ticket_type.shard_count, max(total // min_per_shard, 1))
+        per_shard, extra = divmod(total, stocked)
+        available = [
+            per_shard + (shard < extra) if shard < stocked else 0
+            for shard in range(ticket_type.shard_count)
+        ]
+
+        await self.session.execute(
+            update(table)
+            .where(table.c.id == ticket_type_id)
+            .values(sold=table.c.capacity)
+        )
+        await self.session.execute(
+            update(shards)
+            .where(
+                shards.c.ticket_type_id == ticket_type_id,
+                shards.c.shard == bindparam("b_shard"),
+            )
+            .values(available=bindparam("b_available")),
+            [
+                {"b_shard": shard, "b_available": value}
+                for shard, value in enumerate(available)
+            ],
+        )
+        return available
+
+    async def delete(self): ...  # noqa: E704
+
+
+class SqlAlchemyHoldRepository(HoldRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, create_data: dict[str, Any]) -> Hold:
+        table = HoldModel.__table__
+        stmt = insert(table).values(**create_data).returning(*table.c)
+        result = await self.session.execute(stmt)
+        return to_hold(result.one())
+
+    async def get(self, hold_id: int) -> Hold | None:
+        table = HoldModel.__table__
+        stmt = select(table).where(table.c.id == hold_id)
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_hold(row)
+
+    async def update(self, hold_id: int, update_data: dict[str, Any]) -> Hold | None:
+        if not update_data:
+            return await self.get(hold_id)
+
+        table = HoldModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == hold_id)
+            .values(**update_data)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_hold(row)
+
+    async def claim(self, hold_id: int, *, now: datetime) -> Hold | None:
+        """
+        Delete a hold that has not expired yet and return it. Returns None when
+        the hold is gone or expired; expired holds are left to the sweeper.
+        """
+        table = HoldModel.__table__
+        stmt = (
+            delete(table)
+            .where(
+                table.c.id == hold_id,
+                table.c.released_at.is_(None),
+                table.c.expires_at > now.astimezone(UTC),
+            )
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_hold(row)
+
+    async def release(self, hold_id: int) -> Hold | None:
+        """
+        Delete a hold, expired or not, and return it. Returns None when it is
+        gone or its tickets were already released by the sweeper.
+        """
+        table = HoldModel.__table__
+        stmt = (
+            delete(table)
+            .where(table.c.id == hold_id, table.c.released_at.is_(None))
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_hold(row)
+
+    async def release_expired(self, *, now: datetime, limit: int) -> list[Hold]:
+        """
+        Mark up to `limit` holds that expired at or before `now` as released,
+        oldest first, with a single `UPDATE ... RETURNING`.
+
+        On PostgreSQL rows locked by a concurrent sweeper or confirmation are
+        skipped rather than waited on.
+        """
+        table = HoldModel.__table__
+        now = now.astimezone(UTC)
+        expired = (
+            select(table.c.id)
+            .where(table.c.released_at.is_(None), table.c.expires_at <= now)
+            .order_by(table.c.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(table)
+            .where(table.c.id.in_(expired))
+            .values(released_at=now)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        return [to_hold(row) for row in result]
+
+    async def purge_released(self, *, before: datetime, limit: int) -> int:
+        """Delete up to `limit` holds released before `before`. Returns the count."""
+        table = HoldModel.__table__
+        released = (
+            select(table.c.id)
+            .where(table.c.released_at <= before.astimezone(UTC))
+            .order_by(table.c.released_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            delete(table).where(table.c.id.in_(released))
+        )
+        return result.rowcount
+
+    async def delete(self): ...  # noqa: E704
+
+
+class SqlAlchemyReservationRepository(ReservationRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, create_data: dict[str, Any]) -> Reservation:
+        table = ReservationModel.__table__
+        stmt = insert(table).values(**create_data).returning(*table.c)
+        result = await self.session.execute(stmt)
+        return to_reservation(result.one())
+
+    async def get(self, reservation_id: int) -> Reservation | None:
+        table = ReservationModel.__table__
+        stmt = select(table).where(table.c.id == reservation_id)
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_reservation(row)
+
+    async def update(
+        self, reservation_id: int, update_data: dict[str, Any]
+    ) -> Reservation | None:
+        if not update_data:
+            return await self.get(reservation_id)
+
+        table = ReservationModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == reservation_id)
+            .values(**update_data)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_reservation(row)
+
+    async def cancel(self, reservation_id: int) -> Reservation | None:
+        """
+        Move a reservation from `reserved` to `cancelled`. The status check is
+        part of the UPDATE, so a reservation is cancelled (and its tickets
+        released) at most once.
+        """
+        table = ReservationModel.__table__
+        stmt = (
+            update(table)
+            .where(
+                table.c.id == reservation_id,
+                table.c.status == ReservationStatus.RESERVED,
+            )
+            .values(status=ReservationStatus.CANCELLED)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return to_reservation(row)
+
+    async def delete(self): ...  # noqa: E704
@@ -1,21 +1,111 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 from app.infrastructure.db.models.base import ModelBase
+from app.infrastructure.db.pool import InstrumentedAsyncAdaptedQueuePool
+
+
+def engine_options() -> dict[str, Any]:
+    """`create_async_engine` keyword arguments derived from settings."""
+    return {
+        "echo": settings.DATABASE_ECHO,
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": {
+            # SQLAlchemy's asyncpg adapter prepares statements itself, so its
+            # cache is the one that matters; asyncpg's own cache follows suit.
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    }
+
+
+class Database:
+    """
+    The primary engine, the optional replica engine and their session
+    factories, created on first use rather than at import time.
+
+    The application lifespan creates them at startup (`start`) and disposes
+    of them at shutdown (`dispose`); scripts and tests that never start the
+    app get them whenever a session is first opened.
+    """
+
+    def __init__(self) -> None:
+        self._engine: AsyncEngine | None = None
+        self._replica_engine: AsyncEngine | None = None
+        self._session_factory: sessionmaker | None = None
+        self._read_session_factory: sessionmaker | None = None
+
+    def start(self) -> None:
+        """Create the engines; no connection is opened until a session needs one."""
+        if self._engine is not None:
+            return
+        self._engine = create_async_engine(
+            str(settings.DATABASE_URI), **engine_options()
+        )
+        if settings.REPLICA_DATABASE_URI:
+            self._replica_engine = create_async_engine(
+                str(settings.REPLICA_DATABASE_URI), **engine_options()
+            )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        self.start()
+        return self._engine
+
+    @property
+    def replica_engine(self) -> AsyncEngine | None:
+        self.start()
+        return self._replica_engine
+
+    def session(self) -> AsyncSession:
+        """Open a session on the primary."""
+        if self._session_factory is None:
+            self._session_factory = sessionmaker(
+                bind=self.engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+        return self._session_factory()
+
+    def read_session(self) -> AsyncSession:
+        """
+        Open a session for read-only use cases: on the replica when configured,
+        else on the primary. Transactions are started read-only (ignored by
+        non-PostgreSQL dialects).
+        """
+        if self._read_session_factory is None:
+            bind = self.replica_engine or self.engine
+            self._read_session_factory = sessionmaker(
+                bind=bind.execution_options(postgresql_readonly=True),
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+        return self._read_session_factory()
+
+    async def dispose(self) -> None:
+        """Close all pooled connections; engines are created anew on next use."""
+        for engine in (self._engine, self._replica_engine):
+            if engine is not None:
+                await engine.dispose()
+        self._engine = self._replica_engine = None
+        self._session_factory = self._read_session_factory = None
+
 
-async_engine = create_async_engine(
-    str(settings.DATABASE_URI),
-    echo=settings.DATABASE_ECHO,
-)
+database = Database()
 
-AsyncSessionLocal = sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+# Session factories for the use case factories; each call opens a session
+AsyncSessionLocal = database.session
+AsyncReadSessionLocal = database.read_session
 
 
 async def init_db() -> None:
-    async with async_engine.begin() as conn:
+    async with database.engine.begin() as conn:
         await conn.run_sync(ModelBase.metadata.create_all)
@@ -1,26 +1,91 @@
+from dataclasses import fields
 from datetime import datetime
-from typing import Any
+from operator import attrgetter
+from typing import Any, Generic, TypeVar
 
+from sqlalchemy import DateTime
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
 
+T = TypeVar("T")
+
+
+def normalize_datetime(value: datetime | None) -> datetime | None:
+    """Make a database timestamp aware, in `settings.DEFAULT_TIMEZONE`."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=settings.DEFAULT_TIMEZONE)
+    return value.astimezone(settings.DEFAULT_TIMEZONE)
+
+
+class EntityMapper(Generic[T]):  # noqa
+    """
+    Precompiled converter from a SQLAlchemy model (or a Core row selecting its
+    columns) to a dataclass.
+
+    The column lookup is done once: conversion is a single attribute-getter call
+    plus timezone normalization of the precomputed datetime positions.
+    """
+
+    __slots__ = ("model", "dc_type", "keys", "_getter", "_datetime_positions")
+
+    def __init__(self, model: type[DeclarativeBase], dc_type: type[T]) -> None:
+        columns = {col.key: col for col in inspect(model).mapper.column_attrs}
+
+        # Follow dataclass field order so values can be passed positionally
+        keys = tuple(f.name for f in fields(dc_type) if f.init)  # type: ignore[arg-type]
+        missing = [key for key in keys if key not in columns]
+        if missing:
+            raise TypeError(
+                f"{dc_type.__name__} fields {missing} are not columns of "
+                f"{model.__name__}."
+            )
+
+        self.model = model
+        self.dc_type = dc_type
+        self.keys = keys
+        self._getter = attrgetter(*keys)
+        self._datetime_positions = tuple(
+            i
+            for i, key in enumerate(keys)
+            if isinstance(columns[key].columns[0].type, DateTime)
+        )
+
+    def __call__(self, obj: Any) -> T:
+        values = self._getter(obj)
+        if len(self.keys) == 1:
+            values = (values,)
+
+        if self._datetime_positions:
+            values = list(values)
+            for i in self._datetime_positions:
+                values[i] = normalize_datetime(values[i])
+
+        return self.dc_type(*values)
+
+
+_MAPPERS: dict[tuple[type, type], EntityMapper] = {}
+
+
+def register_mapper[M](
+    model: type[DeclarativeBase], dc_type: type[M]
+) -> EntityMapper[M]:
+    """
+    Compile and register the mapper for a (model, dataclass) pair.
+    Repositories call this at import time.
+    """
+    mapper = _MAPPERS.get((model, dc_type))
+    if mapper is None:
+        mapper = _MAPPERS[(model, dc_type)] = EntityMapper(model, dc_type)
+    return mapper
+
 
 def from_orm(orm_obj: DeclarativeBase, dc_type: Any) -> Any:
     """
     Convert SQLAlchemy ORM model -> dataclass instance.
     Extract only DB columns, ignore anything extra.
     """
-    data = {}
-    for col in inspect(orm_obj).mapper.column_attrs:
-        key = col.key
-        value = getattr(orm_obj, key)
-
-        if isinstance(value, datetime):
-            if value.tzinfo is None:
-                value = value.replace(tzinfo=settings.DEFAULT_TIMEZONE)
-            else:
-                value = value.astimezone(settings.DEFAULT_TIMEZONE)
-        data[key] = value
-    return dc_type(**data)
+    return register_mapper(type(orm_obj), dc_type)(orm_obj)
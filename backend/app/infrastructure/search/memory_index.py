@@ -0,0 +1,151 @@
+import heapq
+import math
+import re
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from app.domain.abc.search_index import SearchIndex
+
+_TOKEN = re.compile(r"\w+")
+
+# BM25 term frequency saturation
+_K1 = 1.2
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens, as PostgreSQL's `simple` configuration does."""
+    return _TOKEN.findall(text.lower())
+
+
+class InMemorySearchIndex(SearchIndex):
+    """
+    Process-local inverted index.
+
+    Each term maps to the documents containing it and their weighted term
+    frequency: the sum of the weights of the fields the term appears in, per
+    occurrence. Weights are small integers so that postings share Python's
+    cached int objects. Scores are BM25 over those frequencies, without length
+    normalization (fields are short).
+
+    A query intersects the postings of its terms, shortest first, and scores
+    only the documents in the intersection; documents with the same weighted
+    frequencies share a score, computed once. The index is not shared between
+    processes: run a single worker, or use a shared backend.
+
+    Usage:
+        >>> index = InMemorySearchIndex(weights={"title": 10, "venue": 4})
+        >>> await index.add(1, {"title": "Jazz night", "venue": "Cebu"}, version=now)
+        >>> await index.search("jazz", after=None, limit=10)
+        [(1, 0.56...)]
+    """
+
+    def __init__(self, weights: Mapping[str, int]) -> None:
+        self.weights = dict(weights)
+        # term -> {doc_id: weighted term frequency}
+        self._postings: dict[str, dict[int, int]] = {}
+        # doc_id -> its terms, to unindex it on update
+        self._doc_terms: dict[int, tuple[str, ...]] = {}
+        self._versions: dict[int, datetime] = {}
+        self._queries = 0
+        self._candidates_scored = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    async def add(
+        self, doc_id: int, fields: Mapping[str, str], *, version: datetime
+    ) -> None:
+        current = self._versions.get(doc_id)
+        if current is not None and version < current:
+            return
+        self._versions[doc_id] = version
+
+        frequencies: Counter[str] = Counter()
+        for name, weight in self.weights.items():
+            for term in tokenize(fields.get(name) or ""):
+                # One string object per term, however many documents hold it
+                frequencies[sys.intern(term)] += weight
+
+        for term in self._doc_terms.get(doc_id, ()):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+            postings[doc_id] = frequency
+        self._doc_terms[doc_id] = tuple(frequencies)
+
+    async def search(
+        self, query: str, *, after: tuple[float, int] | None, limit: int
+    ) -> list[tuple[int, float]]:
+        self._queries += 1
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        postings = [self._postings.get(term) for term in terms]
+        if not all(postings):
+            return []
+        postings.sort(key=len)
+
+        total = len(self._doc_terms)
+        idfs = [
+            math.log(1.0 + (total - len(p) + 0.5) / (len(p) + 0.5)) for p in postings
+        ]
+
+        # Weighted frequencies take few distinct values, so candidates are
+        # grouped by them and each group is scored once
+        groups: dict[tuple[int, ...], list[int]] = defaultdict(list)
+        if len(postings) == 1:
+            for doc_id, frequency in postings[0].items():
+                groups[(frequency,)].append(doc_id)
+        else:
+            candidates = postings[0].keys()
+            for other in postings[1:]:
+                candidates = candidates & other.keys()
+            for doc_id in candidates:
+                groups[tuple([p[doc_id] for p in postings])].append(doc_id)
+        self._candidates_scored += sum(map(len, groups.values()))
+
+        by_score: dict[float, list[int]] = defaultdict(list)
+        for frequencies, doc_ids in groups.items():
+            score = sum(
+                idf * tf * (_K1 + 1) / (tf + _K1)
+                for tf, idf in zip(frequencies, idfs, strict=True)
+            )
+            by_score[score].extend(doc_ids)
+
+        # Best score first, then by id, resuming after the `(score, id)` keyset
+        results: list[tuple[int, float]] = []
+        for score in sorted(by_score, reverse=True):
+            doc_ids = by_score[score]
+            if after is not None:
+                if score > after[0]:
+                    continue
+                if score == after[0]:
+                    doc_ids = [doc_id for doc_id in doc_ids if doc_id > after[1]]
+            for doc_id in heapq.nsmallest(limit - len(results), doc_ids):
+                results.append((doc_id, score))
+            if len(results) == limit:
+                break
+        return results
+
+    async def clear(self) -> None:
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._versions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "memory",
+            "documents": len(self._doc_terms),
+            "terms": len(self._postings),
+            "queries": self._queries,
+            "candidates_scored": self._candidates_scored,
+        }
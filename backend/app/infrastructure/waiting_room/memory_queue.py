@@ -0,0 +1,97 @@
+import heapq
+from typing import Any
+
+from app.domain.abc.admission_queue import AdmissionQueue
+
+
+class _QueueState:
+    __slots__ = ("issued", "admitted", "updated_at")
+
+    def __init__(self, now: float, burst: int) -> None:
+        self.issued = 0
+        # A new queue has been quiet: its burst is already banked
+        self.admitted = float(burst)
+        self.updated_at = now
+
+
+class InMemoryAdmissionQueue(AdmissionQueue):
+    """
+    Process-local admission queues.
+
+    A queue is three numbers, whatever the number of waiting clients. Claimed
+    positions are kept only until their tokens expire. State is not shared
+    between processes: run a single worker, or use a shared backend.
+
+    Usage:
+        >>> queue = InMemoryAdmissionQueue()
+        >>> position = await queue.join("event:1", rate=50, burst=100, now=now)
+        >>> await queue.admitted("event:1", rate=50, burst=100, now=now) >= position
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[str, _QueueState] = {}
+        # key -> {claimed position: (owner, expires_at)}
+        self._claimed: dict[str, dict[int, tuple[str | None, float]]] = {}
+        # (expires_at, key, position) of every claim, soonest to expire first
+        self._expiries: list[tuple[float, str, int]] = []
+
+    def _advance(self, key: str, rate: float, burst: int, now: float) -> _QueueState:
+        state = self._queues.get(key)
+        if state is None:
+            state = self._queues[key] = _QueueState(now, burst)
+
+        elapsed = max(now - state.updated_at, 0.0)
+        state.admitted = min(state.admitted + elapsed * rate, state.issued + burst)
+        state.updated_at = now
+        return state
+
+    async def join(self, key: str, *, rate: float, burst: int, now: float) -> int:
+        state = self._advance(key, rate, burst, now)
+        state.issued += 1
+        return state.issued
+
+    async def admitted(self, key: str, *, rate: float, burst: int, now: float) -> float:
+        return self._advance(key, rate, burst, now).admitted
+
+    async def claim(
+        self,
+        key: str,
+        position: int,
+        owner: str | None = None,
+        *,
+        expires_at: float,
+        now: float,
+    ) -> bool:
+        self._prune(now)
+        claimed = self._claimed.setdefault(key, {})
+        if position in claimed:
+            return owner is not None and claimed[position][0] == owner
+        claimed[position] = (owner, expires_at)
+        heapq.heappush(self._expiries, (expires_at, key, position))
+        return True
+
+    async def release(self, key: str, position: int) -> None:
+        claimed = self._claimed.get(key)
+        if claimed is not None:
+            claimed.pop(position, None)
+            if not claimed:
+                del self._claimed[key]
+
+    def _prune(self, now: float) -> None:
+        """Forget the claims whose tokens have expired by `now`."""
+        while self._expiries and self._expiries[0][0] < now:
+            expires_at, key, position = heapq.heappop(self._expiries)
+            claimed = self._claimed.get(key)
+            # Skip entries left behind by a release (and a later claim)
+            if claimed is None or claimed.get(position, (None, None))[1] != expires_at:
+                continue
+            del claimed[position]
+            if not claimed:
+                del self._claimed[key]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "queues": len(self._queues),
+            "issued": sum(state.issued for state in self._queues.values()),
+            "claimed": sum(len(claimed) for claimed in self._claimed.values()),
+        }
@@ -1,18 +1,46 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from uvicorn import run
 
-from app.api.routes import api_v1_router
+from app.api.routes import include_api_v1
+from app.application.use_cases import EventUseCases, hold_sweeper, outbox_dispatcher
 from app.core.config import settings
-from app.core.logging import setup_logging
+from app.core.logging import get_logger, setup_logging
+from app.infrastructure.db.session import database
 
 setup_logging()
+logger = get_logger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Created here rather than at import, which keeps imports (and the
+    # workers' cold starts) cheap
+    database.start()
+    async with EventUseCases.rebuild_search_index() as use_case:
+        indexed = await use_case.execute(settings.SEARCH_INDEX_REBUILD_BATCH_SIZE)
+    if indexed:
+        logger.info("Indexed %d events for search", indexed)
+    if settings.HOLD_SWEEPER_ENABLED:
+        hold_sweeper.start()
+    if settings.OUTBOX_DISPATCHER_ENABLED:
+        outbox_dispatcher.start()
+    try:
+        yield
+    finally:
+        await outbox_dispatcher.stop()
+        await hold_sweeper.stop()
+        await database.dispose()
 
 
 api = FastAPI(
     title=settings.PROJECT_NAME,
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
-api.include_router(api_v1_router)
+include_api_v1(api)
 
 
 if __name__ == "__main__":
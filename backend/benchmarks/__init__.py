@@ -0,0 +1,4 @@
+import logging
+
+# httpx logs every request at INFO, which drowns benchmark output
+logging.getLogger("httpx").setLevel(logging.WARNING)
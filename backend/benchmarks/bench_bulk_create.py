@@ -0,0 +1,67 @@
+"""
+Compare creating 1,000 events one POST at a time with a single bulk POST.
+
+Usage (from ./backend):
+    python -m benchmarks.bench_bulk_create
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from httpx import ASGITransport, AsyncClient
+
+from app.application.use_cases import EventUseCases
+from app.main import api
+from benchmarks.utils import (
+    async_best_of,
+    bench_session_factory,
+    bind_use_cases,
+    report,
+)
+
+EVENTS = 1_000
+
+
+def make_events(n: int) -> list[dict]:
+    start_time = (datetime.now(UTC) + timedelta(weeks=4)).isoformat()
+    return [
+        {
+            "title": f"Event {i}",
+            "description": "Benchmark event",
+            "event_type": "concert",
+            "venue": "Cebu City",
+            "capacity": 100,
+            "start_time": start_time,
+        }
+        for i in range(n)
+    ]
+
+
+async def main() -> None:
+    events = make_events(EVENTS)
+
+    async with bench_session_factory() as session_factory:
+        bind_use_cases(EventUseCases, session_factory)
+        transport = ASGITransport(app=api)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def single_creates() -> None:
+                for item in events:
+                    resp = await client.post("/api/v1/events/", json=item)
+                    resp.raise_for_status()
+
+            async def bulk_create() -> None:
+                resp = await client.post("/api/v1/events/bulk", json=events)
+                resp.raise_for_status()
+                assert resp.json()["created"] == EVENTS
+
+            results = {
+                "single creates": await async_best_of(single_creates, repeat=3),
+                "bulk create": await async_best_of(bulk_create, repeat=3),
+            }
+
+    report(f"Create {EVENTS:,} events", results, baseline="single creates")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
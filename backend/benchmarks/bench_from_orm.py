@@ -0,0 +1,73 @@
+"""
+Compare ORM -> entity conversion strategies on 10k rows.
+
+Usage (from ./backend):
+    python -m benchmarks.bench_from_orm
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.inspection import inspect
+
+from app.core.config import settings
+from app.domain.entities.events.entities import Event
+from app.infrastructure.db.models.event_model import EventModel
+from app.infrastructure.db.utils import register_mapper
+from benchmarks.utils import best_of, report
+
+ROWS = 10_000
+
+
+def legacy_from_orm(orm_obj: Any, dc_type: Any) -> Any:
+    """The per-row `inspect()` implementation the mapper registry replaced."""
+    data = {}
+    for col in inspect(orm_obj).mapper.column_attrs:
+        key = col.key
+        value = getattr(orm_obj, key)
+
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=settings.DEFAULT_TIMEZONE)
+            else:
+                value = value.astimezone(settings.DEFAULT_TIMEZONE)
+        data[key] = value
+    return dc_type(**data)
+
+
+def make_rows(n: int) -> list[EventModel]:
+    now = datetime.now(UTC)
+    return [
+        EventModel(
+            id=i,
+            title=f"Event {i}",
+            description="Benchmark event",
+            event_type="concert",
+            venue="Cebu City",
+            capacity=100,
+            start_time=now + timedelta(days=i),
+            created_at=now.replace(tzinfo=None),
+            updated_at=now.replace(tzinfo=None),
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    rows = make_rows(ROWS)
+    to_event = register_mapper(EventModel, Event)
+    assert [legacy_from_orm(r, Event) for r in rows[:10]] == [
+        to_event(r) for r in rows[:10]
+    ]
+
+    results = {
+        "legacy from_orm": best_of(lambda: [legacy_from_orm(r, Event) for r in rows]),
+        "compiled mapper": best_of(lambda: [to_event(r) for r in rows]),
+    }
+    report(
+        f"ORM -> Event conversion ({ROWS:,} rows)", results, baseline="legacy from_orm"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Measure reservation throughput on one hot ticket type, unsharded and with
+1 and 16 inventory shards.
+
+Row-lock contention only shows on a server with row-level locking: run it
+against a scratch PostgreSQL database via BENCH_DATABASE_URL. SQLite locks the
+whole database per write, so there sharding can only add overhead.
+
+Usage (from ./backend):
+    python -m benchmarks.bench_inventory_shards
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+from app.application.use_cases import TicketUseCases
+from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventRepository,
+)
+from app.infrastructure.db.repositories.sqlalchemy.ticket_repo import (
+    SqlAlchemyTicketTypeRepository,
+)
+from benchmarks.utils import (
+    bench_session_factory,
+    bind_use_cases,
+    concurrent_database_url,
+    percentiles,
+)
+
+SHARDS = (0, 1, 16)
+CONCURRENCY = 64
+RESERVATIONS = 5_000
+
+
+async def create_ticket_type(session_factory, shards: int) -> int:
+    """A ticket type with stock for every reservation, so none fail."""
+    async with session_factory() as session:
+        event = await SqlAlchemyEventRepository(session).create(
+            {
+                "title": "On sale",
+                "description": "Benchmark event",
+                "event_type": "concert",
+                "venue": "Cebu City",
+                "capacity": RESERVATIONS,
+                "start_time": datetime.now(UTC) + timedelta(weeks=4),
+            }
+        )
+        repo = SqlAlchemyTicketTypeRepository(session)
+        ticket_type = await repo.create(
+            {
+                "event_id": event.id,
+                "name": "General Admission",
+                "price_cents": 1000,
+                "capacity": RESERVATIONS,
+            }
+        )
+        if shards:
+            await repo.enable_shards(ticket_type.id, shards)
+        await session.commit()
+    return ticket_type.id
+
+
+async def run_load(ticket_type_id: int) -> list[float]:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies: list[float] = []
+
+    async def reserve() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            async with TicketUseCases.reserve_tickets() as use_case:
+                await use_case.execute(ticket_type_id, 1)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(reserve() for _ in range(RESERVATIONS)))
+    return latencies
+
+
+async def main() -> None:
+    url = concurrent_database_url()
+    print(f"Reserve 1 ticket ({RESERVATIONS:,} requests, concurrency {CONCURRENCY})")
+    print(f"  {'shards':<10} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+
+    # SQLite's busy handler is not fair; don't fail starved writers after 5s
+    connect_args = {"timeout": 60} if url.startswith("sqlite") else {}
+    async with bench_session_factory(
+        url, pool_size=CONCURRENCY, max_overflow=0, connect_args=connect_args
+    ) as session_factory:
+        bind_use_cases(TicketUseCases, session_factory)
+
+        for shards in SHARDS:
+            ticket_type_id = await create_ticket_type(session_factory, shards)
+
+            start = time.perf_counter()
+            latencies = await run_load(ticket_type_id)
+            elapsed = time.perf_counter() - start
+
+            cuts = percentiles(latencies)
+            label = str(shards) if shards else "unsharded"
+            print(
+                f"  {label:<10} {RESERVATIONS / elapsed:>8.0f}"
+                f" {cuts['p50'] * 1000:>8.2f} {cuts['p95'] * 1000:>8.2f}"
+                f" {cuts['p99'] * 1000:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+Load test the list endpoint at several connection pool sizes.
+
+Runs against BENCH_DATABASE_URL (use a scratch PostgreSQL database for
+meaningful numbers). The in-memory SQLite default cannot be pooled, so a
+temporary SQLite file is used instead.
+
+Usage (from ./backend):
+    python -m benchmarks.bench_pool_sizes
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+from app.application.use_cases import EventUseCases
+from app.infrastructure.db.models.event_model import EventModel
+from app.infrastructure.db.pool import pool_stats
+from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventRepository,
+)
+from app.infrastructure.db.session import engine_options
+from app.main import api
+from benchmarks.utils import (
+    bench_session_factory,
+    bind_use_cases,
+    concurrent_database_url,
+    percentiles,
+)
+
+POOL_SIZES = (1, 5, 10, 20)
+CONCURRENCY = 50
+REQUESTS = 1_000
+SEED_EVENTS = 1_000
+
+
+async def seed(session_factory) -> None:
+    async with session_factory() as session:
+        if await session.scalar(select(func.count()).select_from(EventModel)):
+            return
+        start_time = datetime.now(UTC) + timedelta(weeks=4)
+        await SqlAlchemyEventRepository(session).create_many(
+            [
+                {
+                    "title": f"Event {i}",
+                    "description": "Benchmark event",
+                    "event_type": "concert",
+                    "venue": "Cebu City",
+                    "capacity": 100,
+                    "start_time": start_time + timedelta(minutes=i),
+                }
+                for i in range(SEED_EVENTS)
+            ]
+        )
+        await session.commit()
+
+
+async def run_load(client: AsyncClient) -> list[float]:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies: list[float] = []
+
+    async def request(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            resp = await client.get(
+                "/api/v1/events/", params={"page": i % 50 + 1, "page_size": 20}
+            )
+            resp.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(request(i) for i in range(REQUESTS)))
+    return latencies
+
+
+async def main() -> None:
+    url = concurrent_database_url()
+    options = engine_options()
+    if url.startswith("sqlite"):
+        # asyncpg-only arguments
+        options.pop("connect_args")
+
+    print(f"GET /api/v1/events ({REQUESTS:,} requests, concurrency {CONCURRENCY})")
+    print(
+        f"  {'pool':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8}"
+        f" {'avg wait ms':>12} {'max wait ms':>12}"
+    )
+
+    for pool_size in POOL_SIZES:
+        options.update(pool_size=pool_size, max_overflow=0)
+        async with bench_session_factory(url, **options) as session_factory:
+            await seed(session_factory)
+            bind_use_cases(EventUseCases, session_factory)
+            engine = session_factory.kw["bind"]
+
+            transport = ASGITransport(app=api)
+            async with AsyncClient(
+                transport=transport, base_url="http://bench"
+            ) as client:
+                start = time.perf_counter()
+                latencies = await run_load(client)
+                elapsed = time.perf_counter() - start
+
+            cuts = percentiles(latencies)
+            stats = pool_stats(engine.pool)
+            print(
+                f"  {pool_size:>4} {cuts['p50'] * 1000:>8.2f}"
+                f" {cuts['p95'] * 1000:>8.2f} {cuts['p99'] * 1000:>8.2f}"
+                f" {REQUESTS / elapsed:>8.0f}"
+                f" {stats['avg_wait_ms']:>12.2f} {stats['max_wait_ms']:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
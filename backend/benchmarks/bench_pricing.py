@@ -0,0 +1,121 @@
+"""
+Reprice 1M ticket types: a per-ticket-type Python loop against the vectorized
+`compute_prices`, plus the full `price_events` pass that also groups prices
+per event (4 ticket types per event).
+
+Usage (from ./backend):
+    python -m benchmarks.bench_pricing
+"""
+
+import math
+import time
+
+import numpy as np
+
+from app.domain.entities.tickets.pricing import (
+    SECONDS_PER_DAY,
+    PricingInputs,
+    PricingPolicy,
+    compute_prices,
+    price_events,
+)
+from benchmarks.utils import best_of, report
+
+TICKET_TYPES = 1_000_000
+TICKET_TYPES_PER_EVENT = 4
+LOOKUPS = 100_000
+
+
+def python_price(
+    base: int, capacity: int, sold: int, seconds_to_start: float, p: PricingPolicy
+) -> int:
+    """The same formula one ticket type at a time, as a loop over rows would."""
+    sell_through = min(max(sold / capacity, 0.0), 1.0) if capacity > 0 else 1.0
+    elapsed = min(max(1.0 - seconds_to_start / p.urgency_window_seconds, 0.0), 1.0)
+    multiplier = min(
+        max(
+            1.0
+            + p.demand_markup * sell_through**p.demand_exponent
+            + p.urgency_markup * elapsed,
+            p.min_multiplier,
+        ),
+        p.max_multiplier,
+    )
+    step = p.rounding_cents
+    return int(base + math.ceil(round(base * (multiplier - 1.0) / step, 6)) * step)
+
+
+def make_inputs(n: int, now: float) -> PricingInputs:
+    rng = np.random.default_rng(0)
+    capacity = rng.integers(50, 5_000, n)
+    return PricingInputs(
+        ticket_type_ids=np.arange(1, n + 1),
+        event_ids=rng.permutation(np.arange(n) // TICKET_TYPES_PER_EVENT),
+        base_cents=rng.integers(10, 500, n) * 100,
+        capacity=capacity,
+        sold=(capacity * rng.random(n)).astype(np.int64),
+        start_ts=now + rng.uniform(-SECONDS_PER_DAY, 60 * SECONDS_PER_DAY, n),
+    )
+
+
+def main() -> None:
+    policy = PricingPolicy()
+    now = time.time()
+    inputs = make_inputs(TICKET_TYPES, now)
+    seconds_to_start = inputs.start_ts - now
+    rows = list(
+        zip(
+            inputs.base_cents.tolist(),
+            inputs.capacity.tolist(),
+            inputs.sold.tolist(),
+            seconds_to_start.tolist(),
+            strict=True,
+        )
+    )
+
+    vectorized = compute_prices(
+        inputs.base_cents, inputs.capacity, inputs.sold, seconds_to_start, policy
+    )
+    assert [python_price(*row, policy) for row in rows[:1000]] == (
+        vectorized[:1000].tolist()
+    )
+
+    results = {
+        "python loop": best_of(
+            lambda: [python_price(*row, policy) for row in rows], repeat=1
+        ),
+        "compute_prices": best_of(
+            lambda: compute_prices(
+                inputs.base_cents,
+                inputs.capacity,
+                inputs.sold,
+                seconds_to_start,
+                policy,
+            )
+        ),
+        "price_events (grouped)": best_of(
+            lambda: price_events(inputs, policy, now=now), repeat=3
+        ),
+    }
+    report(f"Repricing {TICKET_TYPES:,} ticket types", results, baseline="python loop")
+
+    # Purchase-path lookups against the per-event results
+    by_event = {
+        prices.event_id: prices for prices in price_events(inputs, policy, now=now)
+    }
+    rng = np.random.default_rng(1)
+    picks = [
+        (int(inputs.event_ids[row]), int(inputs.ticket_type_ids[row]))
+        for row in rng.integers(0, TICKET_TYPES, LOOKUPS)
+    ]
+    seconds = best_of(
+        lambda: [
+            by_event[event_id].price_of(ticket_type_id)
+            for event_id, ticket_type_id in picks
+        ]
+    )
+    print(f"  {'price lookup':<24} {seconds / LOOKUPS * 1e9:>10.0f} ns each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Search 1M events through `InMemorySearchIndex`, the backend used when the
+database has no full-text search (SQLite), against a linear scan of the same
+events. Reports the latency percentiles of selective queries (a rare word),
+common ones (two frequent words) and of their second page.
+
+PostgreSQL searches its GIN-indexed `search_vector` column instead; benchmark
+it with `EXPLAIN ANALYZE` against a loaded database.
+
+Usage (from ./backend):
+    python -m benchmarks.bench_search
+"""
+
+import asyncio
+import random
+import time
+from datetime import UTC, datetime
+
+from app.application.use_cases import search_index
+from app.infrastructure.search.memory_index import InMemorySearchIndex, tokenize
+from benchmarks.utils import percentiles
+
+EVENTS = 1_000_000
+QUERIES = 200
+SCAN_QUERIES = 5
+PAGE_SIZE = 10
+
+EVENT_TYPES = ["concert", "conference", "festival", "market", "sports", "theater"]
+CITIES = [f"city{n}" for n in range(500)]
+# Zipf-like vocabulary: a few very common words and a long tail of rare ones
+VOCABULARY = [f"word{n}" for n in range(50_000)]
+VOCABULARY_WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def make_events(n: int) -> list[dict[str, str]]:
+    rng = random.Random(0)
+    words = rng.choices(VOCABULARY, VOCABULARY_WEIGHTS, k=n * 7)
+    return [
+        {
+            "title": " ".join(words[i * 7 : i * 7 + 3]),
+            "event_type": rng.choice(EVENT_TYPES),
+            "venue": f"{rng.choice(CITIES)} arena",
+            "description": " ".join(words[i * 7 + 3 : i * 7 + 7]),
+        }
+        for i in range(n)
+    ]
+
+
+def linear_scan(events: list[dict[str, str]], query: str) -> list[int]:
+    """What searching without an index costs: tokenize every event."""
+    terms = set(tokenize(query))
+    return [
+        doc_id
+        for doc_id, fields in enumerate(events, start=1)
+        if terms <= set(tokenize(" ".join(fields.values())))
+    ][:PAGE_SIZE]
+
+
+async def measure(index: InMemorySearchIndex, queries: list[str], *, page: int):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        results = await index.search(query, after=None, limit=PAGE_SIZE + 1)
+        for _ in range(page - 1):
+            if len(results) <= PAGE_SIZE:
+                break
+            doc_id, score = results[PAGE_SIZE - 1]
+            results = await index.search(
+                query, after=(score, doc_id), limit=PAGE_SIZE + 1
+            )
+        timings.append(time.perf_counter() - start)
+    return percentiles(timings)
+
+
+def print_percentiles(name: str, cuts: dict[str, float]) -> None:
+    values = "  ".join(f"{key} {value * 1000:>8.3f} ms" for key, value in cuts.items())
+    print(f"  {name:<28} {values}")
+
+
+async def main() -> None:
+    events = make_events(EVENTS)
+    index = InMemorySearchIndex(weights=search_index.weights)
+    now = datetime.now(UTC)
+
+    start = time.perf_counter()
+    for doc_id, fields in enumerate(events, start=1):
+        await index.add(doc_id, fields, version=now)
+    print(f"Indexed {EVENTS:,} events in {time.perf_counter() - start:.1f} s")
+    print(f"  {index.stats()}")
+
+    rng = random.Random(1)
+    selective = [rng.choice(VOCABULARY[10_000:]) for _ in range(QUERIES)]
+    common = [
+        f"{rng.choice(VOCABULARY[:20])} {rng.choice(EVENT_TYPES)}"
+        for _ in range(QUERIES)
+    ]
+
+    print(f"Search latency, {QUERIES} queries each")
+    print_percentiles("selective", await measure(index, selective, page=1))
+    print_percentiles("common", await measure(index, common, page=1))
+    print_percentiles("common, page 2", await measure(index, common, page=2))
+
+    timings = []
+    for query in common[:SCAN_QUERIES]:
+        start = time.perf_counter()
+        linear_scan(events, query)
+        timings.append(time.perf_counter() - start)
+    print(f"  {'linear scan':<28} mean {sum(timings) / len(timings) * 1000:>8.0f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Render a page of events as the list endpoint does: validated against
+`PaginatedEventResponse` and then JSON-encoded (FastAPI's default path), or
+straight from the domain entities with `event_page_response`.
+
+Usage (from ./backend):
+    python -m benchmarks.bench_serialization
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from functools import partial
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.v1.schemas.events_schema import PaginatedEventResponse
+from app.api.v1.serializers import event_page_response
+from app.domain.entities.events.entities import Event
+from benchmarks.utils import async_best_of, report
+
+PAGE_SIZES = (10, 100)
+RESPONSES = 1_000
+
+
+def make_page(page_size: int) -> dict:
+    now = datetime.now(UTC)
+    events = [
+        Event(
+            id=i,
+            title=f"Event {i}",
+            description="Benchmark event with a longer description " * 4,
+            event_type="concert",
+            venue="Cebu City",
+            capacity=100,
+            start_time=now + timedelta(days=i),
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(page_size)
+    ]
+    return {
+        "items": events,
+        "total": 10_000,
+        "total_estimated": False,
+        "page": 1,
+        "page_size": page_size,
+        "total_pages": 10_000 // page_size,
+        "next_cursor": "WyIyMDMwLTAxLTAxVDAwOjAwOjAwWiIsIDEwXQ",
+    }
+
+
+async def validated(field, page: dict) -> None:
+    for _ in range(RESPONSES):
+        content = await serialize_response(field=field, response_content=page)
+        JSONResponse(content)
+
+
+async def fast(page: dict) -> None:
+    for _ in range(RESPONSES):
+        event_page_response(page)
+
+
+async def main() -> None:
+    field = create_model_field("Response", PaginatedEventResponse)
+
+    for page_size in PAGE_SIZES:
+        page = make_page(page_size)
+
+        content = await serialize_response(field=field, response_content=page)
+        assert event_page_response(page).body == JSONResponse(content).body
+
+        results = {
+            "validated (default)": await async_best_of(partial(validated, field, page)),
+            "event_page_response": await async_best_of(partial(fast, page)),
+        }
+        report(
+            f"{RESPONSES:,} responses of {page_size} events",
+            results,
+            baseline="validated (default)",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
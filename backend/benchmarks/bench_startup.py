@@ -0,0 +1,91 @@
+"""
+Cold start of a worker: the time to import `app.main`, then to run the
+lifespan startup and serve a first request (the health check), each in a
+fresh interpreter.
+
+Fails (exit status 1) when the median total exceeds the budget, so it can
+guard against startup regressions in CI. The budget depends on the machine:
+set BENCH_STARTUP_BUDGET_MS for yours.
+
+No database connection is made: the engines are created at startup but
+only connect on first use, and the background workers are disabled.
+
+Usage (from ./backend):
+    python -m benchmarks.bench_startup
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 10
+STARTUP_BUDGET_MS = float(os.getenv("BENCH_STARTUP_BUDGET_MS", "3000"))
+
+CHILD = """
+import asyncio, json, time
+
+start = time.perf_counter()
+from app.main import api
+imported = time.perf_counter()
+
+from httpx import ASGITransport, AsyncClient
+
+async def first_request():
+    async with api.router.lifespan_context(api):
+        transport = ASGITransport(app=api)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/api/v1/health-check/")
+            assert response.status_code == 200, response.text
+            return time.perf_counter()
+
+served = asyncio.run(first_request())
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_request_ms": (served - imported) * 1000,
+    "total_ms": (served - start) * 1000,
+}))
+"""
+
+
+def run_once() -> dict[str, float]:
+    env = {
+        "POSTGRES_USER": "bench",
+        "POSTGRES_SERVER": "localhost",
+        **os.environ,
+        "HOLD_SWEEPER_ENABLED": "false",
+        "OUTBOX_DISPATCHER_ENABLED": "false",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    # The first run also warms the filesystem and bytecode caches
+    run_once()
+    runs = [run_once() for _ in range(RUNS)]
+
+    print(f"Worker cold start, median and max of {RUNS} runs")
+    for name in ("import_ms", "first_request_ms", "total_ms"):
+        values = [run[name] for run in runs]
+        print(
+            f"  {name:<24} {statistics.median(values):>8.1f} ms"
+            f"  (max {max(values):.1f} ms)"
+        )
+
+    total = statistics.median(run["total_ms"] for run in runs)
+    if total > STARTUP_BUDGET_MS:
+        print(f"FAIL: median total {total:.1f} ms exceeds {STARTUP_BUDGET_MS:.0f} ms")
+        sys.exit(1)
+    print(f"OK: within the {STARTUP_BUDGET_MS:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measure per-request dependency-injection overhead of UseCaseFactory.
+
+A no-op session isolates the factory from database work. "plan per request"
+re-inspects the use case constructor on every request, as the factory used to.
+
+Usage (from ./backend):
+    python -m benchmarks.bench_use_case_factory
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.application.entities.events.use_cases import UpdateEventUseCase
+from app.application.use_case_factory.factory import UseCaseContext
+from app.application.use_cases import _UseCaseFactory
+from benchmarks.utils import async_best_of, report
+
+REQUESTS = 10_000
+
+
+class NullSession:
+    """Stands in for AsyncSession; every operation is a no-op."""
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    def get_bind(self) -> SimpleNamespace:
+        return SimpleNamespace(dialect=SimpleNamespace(name="null"))
+
+
+async def main() -> None:
+    factory = _UseCaseFactory(UpdateEventUseCase, NullSession)
+
+    async def plan_per_request() -> None:
+        for _ in range(REQUESTS):
+            async with UseCaseContext(factory, factory._build_plan()):
+                pass
+
+    async def cached_plan() -> None:
+        for _ in range(REQUESTS):
+            async with factory():
+                pass
+
+    results = {
+        "plan per request": await async_best_of(plan_per_request),
+        "cached plan": await async_best_of(cached_plan),
+    }
+    report(
+        f"UseCaseFactory enter/exit ({REQUESTS:,} requests)",
+        results,
+        baseline="plan per request",
+    )
+    per_request_us = results["cached plan"] / REQUESTS * 1e6
+    print(f"  cached plan overhead per request: {per_request_us:.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
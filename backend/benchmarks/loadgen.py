@@ -0,0 +1,438 @@
+"""
+Load generator: virtual users sending a weighted mix of event requests
+(browse, search, detail, create, update) while their number follows a ramp,
+as during an on-sale spike. Reports throughput, latency percentiles and a
+breakdown of errors, overall and per operation.
+
+Targets either a running server (`--url`, e.g. after
+`uvicorn app.main:api`) or, by default, the app in-process through
+ASGITransport, against BENCH_DATABASE_URL (a temporary SQLite file unless
+set), so it also runs in CI.
+
+Stages are `DURATION:USERS` pairs: the number of users moves linearly from
+the previous stage's count (0 at first) to USERS over DURATION seconds. Each
+user picks an operation by the scenario's weights, sends it, then waits a
+random think time of up to twice `--think` seconds.
+
+Usage (from ./backend):
+    python -m benchmarks.loadgen --scenario on_sale --stages 10:50,30:50,5:200,20:200
+    python -m benchmarks.loadgen --url http://127.0.0.1:8000 --events 0
+    python -m benchmarks.loadgen --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import httpx
+from httpx import ASGITransport, AsyncClient
+
+from app.application.use_cases import EventUseCases
+from app.main import api
+from benchmarks.utils import (
+    bench_session_factory,
+    bind_use_cases,
+    concurrent_database_url,
+)
+
+EVENTS_PATH = "/api/v1/events/"
+PAGE_SIZE = 20
+SEED_BATCH_SIZE = 500
+MAX_KNOWN_EVENTS = 5_000
+TICK = 0.05
+
+# Words the seeded events are made of, so searches find something
+GENRES = ["jazz", "rock", "indie", "classical", "comedy", "theatre", "opera", "hiphop"]
+KINDS = ["festival", "concert", "night", "tour", "showcase", "live"]
+CITIES = ["Cebu City", "Manila City", "Davao City", "Iloilo City", "Baguio City"]
+EVENT_TYPES = ["concert", "festival", "theatre", "comedy"]
+
+SCENARIOS: dict[str, dict[str, int]] = {
+    "browse": {"browse": 6, "detail": 4},
+    "search": {"search": 7, "detail": 3},
+    "detail": {"detail": 1},
+    "write": {"create": 1, "update": 1},
+    # Mostly readers refreshing the event page, a few organisers editing it
+    "on_sale": {"detail": 45, "browse": 25, "search": 20, "update": 7, "create": 3},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    duration: float
+    users: int
+
+
+def parse_stages(value: str) -> list[Stage]:
+    """Parse `DURATION:USERS,...`, durations in seconds."""
+    stages = []
+    for part in value.split(","):
+        duration, _, users = part.strip().partition(":")
+        try:
+            stage = Stage(float(duration), int(users))
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"expected DURATION:USERS, got {part!r}"
+            ) from None
+        if stage.duration <= 0 or stage.users < 0:
+            raise argparse.ArgumentTypeError(f"invalid stage {part!r}")
+        stages.append(stage)
+    return stages
+
+
+def users_at(stages: list[Stage], elapsed: float) -> int | None:
+    """Target number of users `elapsed` seconds in; None once the ramp is over."""
+    previous = 0
+    for stage in stages:
+        if elapsed < stage.duration:
+            return round(previous + (stage.users - previous) * elapsed / stage.duration)
+        elapsed -= stage.duration
+        previous = stage.users
+    return None
+
+
+def make_event(rng: random.Random) -> dict[str, Any]:
+    genre, kind = rng.choice(GENRES), rng.choice(KINDS)
+    start_time = datetime.now(UTC) + timedelta(days=rng.randint(7, 365))
+    return {
+        "title": f"{genre.title()} {kind.title()} {rng.randint(1, 9999)}",
+        "description": f"A {genre} {kind} for the load test",
+        "event_type": rng.choice(EVENT_TYPES),
+        "venue": rng.choice(CITIES),
+        "capacity": rng.randint(100, 5_000),
+        "start_time": start_time.isoformat(),
+    }
+
+
+class Operations:
+    """The requests virtual users send, sharing the ids of known events."""
+
+    def __init__(
+        self, client: AsyncClient, event_ids: list[int], rng: random.Random
+    ) -> None:
+        self.client = client
+        self.event_ids = event_ids
+        self.rng = rng
+
+    def get(self, name: str) -> Callable[[], Awaitable[httpx.Response]]:
+        return getattr(self, name)
+
+    async def browse(self) -> httpx.Response:
+        pages = max(1, len(self.event_ids) // PAGE_SIZE)
+        params: dict[str, Any] = {
+            "page": self.rng.randint(1, min(pages, 10)),
+            "page_size": PAGE_SIZE,
+        }
+        if self.rng.random() < 0.3:
+            params["event_type"] = self.rng.choice(EVENT_TYPES)
+        return await self.client.get(EVENTS_PATH, params=params)
+
+    async def search(self) -> httpx.Response:
+        words = [self.rng.choice(GENRES)]
+        if self.rng.random() < 0.5:
+            words.append(self.rng.choice(KINDS))
+        return await self.client.get(
+            f"{EVENTS_PATH}search", params={"q": " ".join(words)}
+        )
+
+    async def detail(self) -> httpx.Response:
+        return await self.client.get(f"{EVENTS_PATH}{self._event_id()}")
+
+    async def create(self) -> httpx.Response:
+        response = await self.client.post(EVENTS_PATH, json=make_event(self.rng))
+        if response.status_code == 201 and len(self.event_ids) < MAX_KNOWN_EVENTS:
+            self.event_ids.append(response.json()["id"])
+        return response
+
+    async def update(self) -> httpx.Response:
+        return await self.client.patch(
+            f"{EVENTS_PATH}{self._event_id()}",
+            json={"capacity": self.rng.randint(100, 5_000)},
+        )
+
+    def _event_id(self) -> int:
+        # Popular events get most of the traffic during an on-sale
+        index = min(int(self.rng.paretovariate(1.2)) - 1, len(self.event_ids) - 1)
+        return self.event_ids[index]
+
+
+class LoadStats:
+    """Latencies and errors per operation, and requests per second of the run."""
+
+    def __init__(self) -> None:
+        self.latencies: defaultdict[str, list[float]] = defaultdict(list)
+        self.errors: Counter[str] = Counter()
+        self.error_counts: Counter[str] = Counter()
+        self.timeline: Counter[int] = Counter()
+        self.peak_users = 0
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+
+    def record(self, operation: str, seconds: float, error: str | None) -> None:
+        self.latencies[operation].append(seconds)
+        self.timeline[int(time.perf_counter() - self.started)] += 1
+        if error is not None:
+            self.errors[f"{operation}: {error}"] += 1
+            self.error_counts[operation] += 1
+
+    def summary(self) -> dict[str, Any]:
+        duration = (self.finished or time.perf_counter()) - self.started
+        all_latencies = [s for samples in self.latencies.values() for s in samples]
+        return {
+            "duration_seconds": round(duration, 3),
+            "peak_users": self.peak_users,
+            "total": self._summarize(
+                all_latencies, sum(self.errors.values()), duration
+            ),
+            "operations": {
+                name: self._summarize(samples, self.error_counts[name], duration)
+                for name, samples in sorted(self.latencies.items())
+            },
+            "errors": dict(self.errors.most_common()),
+            "requests_per_second": [
+                self.timeline[second] for second in range(int(duration) + 1)
+            ],
+        }
+
+    @staticmethod
+    def _summarize(
+        samples: list[float], errors: int, duration: float
+    ) -> dict[str, Any]:
+        ordered = sorted(samples)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1e3, 3)
+
+        return {
+            "requests": len(ordered),
+            "errors": errors,
+            "throughput_rps": round(len(ordered) / duration, 1) if duration else 0.0,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": percentile(1.0),
+        }
+
+
+class LoadRunner:
+    """
+    Runs virtual users along the stages. Users above the current target stop
+    after their request in flight; requests still in flight at the end are
+    waited for and counted.
+    """
+
+    def __init__(
+        self,
+        operations: Operations,
+        mix: dict[str, int],
+        stages: list[Stage],
+        *,
+        think_time: float,
+    ) -> None:
+        self.operations = operations
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        self.stages = stages
+        self.think_time = think_time
+        self.rng = operations.rng
+        self.stats = LoadStats()
+
+    async def run(self) -> LoadStats:
+        users: list[tuple[asyncio.Task, asyncio.Event]] = []
+        self.stats = LoadStats()
+        while (target := users_at(self.stages, self._elapsed())) is not None:
+            while len(users) < target:
+                stop = asyncio.Event()
+                users.append((asyncio.create_task(self._user(stop)), stop))
+            while len(users) > target:
+                users.pop()[1].set()
+            self.stats.peak_users = max(self.stats.peak_users, len(users))
+            await asyncio.sleep(TICK)
+
+        for _, stop in users:
+            stop.set()
+        await asyncio.gather(*(task for task, _ in users))
+        self.stats.finished = time.perf_counter()
+        return self.stats
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self.stats.started
+
+    async def _user(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            name = self.rng.choices(self.names, self.weights)[0]
+            start = time.perf_counter()
+            try:
+                response = await self.operations.get(name)()
+                error = None if response.is_success else str(response.status_code)
+            except Exception as e:
+                # Transport errors, timeouts, or a bug in the load generator:
+                # all counted, none ends the run
+                error = type(e).__name__
+            self.stats.record(name, time.perf_counter() - start, error)
+
+            if self.think_time:
+                # Wakes early when told to stop
+                timeout = self.rng.uniform(0, 2 * self.think_time)
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), timeout)
+            else:
+                # Requests that fail without awaiting must not starve the ramp
+                await asyncio.sleep(0)
+
+
+async def seed_events(client: AsyncClient, count: int, rng: random.Random) -> list[int]:
+    """Create `count` events through the bulk endpoint, so they are indexed."""
+    event_ids = []
+    for offset in range(0, count, SEED_BATCH_SIZE):
+        batch = [make_event(rng) for _ in range(min(SEED_BATCH_SIZE, count - offset))]
+        response = await client.post(f"{EVENTS_PATH}bulk", json=batch)
+        response.raise_for_status()
+        event_ids += [item["event"]["id"] for item in response.json()["items"]]
+    return event_ids
+
+
+async def discover_event_ids(client: AsyncClient, limit: int) -> list[int]:
+    """Ids of up to `limit` existing events, walking the list by cursor."""
+    event_ids: list[int] = []
+    params: dict[str, Any] = {"page_size": 100}
+    while len(event_ids) < limit:
+        response = await client.get(EVENTS_PATH, params=params)
+        response.raise_for_status()
+        page = response.json()
+        event_ids += [item["id"] for item in page["items"]]
+        if not page["next_cursor"]:
+            break
+        params["cursor"] = page["next_cursor"]
+    return event_ids[:limit]
+
+
+async def run_load(
+    client: AsyncClient,
+    *,
+    scenario: str,
+    stages: list[Stage],
+    events: int,
+    think_time: float = 0.0,
+    random_seed: int | None = None,
+) -> LoadStats:
+    """Seed `events` events (none: use the existing ones), then run the load."""
+    rng = random.Random(random_seed)
+    if events:
+        event_ids = await seed_events(client, events, rng)
+    else:
+        event_ids = await discover_event_ids(client, MAX_KNOWN_EVENTS)
+    if not event_ids:
+        raise RuntimeError("No events to load test against; seed some with --events")
+
+    # Popular events first, whichever they are
+    rng.shuffle(event_ids)
+    runner = LoadRunner(
+        Operations(client, event_ids, rng),
+        SCENARIOS[scenario],
+        stages,
+        think_time=think_time,
+    )
+    return await runner.run()
+
+
+def print_summary(summary: dict[str, Any]) -> None:
+    header = (
+        f"  {'operation':<10} {'requests':>9} {'errors':>7} {'rps':>9}"
+        f" {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    print(
+        f"{summary['duration_seconds']:.1f} s, "
+        f"peak of {summary['peak_users']} concurrent users"
+    )
+    print(header)
+    rows = [*summary["operations"].items(), ("total", summary["total"])]
+    for name, row in rows:
+        print(
+            f"  {name:<10} {row['requests']:>9} {row['errors']:>7}"
+            f" {row['throughput_rps']:>9.1f} {row['p50_ms']:>9.1f}"
+            f" {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f}"
+        )
+    if summary["errors"]:
+        print("Errors")
+        for error, count in summary["errors"].items():
+            print(f"  {error:<40} {count:>7}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--url", help="base URL of a running server; in-process when omitted"
+    )
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="on_sale")
+    parser.add_argument(
+        "--stages",
+        type=parse_stages,
+        default=parse_stages("5:20,10:20,5:100,10:100,5:0"),
+        help="DURATION:USERS,... (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=500,
+        help="events to create first; 0 to use the existing ones",
+    )
+    parser.add_argument(
+        "--think", type=float, default=0.0, help="mean think time in seconds"
+    )
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--random-seed", type=int)
+    parser.add_argument("--output", help="write the summary as JSON to this file")
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    options = {
+        "scenario": args.scenario,
+        "stages": args.stages,
+        "events": args.events,
+        "think_time": args.think,
+        "random_seed": args.random_seed,
+    }
+    peak = max(stage.users for stage in args.stages)
+    limits = httpx.Limits(max_connections=peak, max_keepalive_connections=peak)
+
+    if args.url:
+        async with AsyncClient(
+            base_url=args.url, timeout=args.timeout, limits=limits
+        ) as client:
+            stats = await run_load(client, **options)
+    else:
+        url = concurrent_database_url()
+        async with bench_session_factory(url) as session_factory:
+            bind_use_cases(EventUseCases, session_factory)
+            # Server errors come back as 500 responses, as from a real server
+            transport = ASGITransport(app=api, raise_app_exceptions=False)
+            async with AsyncClient(
+                transport=transport, base_url="http://loadgen", timeout=args.timeout
+            ) as client:
+                stats = await run_load(client, **options)
+
+    summary = stats.summary()
+    print_summary(summary)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"scenario": args.scenario, **summary}, f, indent=2)
+            f.write("\n")
+    return 1 if summary["total"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,400 @@
+"""
+Benchmark suite: ORM -> entity mapping, SqlAlchemyEventRepository CRUD and
+pagination, UseCaseFactory enter/exit, and HTTP round trips through
+ASGITransport, each timed per operation.
+
+Runs against BENCH_DATABASE_URL: in-memory SQLite by default, or a scratch
+PostgreSQL database for numbers that include real round trips.
+
+Results are written as JSON with `--output` and compared against an earlier
+run with `--baseline`. A case regresses when its median time per operation
+exceeds the baseline's by more than its threshold; the suite then exits with
+status 1. Thresholds are fractions (0.25 = 25% slower), set with
+`--threshold` or BENCH_REGRESSION_THRESHOLD for every case and with
+`--case-threshold NAME=FRACTION` for noisier ones. Baselines are only
+comparable on the same machine and database.
+
+Usage (from ./backend):
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --baseline bench.json --case-threshold repo.create=0.5
+    python -m benchmarks.suite --filter repo.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import make_url
+
+from app.application.entities.events.use_cases import UpdateEventUseCase
+from app.application.use_cases import EventUseCases, _UseCaseFactory
+from app.domain.entities.events.entities import Event
+from app.infrastructure.db.models.event_model import EventModel
+from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventRepository,
+)
+from app.infrastructure.db.utils import register_mapper
+from app.main import api
+from benchmarks.bench_bulk_create import make_events
+from benchmarks.bench_from_orm import make_rows
+from benchmarks.bench_use_case_factory import NullSession
+from benchmarks.utils import (
+    BENCH_DATABASE_URL,
+    bench_session_factory,
+    bind_use_cases,
+    percentiles,
+)
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = float(os.getenv("BENCH_REGRESSION_THRESHOLD", "0.25"))
+
+SEED_EVENTS = 1_000
+MAPPED_ROWS = 10_000
+REPO_OPS = 200
+BULK_SIZE = 100
+PAGE_SIZE = 20
+FACTORY_OPS = 10_000
+HTTP_OPS = 100
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """One benchmark: `run` performs `ops` operations per round."""
+
+    name: str
+    run: Callable[[], Awaitable[object]]
+    ops: int
+
+
+async def measure(case: Case, *, rounds: int, warmup: int) -> dict[str, Any]:
+    """Time `rounds` rounds of `case` after `warmup` untimed ones."""
+    for _ in range(warmup):
+        await case.run()
+
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await case.run()
+        samples.append((time.perf_counter() - start) / case.ops * 1e6)
+
+    median = statistics.median(samples)
+    return {
+        "ops": case.ops,
+        "rounds": rounds,
+        "median_us": round(median, 3),
+        "p95_us": round(percentiles(samples)["p95"], 3),
+        "min_us": round(min(samples), 3),
+        "ops_per_sec": round(1e6 / median, 1),
+    }
+
+
+# ------------------------------------------
+# Cases
+# ------------------------------------------
+def mapping_cases() -> list[Case]:
+    rows = make_rows(MAPPED_ROWS)
+    to_event = register_mapper(EventModel, Event)
+
+    async def map_rows() -> None:
+        for row in rows:
+            to_event(row)
+
+    return [Case("mapping.from_orm", map_rows, MAPPED_ROWS)]
+
+
+def factory_cases() -> list[Case]:
+    factory = _UseCaseFactory(UpdateEventUseCase, NullSession)
+
+    async def enter_exit() -> None:
+        for _ in range(FACTORY_OPS):
+            async with factory():
+                pass
+
+    return [Case("use_case_factory.enter_exit", enter_exit, FACTORY_OPS)]
+
+
+async def seed(session_factory) -> list[Event]:
+    async with session_factory() as session:
+        repo = SqlAlchemyEventRepository(session)
+        events = await repo.create_many(event_rows(SEED_EVENTS))
+        await session.commit()
+    return events
+
+
+def event_rows(n: int) -> list[dict[str, Any]]:
+    start_time = datetime.now(UTC) + timedelta(weeks=4)
+    return [
+        {**item, "start_time": start_time + timedelta(minutes=i)}
+        for i, item in enumerate(make_events(n))
+    ]
+
+
+def repository_cases(session_factory, events: list[Event]) -> list[Case]:
+    ids = [event.id for event in events][:REPO_OPS]
+    middle = sorted(events, key=lambda event: (event.start_time, event.id))[
+        len(events) // 2
+    ]
+    after = (middle.start_time, middle.id)
+
+    async def create() -> None:
+        async with session_factory() as session:
+            repo = SqlAlchemyEventRepository(session)
+            for row in event_rows(REPO_OPS):
+                await repo.create(row)
+            await session.commit()
+
+    async def create_many() -> None:
+        async with session_factory() as session:
+            await SqlAlchemyEventRepository(session).create_many(event_rows(BULK_SIZE))
+            await session.commit()
+
+    async def get() -> None:
+        async with session_factory() as session:
+            repo = SqlAlchemyEventRepository(session)
+            for event_id in ids:
+                await repo.get(event_id)
+
+    async def update() -> None:
+        async with session_factory() as session:
+            repo = SqlAlchemyEventRepository(session)
+            for event_id in ids:
+                await repo.update(event_id, {"capacity": 200})
+            await session.commit()
+
+    async def page_offset() -> None:
+        async with session_factory() as session:
+            repo = SqlAlchemyEventRepository(session)
+            for _ in range(REPO_OPS):
+                await repo.get_paginated_events_with_total(
+                    offset=SEED_EVENTS // 2, limit=PAGE_SIZE
+                )
+
+    async def page_keyset() -> None:
+        async with session_factory() as session:
+            repo = SqlAlchemyEventRepository(session)
+            for _ in range(REPO_OPS):
+                await repo.get_events_after(after=after, limit=PAGE_SIZE)
+
+    return [
+        Case("repo.create", create, REPO_OPS),
+        Case("repo.create_many", create_many, BULK_SIZE),
+        Case("repo.get", get, REPO_OPS),
+        Case("repo.update", update, REPO_OPS),
+        Case("repo.page_offset", page_offset, REPO_OPS),
+        Case("repo.page_keyset", page_keyset, REPO_OPS),
+    ]
+
+
+def http_cases(client: AsyncClient, events: list[Event]) -> list[Case]:
+    ids = [event.id for event in events][:HTTP_OPS]
+    payloads = make_events(HTTP_OPS)
+
+    async def requests(method: str, urls: list[str]) -> None:
+        for url in urls:
+            response = await client.request(method, url)
+            response.raise_for_status()
+
+    async def health_check() -> None:
+        await requests("GET", ["/api/v1/health-check/"] * HTTP_OPS)
+
+    async def get_event() -> None:
+        await requests("GET", [f"/api/v1/events/{event_id}" for event_id in ids])
+
+    async def list_events() -> None:
+        await requests("GET", [f"/api/v1/events/?page_size={PAGE_SIZE}"] * HTTP_OPS)
+
+    async def create_event() -> None:
+        for payload in payloads:
+            response = await client.post("/api/v1/events/", json=payload)
+            response.raise_for_status()
+
+    return [
+        Case("http.health_check", health_check, HTTP_OPS),
+        Case("http.get_event", get_event, HTTP_OPS),
+        Case("http.list_events", list_events, HTTP_OPS),
+        Case("http.create_event", create_event, HTTP_OPS),
+    ]
+
+
+async def run_suite(
+    *, rounds: int, warmup: int, selected: Callable[[str], bool]
+) -> dict[str, dict[str, Any]]:
+    results = {}
+
+    async def run(cases: list[Case]) -> None:
+        for case in cases:
+            if selected(case.name):
+                results[case.name] = await measure(case, rounds=rounds, warmup=warmup)
+                print(f"  {case.name:<32} {results[case.name]['median_us']:>12.1f} us")
+
+    await run(mapping_cases())
+    await run(factory_cases())
+    async with bench_session_factory() as session_factory:
+        events = await seed(session_factory)
+        await run(repository_cases(session_factory, events))
+
+        bind_use_cases(EventUseCases, session_factory)
+        transport = ASGITransport(app=api)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            await run(http_cases(client, events))
+    return results
+
+
+# ------------------------------------------
+# Baseline comparison
+# ------------------------------------------
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    *,
+    threshold: float,
+    case_thresholds: dict[str, float],
+) -> list[dict[str, Any]]:
+    """Median change of every case against the baseline, flagging regressions."""
+    rows = []
+    for name, result in results.items():
+        allowed = case_thresholds.get(name, threshold)
+        before = baseline.get(name)
+        if before is None:
+            rows.append({"name": name, "change": None, "threshold": allowed})
+            continue
+        change = result["median_us"] / before["median_us"] - 1
+        rows.append(
+            {
+                "name": name,
+                "baseline_us": before["median_us"],
+                "median_us": result["median_us"],
+                "change": round(change, 4),
+                "threshold": allowed,
+                "regressed": change > allowed,
+            }
+        )
+    return rows
+
+
+def print_comparison(rows: list[dict[str, Any]]) -> None:
+    print("Against the baseline (median per operation)")
+    for row in rows:
+        if row["change"] is None:
+            print(f"  {row['name']:<32} {'new':>12}")
+            continue
+        verdict = "REGRESSED" if row["regressed"] else "ok"
+        print(
+            f"  {row['name']:<32} {row['baseline_us']:>10.1f} -> "
+            f"{row['median_us']:>10.1f} us  {row['change']:>+8.1%}"
+            f"  (max {row['threshold']:+.0%})  {verdict}"
+        )
+
+
+def environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created_at": datetime.now(UTC).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": make_url(BENCH_DATABASE_URL).render_as_string(hide_password=True),
+    }
+
+
+def case_threshold(value: str) -> tuple[str, float]:
+    name, _, fraction = value.partition("=")
+    try:
+        return name, float(fraction)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected NAME=FRACTION, got {value!r}"
+        ) from None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown of every case, as a fraction",
+    )
+    parser.add_argument(
+        "--case-threshold",
+        type=case_threshold,
+        action="append",
+        default=[],
+        metavar="NAME=FRACTION",
+        help="allowed slowdown of one case; repeatable",
+    )
+    parser.add_argument(
+        "--filter",
+        action="append",
+        default=[],
+        help="only run cases whose name contains this; repeatable",
+    )
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    def selected(name: str) -> bool:
+        return not args.filter or any(part in name for part in args.filter)
+
+    print(f"Median time per operation, {args.rounds} rounds")
+    results = await run_suite(rounds=args.rounds, warmup=args.warmup, selected=selected)
+    document = {
+        "schema_version": SCHEMA_VERSION,
+        "environment": environment(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if (
+        baseline.get("environment", {}).get("database")
+        != (document["environment"]["database"])
+    ):
+        print("Note: the baseline was recorded against another database")
+    rows = compare(
+        results,
+        baseline["results"],
+        threshold=args.threshold,
+        case_thresholds=dict(args.case_threshold),
+    )
+    print_comparison(rows)
+    regressed = [row["name"] for row in rows if row.get("regressed")]
+    if regressed:
+        print(f"FAIL: {', '.join(regressed)} regressed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
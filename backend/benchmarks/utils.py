@@ -0,0 +1,83 @@
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.db.models.base import ModelBase
+
+# Point at a scratch PostgreSQL database to benchmark against a real server.
+# Tables are created if missing but never dropped.
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+
+def concurrent_database_url(url: str = BENCH_DATABASE_URL) -> str:
+    """
+    `url`, unless it is in-memory SQLite (a single shared connection), which is
+    replaced by a temporary SQLite file so sessions get their own connections.
+    """
+    if url.startswith("sqlite") and ":memory:" in url:
+        return f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.sqlite3"
+    return url
+
+
+def best_of(func: Callable[[], object], *, repeat: int = 5) -> float:
+    """Run `func` `repeat` times and return the fastest wall time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def async_best_of(
+    func: Callable[[], Awaitable[object]], *, repeat: int = 5
+) -> float:
+    """Async counterpart of `best_of`."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(title: str, results: dict[str, float], *, baseline: str) -> None:
+    """Print timings in milliseconds along with the speed-up over `baseline`."""
+    print(title)
+    for name, seconds in results.items():
+        speedup = results[baseline] / seconds
+        print(f"  {name:<24} {seconds * 1000:>10.2f} ms  {speedup:>6.2f}x")
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Return p50/p95/p99 of `samples`."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+@asynccontextmanager
+async def bench_session_factory(
+    url: str = BENCH_DATABASE_URL, **engine_kwargs: Any
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """Yield a session factory bound to a database with all tables created."""
+    engine = create_async_engine(url, **engine_kwargs)
+    async with engine.begin() as conn:
+        await conn.run_sync(ModelBase.metadata.create_all)
+    try:
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+def bind_use_cases(use_cases: type, session_factory: Callable) -> None:
+    """Point every use case factory on `use_cases` at `session_factory`."""
+    for value in vars(use_cases).values():
+        if hasattr(value, "_session_factory"):
+            value._session_factory = session_factory
+            value._read_session_factory = session_factory
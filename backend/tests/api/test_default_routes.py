@@ -1,3 +1,7 @@
+from app.application.use_cases import OutboxUseCases, TicketUseCases, waiting_room
+from app.core.config import settings
+
+
 class TestDefaultRoutesAPI:
     """
     Ensure that the default routes are working as expected.
@@ -15,3 +19,55 @@ class TestDefaultRoutesAPI:
     async def test_openapi_endpoint(self, test_client):
         resp = await test_client.get("/docs")
         assert resp.status_code == 200
+
+    async def test_internal_stats_endpoint(self, test_client):
+        resp = await test_client.get("/api/v1/internal/stats")
+        data = resp.json()
+
+        assert resp.status_code == 200
+        assert "hits" in data["event_cache"]
+        assert "in_use" in data["db_pool"]
+
+    async def test_waiting_room_config_requires_admin_key(
+        self, test_client, monkeypatch
+    ):
+        monkeypatch.setattr(waiting_room, "_configs", {})
+        url = "/api/v1/internal/waiting-room/1"
+        body = {"rate_per_second": 1e9, "burst": 0}
+
+        resp = await test_client.put(url, json=body)
+        assert resp.status_code == 403
+
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", "s3cret")
+        resp = await test_client.put(url, json=body, headers={"X-Admin-Key": "nope"})
+        assert resp.status_code == 403
+        assert waiting_room.get_config(1).rate != 1e9
+
+        resp = await test_client.put(url, json=body, headers={"X-Admin-Key": "s3cret"})
+        assert resp.status_code == 200
+        assert waiting_room.get_config(1).rate == 1e9
+
+    async def test_reprice_requires_admin_key(
+        self, test_client, monkeypatch, wrap_uc_with_test_session
+    ):
+        wrap_uc_with_test_session(TicketUseCases)
+        url = "/api/v1/internal/pricing/reprice"
+
+        resp = await test_client.post(url)
+        assert resp.status_code == 403
+
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", "s3cret")
+        resp = await test_client.post(url, headers={"X-Admin-Key": "s3cret"})
+        assert resp.status_code == 200
+        assert resp.json()["events"] >= 0
+
+    async def test_outbox_backlog_endpoint(
+        self, test_client, wrap_uc_with_test_session
+    ):
+        wrap_uc_with_test_session(OutboxUseCases)
+
+        resp = await test_client.get("/api/v1/internal/outbox")
+        data = resp.json()
+
+        assert resp.status_code == 200
+        assert {"pending", "due", "dead", "topics"} <= data.keys()
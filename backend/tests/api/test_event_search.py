@@ -0,0 +1,101 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.application.use_cases import EventUseCases, search_index
+
+start_time = (datetime.now(UTC) + timedelta(weeks=4)).isoformat()
+
+events = [
+    {
+        "title": "Jazz Night",
+        "description": "Live jazz and blues",
+        "event_type": "concert",
+        "venue": "Cebu City",
+    },
+    {
+        "title": "Food Market",
+        "description": "Street food, with a jazz band",
+        "event_type": "market",
+        "venue": "Cebu City",
+    },
+    {
+        "title": "Rock Festival",
+        "description": "Three days of rock",
+        "event_type": "concert",
+        "venue": "Manila",
+    },
+]
+
+
+@pytest.fixture(scope="function")
+def override_event_uc(wrap_uc_with_test_session):
+    return wrap_uc_with_test_session(EventUseCases)
+
+
+async def create_events(test_client) -> list[int]:
+    ids = []
+    for event in events:
+        resp = await test_client.post(
+            "/api/v1/events/",
+            json={**event, "capacity": 10, "start_time": start_time},
+        )
+        ids.append(resp.json()["id"])
+    return ids
+
+
+async def search(test_client, **params):
+    return await test_client.get("/api/v1/events/search", params=params)
+
+
+class TestGroupEventSearchAPI:
+    async def test_results_are_ranked_by_relevance(
+        self, test_client, override_event_uc
+    ):
+        jazz, market, rock = await create_events(test_client)
+
+        resp = await search(test_client, q="jazz")
+        data = resp.json()
+
+        assert resp.status_code == 200
+        assert [item["id"] for item in data["items"]] == [jazz, market]
+        assert data["next_cursor"] is None
+
+        data = (await search(test_client, q="Concert CEBU")).json()
+        assert [item["id"] for item in data["items"]] == [jazz]
+        assert len(search_index) == 3
+
+    async def test_results_are_paginated_by_cursor(
+        self, test_client, override_event_uc
+    ):
+        seen = []
+        data = (await search(test_client, q="cebu", page_size=1)).json()
+        while True:
+            seen.extend(item["id"] for item in data["items"])
+            if data["next_cursor"] is None:
+                break
+            data = (
+                await search(
+                    test_client, q="cebu", page_size=1, cursor=data["next_cursor"]
+                )
+            ).json()
+
+        assert len(seen) == len(set(seen)) == 2
+
+    async def test_updated_events_are_reindexed(self, test_client, override_event_uc):
+        (rock,) = [
+            item["id"] for item in (await search(test_client, q="rock")).json()["items"]
+        ]
+
+        await test_client.patch(f"/api/v1/events/{rock}", json={"title": "Opera Gala"})
+
+        assert (await search(test_client, q="rock festival")).json()["items"] == []
+        data = (await search(test_client, q="opera")).json()
+        assert [item["id"] for item in data["items"]] == [rock]
+
+    async def test_invalid_queries(self, test_client, override_event_uc):
+        assert (await search(test_client, q="")).status_code == 422
+        assert (await search(test_client, q="x" * 201)).status_code == 422
+        resp = await search(test_client, q="jazz", cursor="not-a-cursor")
+        assert resp.status_code == 400
+        assert (await search(test_client, q="!!!")).json()["items"] == []
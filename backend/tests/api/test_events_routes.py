@@ -1,5 +1,13 @@
+import csv
+import io
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
 import pytest
 
+from app.api.v1.schemas.events_schema import EventResponse
+from app.application.entities.events.use_cases import GetEventUseCase
 from app.application.use_cases import EventUseCases
 
 event = {
@@ -11,6 +19,11 @@ event = {
     "start_time": "2026-01-01T10:00:00Z",
 }
 
+upcoming_event = {
+    **event,
+    "start_time": (datetime.now(UTC) + timedelta(weeks=4)).isoformat(),
+}
+
 
 @pytest.fixture(scope="function")
 def override_event_uc(wrap_uc_with_test_session):
@@ -63,3 +76,201 @@ class TestGroupEventAPI:
     ):
         resp = await test_client.patch(f"/api/v1/events/{99}", json={})
         assert resp.status_code == 404
+
+    async def test_list_events_endpoint_with_invalid_cursor(
+        self, test_client, override_event_uc
+    ):
+        resp = await test_client.get("/api/v1/events/", params={"cursor": "invalid"})
+        assert resp.status_code == 400
+
+    async def test_bulk_create_events_endpoint(self, test_client, override_event_uc):
+        start_time = (datetime.now(UTC) + timedelta(weeks=4)).isoformat()
+        items = [
+            {**event, "title": "First", "start_time": start_time},
+            {"title": "Missing fields"},
+            {**event, "title": "Second", "start_time": start_time},
+        ]
+        resp = await test_client.post("/api/v1/events/bulk", json=items)
+        data = resp.json()
+
+        assert resp.status_code == 207
+        assert (data["created"], data["failed"]) == (2, 1)
+        assert [item["status"] for item in data["items"]] == [
+            "created",
+            "invalid",
+            "created",
+        ]
+        assert data["items"][0]["event"]["title"] == "First"
+        assert data["items"][1]["errors"]
+        assert data["items"][2]["event"]["title"] == "Second"
+
+    async def test_bulk_create_events_items_are_documented(self, test_client):
+        resp = await test_client.get("/openapi.json")
+        spec = resp.json()
+
+        body = spec["paths"]["/api/v1/events/bulk"]["post"]["requestBody"]
+        items = body["content"]["application/json"]["schema"]["items"]
+        assert items == {"$ref": "#/components/schemas/EventCreateRequest"}
+        assert "EventCreateRequest" in spec["components"]["schemas"]
+
+    async def test_bulk_create_events_endpoint_with_empty_body(
+        self, test_client, override_event_uc
+    ):
+        resp = await test_client.post("/api/v1/events/bulk", json=[])
+        assert resp.status_code == 422
+
+    async def test_export_events_endpoint_ndjson(self, test_client, override_event_uc):
+        listed = await test_client.get("/api/v1/events/", params={"page_size": 100})
+        resp = await test_client.get("/api/v1/events/export")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        # Same order and representation as the list endpoint
+        assert lines == listed.json()["items"]
+
+    async def test_export_events_endpoint_csv(self, test_client, override_event_uc):
+        total = (await test_client.get("/api/v1/events/")).json()["total"]
+        resp = await test_client.get("/api/v1/events/export", params={"format": "csv"})
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(resp.text)))
+        assert len(rows) == total
+        assert set(rows[0]) == set(EventResponse.model_fields)
+
+    async def test_list_events_endpoint_filters_and_sort(
+        self, test_client, override_event_uc
+    ):
+        now = datetime.now(UTC)
+        items = [
+            {
+                **event,
+                "event_type": "workshop",
+                "venue": venue,
+                "start_time": (now + timedelta(days=days)).isoformat(),
+            }
+            for days, venue in [(3, "Iloilo"), (1, "Iloilo"), (2, "Bohol")]
+        ]
+        await test_client.post("/api/v1/events/bulk", json=items)
+
+        params = {"event_type": "workshop", "venue": "Iloilo", "sort": "-start_time"}
+        data = (await test_client.get("/api/v1/events/", params=params)).json()
+        assert data["total"] == 2
+        assert [item["venue"] for item in data["items"]] == ["Iloilo", "Iloilo"]
+        assert data["items"][0]["start_time"] > data["items"][1]["start_time"]
+
+        # Keyset pages keep the filters and the sort
+        params = {"event_type": "workshop", "sort": "-start_time", "page_size": 1}
+        data = (await test_client.get("/api/v1/events/", params=params)).json()
+        data = (
+            await test_client.get(
+                "/api/v1/events/", params={**params, "cursor": data["next_cursor"]}
+            )
+        ).json()
+        assert [item["venue"] for item in data["items"]] == ["Bohol"]
+
+        # A cursor is only good for the sort and filters it was issued for
+        data = (await test_client.get("/api/v1/events/", params=params)).json()
+        for other in [{**params, "sort": "start_time"}, {**params, "venue": "Bohol"}]:
+            resp = await test_client.get(
+                "/api/v1/events/", params={**other, "cursor": data["next_cursor"]}
+            )
+            assert resp.status_code == 400
+
+        params = {
+            "event_type": "workshop",
+            "upcoming": True,
+            "starts_before": (now + timedelta(days=2, hours=1)).isoformat(),
+        }
+        data = (await test_client.get("/api/v1/events/", params=params)).json()
+        assert data["total"] == 2
+
+        resp = await test_client.get(
+            "/api/v1/events/export", params={"event_type": "workshop"}
+        )
+        assert len(resp.text.splitlines()) == 3
+
+    async def test_list_events_endpoint_rejects_invalid_filters(
+        self, test_client, override_event_uc
+    ):
+        for params in [
+            {"sort": "title"},
+            {"starts_from": "2030-01-01T00:00:00"},
+            {"event_type": "x" * 256},
+        ]:
+            resp = await test_client.get("/api/v1/events/", params=params)
+            assert resp.status_code == 422
+
+    async def test_get_event_endpoint_conditional_requests(
+        self, test_client, override_event_uc
+    ):
+        created = await test_client.post("/api/v1/events/", json=upcoming_event)
+        url = f"/api/v1/events/{created.json()['id']}"
+
+        resp = await test_client.get(url)
+        etag = resp.headers["etag"]
+        last_modified = resp.headers["last-modified"]
+        assert resp.status_code == 200
+
+        resp = await test_client.get(url, headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+        resp = await test_client.get(url, headers={"If-Modified-Since": last_modified})
+        assert resp.status_code == 304
+
+        await test_client.patch(url, json={"title": "Changed"})
+        resp = await test_client.get(url, headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert resp.json()["title"] == "Changed"
+
+    async def test_unconditional_get_skips_the_validator_query(
+        self, test_client, override_event_uc, monkeypatch
+    ):
+        created = await test_client.post("/api/v1/events/", json=upcoming_event)
+        get_last_modified = AsyncMock()
+        monkeypatch.setattr(GetEventUseCase, "get_last_modified", get_last_modified)
+
+        resp = await test_client.get(f"/api/v1/events/{created.json()['id']}")
+
+        assert resp.status_code == 200
+        assert "etag" in resp.headers
+        get_last_modified.assert_not_awaited()
+
+    async def test_get_non_existing_event_endpoint_conditional(
+        self, test_client, override_event_uc
+    ):
+        resp = await test_client.get(
+            "/api/v1/events/999", headers={"If-None-Match": "*"}
+        )
+        assert resp.status_code == 404
+
+    async def test_list_events_endpoint_conditional_requests(
+        self, test_client, override_event_uc
+    ):
+        params = {"page_size": 5}
+        resp = await test_client.get("/api/v1/events/", params=params)
+        etag = resp.headers["etag"]
+
+        resp = await test_client.get(
+            "/api/v1/events/", params=params, headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+
+        # Different query, different representation
+        resp = await test_client.get(
+            "/api/v1/events/", params={"page_size": 6}, headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+
+        await test_client.post("/api/v1/events/", json=upcoming_event)
+        resp = await test_client.get(
+            "/api/v1/events/", params=params, headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
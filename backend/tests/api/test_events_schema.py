@@ -3,7 +3,7 @@ from datetime import UTC, datetime, timedelta
 import pytest
 from pydantic import ValidationError
 
-from app.api.v1.schemas.events_schema import EventCreateRequest
+from app.api.v1.schemas.events_schema import EventCreateRequest, EventUpdateRequest
 
 data = {
     "title": "Concert",
@@ -26,3 +26,8 @@ def test_event_creation_using_valid_schema():
         updated_data["start_time"] = (datetime.now(UTC) + timedelta(weeks=6),)
 
         EventCreateRequest(**data)
+
+
+def test_update_request_leaves_create_request_fields_required():
+    assert EventUpdateRequest.model_fields["title"].is_required() is False
+    assert EventCreateRequest.model_fields["title"].is_required() is True
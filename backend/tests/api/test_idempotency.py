@@ -0,0 +1,154 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.api.idempotency import request_fingerprint, run_idempotent
+from app.api.v1.schemas.events_schema import EventCreateRequest, EventResponse
+from app.application.entities.events.use_cases import CreateEventUseCase
+from app.application.use_cases import EventUseCases, _UseCaseFactory, idempotency_cache
+from app.infrastructure.db.models.event_model import EventModel
+from app.infrastructure.db.repositories.sqlalchemy.idempotency_repo import (
+    SqlAlchemyIdempotencyRepository,
+)
+
+event = {
+    "title": "Concert",
+    "description": "Concert for a cause",
+    "event_type": "concert",
+    "venue": "Cebu City",
+    "capacity": 4,
+    "start_time": (datetime.now(UTC) + timedelta(weeks=4)).isoformat(),
+}
+
+
+@pytest.fixture(scope="function")
+def override_event_uc(wrap_uc_with_test_session):
+    return wrap_uc_with_test_session(EventUseCases)
+
+
+async def count_events(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(EventModel))
+
+
+class TestGroupIdempotencyAPI:
+    async def test_retry_replays_the_stored_response(
+        self, test_client, override_event_uc, test_session_factory
+    ):
+        headers = {"Idempotency-Key": "create-1"}
+        before = await count_events(test_session_factory)
+
+        first = await test_client.post("/api/v1/events/", json=event, headers=headers)
+        retry = await test_client.post("/api/v1/events/", json=event, headers=headers)
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert "idempotent-replayed" not in first.headers
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert await count_events(test_session_factory) == before + 1
+
+        # Replayed from the database once the in-memory entry is gone
+        await idempotency_cache.clear()
+        retry = await test_client.post("/api/v1/events/", json=event, headers=headers)
+        assert retry.json() == first.json()
+
+    async def test_key_reused_for_another_request(self, test_client, override_event_uc):
+        headers = {"Idempotency-Key": "create-2"}
+        await test_client.post("/api/v1/events/", json=event, headers=headers)
+
+        resp = await test_client.post(
+            "/api/v1/events/", json={**event, "capacity": 5}, headers=headers
+        )
+        assert resp.status_code == 422
+
+    async def test_keys_are_scoped_by_route(self, test_client, override_event_uc):
+        headers = {"Idempotency-Key": "create-3"}
+        await test_client.post("/api/v1/events/", json=event, headers=headers)
+
+        resp = await test_client.post(
+            "/api/v1/events/bulk", json=[event], headers=headers
+        )
+        assert resp.status_code == 207
+        assert resp.json()["created"] == 1
+
+    async def test_failed_request_is_not_stored(self, test_client, override_event_uc):
+        headers = {"Idempotency-Key": "bulk-1"}
+        bad_event = {**event, "start_time": "2000-01-01T00:00:00Z"}
+
+        resp = await test_client.post(
+            "/api/v1/events/bulk", json=[bad_event], headers=headers
+        )
+        assert resp.json()["failed"] == 1
+        # Per-item failures are a successful bulk response, and are replayed
+        resp = await test_client.post(
+            "/api/v1/events/bulk", json=[bad_event], headers=headers
+        )
+        assert resp.headers["idempotent-replayed"] == "true"
+
+        resp = await test_client.post(
+            "/api/v1/events/", json=bad_event, headers={"Idempotency-Key": "bad-1"}
+        )
+        assert resp.status_code == 422
+        resp = await test_client.post(
+            "/api/v1/events/", json=event, headers={"Idempotency-Key": "bad-1"}
+        )
+        assert resp.status_code == 201
+
+    async def test_concurrent_duplicates_run_once(
+        self, test_client, override_event_uc, test_session_factory
+    ):
+        headers = {"Idempotency-Key": "create-4"}
+        before = await count_events(test_session_factory)
+
+        responses = await asyncio.gather(
+            *(
+                test_client.post("/api/v1/events/", json=event, headers=headers)
+                for _ in range(10)
+            )
+        )
+
+        assert {resp.status_code for resp in responses} == {201}
+        assert len({resp.json()["id"] for resp in responses}) == 1
+        assert await count_events(test_session_factory) == before + 1
+
+
+async def test_losing_a_cross_process_race_rolls_back_and_replays(
+    file_session_factory,
+):
+    """
+    Another worker commits a response for the key while this request runs: this
+    request's writes are rolled back and the other response is replayed.
+    """
+    await idempotency_cache.clear()
+    use_case = _UseCaseFactory(CreateEventUseCase, file_session_factory)
+    data = EventCreateRequest(**event)
+    scoped_key = "POST /events/:raced"
+
+    async def create_while_another_worker_commits(uc):
+        async with file_session_factory() as session:
+            await SqlAlchemyIdempotencyRepository(session).create(
+                {
+                    "key": scoped_key,
+                    "fingerprint": request_fingerprint(data),
+                    "status_code": 201,
+                    "response_body": {"id": 999},
+                }
+            )
+            await session.commit()
+        return await uc.execute(data)
+
+    resp = await run_idempotent(
+        "raced",
+        scope="POST /events/",
+        request_body=data,
+        use_case=use_case,
+        call=create_while_another_worker_commits,
+        response_model=EventResponse,
+        status_code=201,
+    )
+
+    assert resp.body == b'{"id":999}'
+    assert resp.headers["idempotent-replayed"] == "true"
+    assert await count_events(file_session_factory) == 0
@@ -0,0 +1,65 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.v1.schemas.events_schema import EventResponse, PaginatedEventResponse
+from app.api.v1.serializers import event_page_response, event_response
+from app.domain.entities.events.entities import Event
+
+
+def make_event(id: int, tz: timezone) -> Event:
+    now = datetime(2030, 5, 1, 18, 30, 15, 123456, tzinfo=UTC).astimezone(tz)
+    return Event(
+        id=id,
+        title="Fiesta “Señor” 🎉",
+        description='Quotes " and \\ backslashes',
+        event_type="festival",
+        venue="Cebu City",
+        capacity=100,
+        start_time=now.replace(microsecond=0) + timedelta(days=id),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def validated_body(response_model, content) -> bytes:
+    """The body FastAPI renders after validating against `response_model`."""
+    field = create_model_field("Response", response_model)
+    jsonable = await serialize_response(field=field, response_content=content)
+    return JSONResponse(jsonable).body
+
+
+@pytest.mark.parametrize("tz", [UTC, timezone(timedelta(hours=8))])
+async def test_fast_path_renders_what_validation_renders(tz):
+    events = [make_event(id, tz) for id in range(1, 4)]
+    page = {
+        "items": events,
+        "total": None,
+        "total_estimated": None,
+        "page": None,
+        "page_size": 10,
+        "total_pages": None,
+        "next_cursor": "abc",
+    }
+
+    assert event_response(events[0]).body == await validated_body(
+        EventResponse, events[0]
+    )
+    assert event_page_response(page).body == await validated_body(
+        PaginatedEventResponse, page
+    )
+    empty = {**page, "items": [], "total": 0, "next_cursor": None}
+    assert event_page_response(empty).body == await validated_body(
+        PaginatedEventResponse, empty
+    )
+
+
+async def test_fast_path_keeps_the_status_and_headers():
+    resp = event_response(make_event(1, UTC), status_code=201, headers={"ETag": "x"})
+
+    assert resp.status_code == 201
+    assert resp.headers["etag"] == "x"
+    assert resp.headers["content-type"] == "application/json"
@@ -0,0 +1,391 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.use_cases import EventUseCases, TicketUseCases, waiting_room
+from app.core.config import settings
+
+event = {
+    "title": "Concert",
+    "description": "Concert for a cause",
+    "event_type": "concert",
+    "venue": "Cebu City",
+    "capacity": 100,
+    "start_time": (datetime.now(UTC) + timedelta(weeks=4)).isoformat(),
+}
+
+ticket_type = {"name": "General Admission", "price_cents": 150_000, "capacity": 5}
+
+
+@pytest.fixture(scope="function")
+def override_uc(wrap_uc_with_test_session):
+    wrap_uc_with_test_session(EventUseCases)
+    wrap_uc_with_test_session(TicketUseCases)
+
+
+@pytest.fixture(scope="function")
+async def ticket_type_id(test_client, override_uc):
+    resp = await test_client.post("/api/v1/events/", json=event)
+    event_id = resp.json()["id"]
+    resp = await test_client.post(
+        f"/api/v1/events/{event_id}/ticket-types", json=ticket_type
+    )
+    return resp.json()["id"]
+
+
+class TestGroupTicketAPI:
+    async def test_create_and_list_ticket_types(self, test_client, override_uc):
+        resp = await test_client.post("/api/v1/events/", json=event)
+        event_id = resp.json()["id"]
+
+        resp = await test_client.post(
+            f"/api/v1/events/{event_id}/ticket-types", json=ticket_type
+        )
+        data = resp.json()
+
+        assert resp.status_code == 201
+        assert data["event_id"] == event_id
+        assert (data["sold"], data["available"]) == (0, 5)
+
+        resp = await test_client.get(f"/api/v1/events/{event_id}/ticket-types")
+        assert resp.status_code == 200
+        assert [item["id"] for item in resp.json()] == [data["id"]]
+
+    async def test_ticket_types_of_non_existing_event(self, test_client, override_uc):
+        resp = await test_client.post(
+            "/api/v1/events/9999/ticket-types", json=ticket_type
+        )
+        assert resp.status_code == 404
+
+        resp = await test_client.get("/api/v1/events/9999/ticket-types")
+        assert resp.status_code == 404
+
+    async def test_reserve_tickets(self, test_client, ticket_type_id):
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": 3},
+        )
+        data = resp.json()
+
+        assert resp.status_code == 201
+        assert (data["quantity"], data["status"]) == (3, "reserved")
+
+        resp = await test_client.get(f"/api/v1/reservations/{data['id']}")
+        assert resp.status_code == 200
+
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        assert (resp.json()["sold"], resp.json()["available"]) == (3, 2)
+
+    async def test_reserve_more_than_available(self, test_client, ticket_type_id):
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": 6},
+        )
+        assert resp.status_code == 409
+
+        # Nothing was taken by the failed attempt
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        assert resp.json()["sold"] == 0
+
+    async def test_reserve_non_existing_ticket_type(self, test_client, override_uc):
+        resp = await test_client.post(
+            "/api/v1/ticket-types/9999/reservations", json={"quantity": 1}
+        )
+        assert resp.status_code == 404
+
+    @pytest.mark.parametrize("quantity", [0, 11])
+    async def test_reserve_invalid_quantity(
+        self, test_client, ticket_type_id, quantity
+    ):
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": quantity},
+        )
+        assert resp.status_code == 422
+
+    async def test_cancel_reservation_releases_tickets(
+        self, test_client, ticket_type_id
+    ):
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": 5},
+        )
+        reservation_id = resp.json()["id"]
+
+        resp = await test_client.post(f"/api/v1/reservations/{reservation_id}/cancel")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "cancelled"
+
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        assert resp.json()["sold"] == 0
+
+        # Released once only
+        resp = await test_client.post(f"/api/v1/reservations/{reservation_id}/cancel")
+        assert resp.status_code == 409
+
+        resp = await test_client.post("/api/v1/reservations/9999/cancel")
+        assert resp.status_code == 404
+
+    async def test_hold_and_confirm(self, test_client, ticket_type_id):
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/holds", json={"quantity": 2}
+        )
+        hold = resp.json()
+
+        assert resp.status_code == 201
+        assert hold["quantity"] == 2
+
+        # Held tickets are out of inventory
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        assert resp.json()["sold"] == 2
+
+        resp = await test_client.post(f"/api/v1/holds/{hold['id']}/confirm")
+        assert resp.status_code == 201
+        assert (resp.json()["quantity"], resp.json()["status"]) == (2, "reserved")
+        # Priced at confirmation, with 2 of 5 tickets gone
+        assert resp.json()["unit_price_cents"] == 162_000
+
+        # A hold is consumed by its confirmation
+        resp = await test_client.get(f"/api/v1/holds/{hold['id']}")
+        assert resp.status_code == 404
+        resp = await test_client.post(f"/api/v1/holds/{hold['id']}/confirm")
+        assert resp.status_code == 404
+
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        assert resp.json()["sold"] == 2
+
+    async def test_prices_follow_sales(self, test_client, ticket_type_id):
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        prices_url = f"/api/v1/events/{resp.json()['event_id']}/prices"
+
+        resp = await test_client.get(prices_url)
+        assert resp.status_code == 200
+        assert resp.json() == [
+            {"ticket_type_id": ticket_type_id, "price_cents": 150_000}
+        ]
+
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": 3},
+        )
+        reservation = resp.json()
+        assert reservation["unit_price_cents"] == 150_000
+
+        # 3 of 5 sold: 1 + 0.5 * 0.6 ** 2
+        resp = await test_client.get(prices_url)
+        assert resp.json()[0]["price_cents"] == 177_000
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": 1},
+        )
+        assert resp.json()["unit_price_cents"] == 177_000
+
+        # Cancelled tickets bring the price back down; the reservation keeps its
+        await test_client.post(f"/api/v1/reservations/{reservation['id']}/cancel")
+        resp = await test_client.get(prices_url)
+        assert resp.json()[0]["price_cents"] == 153_000
+        resp = await test_client.get(f"/api/v1/reservations/{reservation['id']}")
+        assert resp.json()["unit_price_cents"] == 150_000
+
+    async def test_prices_of_event_without_ticket_types(self, test_client, override_uc):
+        resp = await test_client.post("/api/v1/events/", json=event)
+        resp = await test_client.get(f"/api/v1/events/{resp.json()['id']}/prices")
+        assert (resp.status_code, resp.json()) == (200, [])
+
+        resp = await test_client.get("/api/v1/events/9999/prices")
+        assert resp.status_code == 404
+
+    async def test_release_hold(self, test_client, ticket_type_id):
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/holds", json={"quantity": 5}
+        )
+        hold_id = resp.json()["id"]
+
+        resp = await test_client.delete(f"/api/v1/holds/{hold_id}")
+        assert resp.status_code == 204
+
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        assert resp.json()["sold"] == 0
+
+        resp = await test_client.delete(f"/api/v1/holds/{hold_id}")
+        assert resp.status_code == 404
+
+    async def test_confirm_expired_hold(self, test_client, ticket_type_id, monkeypatch):
+        monkeypatch.setattr(settings, "TICKET_HOLD_TTL_SECONDS", -1)
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/holds", json={"quantity": 1}
+        )
+        hold_id = resp.json()["id"]
+
+        resp = await test_client.post(f"/api/v1/holds/{hold_id}/confirm")
+        assert resp.status_code == 409
+
+    async def test_shard_ticket_type(self, test_client, ticket_type_id):
+        url = f"/api/v1/ticket-types/{ticket_type_id}"
+        await test_client.post(f"{url}/reservations", json={"quantity": 1})
+
+        resp = await test_client.post(f"{url}/shards", json={"shards": 4})
+        data = resp.json()
+
+        assert resp.status_code == 200
+        assert (data["shard_count"], data["sold"], data["available"]) == (4, 1, 4)
+
+        resp = await test_client.post(f"{url}/shards", json={"shards": 4})
+        assert resp.status_code == 409
+
+        resp = await test_client.post(
+            "/api/v1/ticket-types/9999/shards", json={"shards": 4}
+        )
+        assert resp.status_code == 404
+
+    async def test_sharded_ticket_type_sells_out_exactly(
+        self, test_client, ticket_type_id
+    ):
+        url = f"/api/v1/ticket-types/{ticket_type_id}"
+        await test_client.post(f"{url}/shards", json={"shards": 4})
+
+        resp = await test_client.post(f"{url}/reservations", json={"quantity": 3})
+        assert resp.status_code == 201
+        reservation_id = resp.json()["id"]
+
+        resp = await test_client.post(f"{url}/reservations", json={"quantity": 3})
+        assert resp.status_code == 409
+
+        resp = await test_client.post(f"{url}/reservations", json={"quantity": 2})
+        assert resp.status_code == 201
+
+        resp = await test_client.get(url)
+        assert (resp.json()["sold"], resp.json()["available"]) == (5, 0)
+
+        # Released tickets can be bought again
+        await test_client.post(f"/api/v1/reservations/{reservation_id}/cancel")
+        resp = await test_client.post(f"{url}/reservations", json={"quantity": 3})
+        assert resp.status_code == 201
+
+        resp = await test_client.get(url)
+        assert (resp.json()["sold"], resp.json()["available"]) == (5, 0)
+
+    async def test_rebalance_unsharded_ticket_type(self, test_client, ticket_type_id):
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/shards/rebalance"
+        )
+        assert resp.status_code == 409
+
+
+@pytest.fixture(scope="function")
+def waiting_room_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "WAITING_ROOM_ENABLED", True)
+    monkeypatch.setattr(waiting_room, "_configs", {})
+    return waiting_room
+
+
+class TestGroupWaitingRoomAPI:
+    async def test_join_and_purchase(
+        self, test_client, ticket_type_id, waiting_room_enabled
+    ):
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        event_id = resp.json()["event_id"]
+
+        resp = await test_client.post(f"/api/v1/events/{event_id}/queue")
+        data = resp.json()
+        assert resp.status_code == 201
+        assert data["admitted"] is True
+
+        headers = {"X-Queue-Token": data["token"]}
+        resp = await test_client.get(
+            f"/api/v1/events/{event_id}/queue", headers=headers
+        )
+        assert resp.json()["admitted"] is True
+
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": 1},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+
+    async def test_waiting_clients_never_reach_the_database(
+        self, test_client, ticket_type_id, waiting_room_enabled, monkeypatch
+    ):
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        event_id = resp.json()["event_id"]
+        waiting_room_enabled.configure(event_id, rate=0.001, burst=0)
+        session_factory = Mock(side_effect=AssertionError("database was used"))
+        monkeypatch.setattr(
+            TicketUseCases.reserve_tickets, "_session_factory", session_factory
+        )
+
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations", json={"quantity": 1}
+        )
+        assert resp.status_code == 403
+
+        await test_client.post(f"/api/v1/events/{event_id}/queue")
+        resp = await test_client.post(f"/api/v1/events/{event_id}/queue")
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": 1},
+            headers={"X-Queue-Token": resp.json()["token"]},
+        )
+        assert resp.status_code == 429
+        assert int(resp.headers["Retry-After"]) > 0
+        assert resp.json()["detail"]["position"] >= 1
+        session_factory.assert_not_called()
+
+    async def test_token_for_another_event_is_forbidden(
+        self, test_client, ticket_type_id, waiting_room_enabled
+    ):
+        resp = await test_client.post("/api/v1/events/9999/queue")
+        headers = {"X-Queue-Token": resp.json()["token"]}
+
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/holds",
+            json={"quantity": 1},
+            headers=headers,
+        )
+        assert resp.status_code == 403
+
+        resp = await test_client.get("/api/v1/events/1/queue", headers=headers)
+        assert resp.status_code == 403
+
+    async def test_token_buys_once(
+        self, test_client, ticket_type_id, waiting_room_enabled
+    ):
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        event_id = resp.json()["event_id"]
+        resp = await test_client.post(f"/api/v1/events/{event_id}/queue")
+        headers = {"X-Queue-Token": resp.json()["token"]}
+        url = f"/api/v1/ticket-types/{ticket_type_id}/reservations"
+
+        # A failed purchase gives the place back
+        resp = await test_client.post(url, json={"quantity": 10}, headers=headers)
+        assert resp.status_code == 409
+
+        resp = await test_client.post(url, json={"quantity": 1}, headers=headers)
+        assert resp.status_code == 201
+
+        resp = await test_client.post(url, json={"quantity": 1}, headers=headers)
+        assert resp.status_code == 403
+        assert resp.json()["detail"] == "Queue token has already been used."
+
+    async def test_purchase_retry_with_idempotency_key_is_replayed(
+        self, test_client, ticket_type_id, waiting_room_enabled
+    ):
+        resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+        event_id = resp.json()["event_id"]
+        resp = await test_client.post(f"/api/v1/events/{event_id}/queue")
+        headers = {"X-Queue-Token": resp.json()["token"], "Idempotency-Key": "buy-1"}
+        url = f"/api/v1/ticket-types/{ticket_type_id}/reservations"
+
+        first = await test_client.post(url, json={"quantity": 1}, headers=headers)
+        retry = await test_client.post(url, json={"quantity": 1}, headers=headers)
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert retry.headers["idempotent-replayed"] == "true"
+
+        # The token is bound to the key: it cannot buy again under another one
+        headers["Idempotency-Key"] = "buy-2"
+        resp = await test_client.post(url, json={"quantity": 1}, headers=headers)
+        assert resp.status_code == 403
@@ -9,6 +9,7 @@ from app.application.entities.events.use_cases import CreateEventUseCase
 from app.application.use_cases import EventUseCases
 from app.domain.entities.events.entities import Event
 from app.domain.entities.events.services import EventService
+from app.infrastructure.cache.memory_cache import InMemoryCache
 from tests.utils import generate_random_string
 
 event_data = {
@@ -37,6 +38,90 @@ class TestGroupEventUseCases:
 
         repo.create.assert_called_once()
 
+    async def test_list_events_with_estimated_total_uses_planner_estimate(self):
+        repo = AsyncMock()
+        repo.estimate_count.return_value = 1000
+        repo.get_paginated_events.return_value = []
+        service = EventService(repo)
+
+        events, total, estimated = await service.list_events_with_estimated_total(
+            offset=0, limit=10
+        )
+
+        assert (events, total, estimated) == ([], 1000, True)
+        repo.get_paginated_events_with_total.assert_not_called()
+
+    async def test_get_event_is_served_from_cache(self):
+        repo = AsyncMock()
+        repo.get.return_value = Event(
+            id=1, created_at=None, updated_at=None, **event_data
+        )
+        service = EventService(repo, cache=InMemoryCache(max_size=10, ttl=60))
+
+        first = await service.get_event_by_id(1)
+        second = await service.get_event_by_id(1)
+
+        assert first is second
+        repo.get.assert_awaited_once_with(1)
+
+    async def test_update_event_evicts_cache_only_on_commit(self):
+        cache = InMemoryCache(max_size=10, ttl=60)
+        repo = AsyncMock()
+        repo.get.return_value = Event(
+            id=1, created_at=None, updated_at=None, **event_data
+        )
+        service = EventService(repo, cache=cache)
+        await service.get_event_by_id(1)
+
+        await service.update_event(1, EventUpdateRequest(title="Updated"))
+        assert await cache.get("event:1") is not None
+
+        await service.on_commit()
+        assert await cache.get("event:1") is None
+
+    async def test_read_racing_an_update_is_not_cached(self):
+        """
+        A GET that read the row before a PATCH committed must not put the old row
+        back in the cache after the PATCH evicted it, even when the cache churns
+        in between.
+        """
+        cache = InMemoryCache(max_size=1, ttl=60)
+        versions = InMemoryCache(max_size=10, ttl=600)
+        old_time = datetime.now(UTC)
+        old = Event(id=1, created_at=old_time, updated_at=old_time, **event_data)
+        new = Event(
+            id=1,
+            created_at=old_time,
+            updated_at=old_time + timedelta(seconds=1),
+            **{**event_data, "title": "Updated"},
+        )
+        writer = EventService(
+            AsyncMock(**{"update.return_value": new}),
+            cache=cache,
+            version_cache=versions,
+        )
+
+        async def read_then_commit_update(event_id):
+            await writer.update_event(event_id, EventUpdateRequest(title="Updated"))
+            await writer.on_commit()
+            # Other events fill the cache while the read is in flight
+            await cache.set("event:2", object())
+            return old
+
+        reader = EventService(
+            AsyncMock(**{"get.side_effect": read_then_commit_update}),
+            cache=cache,
+            version_cache=versions,
+        )
+
+        assert await reader.get_event_by_id(1) is old
+        assert await cache.get("event:1") is None
+
+        reader._repo.get.side_effect = None
+        reader._repo.get.return_value = new
+        await reader.get_event_by_id(1)
+        assert await cache.get("event:1") is new
+
     async def test_created_event_use_case(self, override_event_uc):
         async with EventUseCases.create_event() as use_case:
             req_event_data = EventCreateRequest(**event_data)
@@ -68,6 +153,17 @@ class TestGroupEventUseCases:
             # Parameters are default
             assert result["page"] == 1
             assert result["page_size"] == 10
+            assert result["total_estimated"] is False
+
+    async def test_list_events_use_case_estimated_total_falls_back_to_exact(
+        self, override_event_uc
+    ):
+        async with EventUseCases.list_events() as use_case:
+            result: dict = await use_case.execute(estimate_total=True)
+
+            # SQLite has no planner statistics
+            assert result["total"] == 1
+            assert result["total_estimated"] is False
 
     async def test_update_event_use_case_(self, override_event_uc):
         async with EventUseCases.update_event() as use_case:
@@ -79,3 +175,32 @@ class TestGroupEventUseCases:
 
             assert result.description == event_data.description
             assert abs(result.updated_at - datetime.now(UTC)) < timedelta(seconds=5)
+
+    async def test_list_events_use_case_with_cursor(self, override_event_uc):
+        async with EventUseCases.create_event() as use_case:
+            await use_case.execute(EventCreateRequest(**event_data))
+
+        async with EventUseCases.list_events() as use_case:
+            first: dict = await use_case.execute(page_size=1)
+            second: dict = await use_case.execute(
+                page_size=1, cursor=first["next_cursor"]
+            )
+
+        assert first["next_cursor"] is not None
+        assert second["items"][0].id != first["items"][0].id
+        # Keyset mode skips totals
+        assert second["total"] is None
+        assert second["next_cursor"] is None
+
+    async def test_get_event_after_update_is_not_stale(self, override_event_uc):
+        async with EventUseCases.get_event() as use_case:
+            await use_case.execute(1)  # Warm the cache
+
+        description = f"Fresh description {generate_random_string()}"
+        async with EventUseCases.update_event() as use_case:
+            await use_case.execute(1, EventUpdateRequest(description=description))
+
+        async with EventUseCases.get_event() as use_case:
+            result = await use_case.execute(1)
+
+        assert result.description == description
@@ -0,0 +1,151 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.application.entities.tickets.use_cases import (
+    ConfirmHoldUseCase,
+    ExpireHoldsUseCase,
+    ReleaseHoldUseCase,
+)
+from app.application.http_exceptions import ConflictException, NotFoundException
+from app.application.use_cases import _UseCaseFactory
+from app.application.workers.hold_sweeper import HoldSweeper
+from app.core.config import settings
+from app.infrastructure.db.models.ticket_model import HoldModel
+from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventRepository,
+)
+from app.infrastructure.db.repositories.sqlalchemy.ticket_repo import (
+    SqlAlchemyHoldRepository,
+    SqlAlchemyTicketTypeRepository,
+)
+
+event_data = {
+    "title": "Concert",
+    "description": "Live",
+    "event_type": "concert",
+    "venue": "Cebu City",
+    "capacity": 20,
+    "start_time": datetime.now(UTC) + timedelta(weeks=5),
+}
+
+
+@pytest.fixture(scope="function")
+def sweeper(test_session_factory):
+    expire_holds = _UseCaseFactory(ExpireHoldsUseCase, test_session_factory)
+    return HoldSweeper(expire_holds, batch_size=2, interval=0.01)
+
+
+async def place_holds(session_factory, quantities, expires_at):
+    """Hold `quantities` tickets of a new ticket type; returns its id."""
+    async with session_factory() as session:
+        event = await SqlAlchemyEventRepository(session).create(event_data)
+        ticket_types = SqlAlchemyTicketTypeRepository(session)
+        ticket_type = await ticket_types.create(
+            {"event_id": event.id, "name": "GA", "price_cents": 100, "capacity": 20}
+        )
+        holds = SqlAlchemyHoldRepository(session)
+        for quantity in quantities:
+            await ticket_types.reserve(ticket_type.id, quantity)
+            await holds.create(
+                {
+                    "ticket_type_id": ticket_type.id,
+                    "quantity": quantity,
+                    "expires_at": expires_at,
+                }
+            )
+        await session.commit()
+    return ticket_type.id
+
+
+async def get_sold(session_factory, ticket_type_id):
+    async with session_factory() as session:
+        ticket_type = await SqlAlchemyTicketTypeRepository(session).get(ticket_type_id)
+    return ticket_type.sold
+
+
+async def get_hold_ids(session_factory, ticket_type_id):
+    async with session_factory() as session:
+        result = await session.execute(
+            select(HoldModel.id).where(HoldModel.ticket_type_id == ticket_type_id)
+        )
+    return list(result.scalars())
+
+
+async def test_sweep_releases_expired_holds_in_batches(sweeper, test_session_factory):
+    expired_at = datetime.now(UTC) - timedelta(minutes=1)
+    first = await place_holds(test_session_factory, [1, 2, 3], expired_at)
+    second = await place_holds(test_session_factory, [4, 5], expired_at)
+    active = await place_holds(
+        test_session_factory, [6], datetime.now(UTC) + timedelta(minutes=10)
+    )
+
+    released = await sweeper.sweep()
+
+    assert released == 5
+    assert await get_sold(test_session_factory, first) == 0
+    assert await get_sold(test_session_factory, second) == 0
+    # Unexpired holds are left alone
+    assert await get_sold(test_session_factory, active) == 6
+
+    stats = sweeper.stats()
+    assert stats["batches"] == 3
+    assert (stats["holds_released"], stats["tickets_released"]) == (5, 15)
+    assert stats["last_lag_seconds"] >= 60
+    assert stats["max_lag_seconds"] == stats["last_lag_seconds"]
+
+    # Nothing left to do
+    assert await sweeper.sweep() == 0
+    assert sweeper.stats()["last_lag_seconds"] == 0
+
+
+async def test_sweeper_runs_in_background(sweeper, test_session_factory):
+    expired_at = datetime.now(UTC) - timedelta(seconds=1)
+    ticket_type_id = await place_holds(test_session_factory, [2], expired_at)
+
+    sweeper.start()
+    assert sweeper.running
+    try:
+        for _ in range(100):
+            if sweeper.stats()["holds_released"]:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await sweeper.stop()
+
+    assert not sweeper.running
+    assert await get_sold(test_session_factory, ticket_type_id) == 0
+
+
+async def test_swept_hold_is_reported_expired_until_purged(
+    sweeper, test_session_factory
+):
+    expired_at = datetime.now(UTC) - timedelta(minutes=1)
+    ticket_type_id = await place_holds(test_session_factory, [2], expired_at)
+    [hold_id] = await get_hold_ids(test_session_factory, ticket_type_id)
+    confirm_hold = _UseCaseFactory(ConfirmHoldUseCase, test_session_factory)
+    release_hold = _UseCaseFactory(ReleaseHoldUseCase, test_session_factory)
+
+    assert await sweeper.sweep() == 1
+
+    with pytest.raises(ConflictException, match="Hold has expired."):
+        async with confirm_hold() as use_case:
+            await use_case.execute(hold_id)
+    with pytest.raises(ConflictException, match="Hold has expired."):
+        async with release_hold() as use_case:
+            await use_case.execute(hold_id)
+    # Tickets were returned once, by the sweeper
+    assert await get_sold(test_session_factory, ticket_type_id) == 0
+
+    # Once the retention period has passed the hold is deleted
+    expire_holds = _UseCaseFactory(ExpireHoldsUseCase, test_session_factory)
+    later = datetime.now(UTC) + timedelta(seconds=settings.HOLD_RETENTION_SECONDS)
+    async with expire_holds() as use_case:
+        await use_case.execute(batch_size=10, now=later)
+
+    assert await get_hold_ids(test_session_factory, ticket_type_id) == []
+    with pytest.raises(NotFoundException):
+        async with confirm_hold() as use_case:
+            await use_case.execute(hold_id)
@@ -0,0 +1,276 @@
+import asyncio
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.application.entities.outbox.use_cases import (
+    ClaimOutboxMessagesUseCase,
+    GetOutboxBacklogUseCase,
+    SettleOutboxMessagesUseCase,
+)
+from app.application.entities.tickets.use_cases import (
+    CancelReservationUseCase,
+    ReserveTicketsUseCase,
+)
+from app.application.http_exceptions import ConflictException
+from app.application.payments import payment_handlers
+from app.application.use_cases import _UseCaseFactory, price_cache, ticket_type_cache
+from app.application.workers.outbox_dispatcher import OutboxDispatcher
+from app.domain.abc.payment_provider import PaymentProvider
+from app.domain.entities.outbox.services import OutboxService
+from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventRepository,
+)
+from app.infrastructure.db.repositories.sqlalchemy.outbox_repo import (
+    SqlAlchemyOutboxRepository,
+)
+from app.infrastructure.db.repositories.sqlalchemy.ticket_repo import (
+    SqlAlchemyTicketTypeRepository,
+)
+
+event_data = {
+    "title": "Concert",
+    "description": "Live",
+    "event_type": "concert",
+    "venue": "Cebu City",
+    "capacity": 20,
+    "start_time": datetime.now(UTC) + timedelta(weeks=5),
+}
+
+
+class FakePaymentProvider(PaymentProvider):
+    """In-memory payment gateway that can be told to fail the next calls."""
+
+    def __init__(self) -> None:
+        self.charges: dict[str, int] = {}
+        self.refunds: set[str] = set()
+        self.calls: list[str] = []
+        self.failures = 0
+
+    def _call(self, name: str) -> None:
+        self.calls.append(name)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("payment provider unavailable")
+
+    async def charge(
+        self, *, reference: str, amount_cents: int, idempotency_key: str
+    ) -> str:
+        self._call(f"charge {reference}")
+        self.charges.setdefault(idempotency_key, amount_cents)
+        return idempotency_key
+
+    async def refund(self, *, reference: str, idempotency_key: str) -> None:
+        self._call(f"refund {reference}")
+        self.refunds.add(reference)
+
+
+@pytest.fixture(scope="function")
+async def session_factory(file_session_factory):
+    # Ids restart with every database
+    await ticket_type_cache.clear()
+    await price_cache.clear()
+    return file_session_factory
+
+
+def make_dispatcher(session_factory, **kwargs) -> OutboxDispatcher:
+    options = {
+        "batch_size": 10,
+        "interval": 0.01,
+        "concurrency": 4,
+        "handler_timeout": 1.0,
+        "max_attempts": 3,
+        "retry_base": 0.0,
+        "retry_max": 0.0,
+        **kwargs,
+    }
+    return OutboxDispatcher(
+        _UseCaseFactory(ClaimOutboxMessagesUseCase, session_factory),
+        _UseCaseFactory(SettleOutboxMessagesUseCase, session_factory),
+        _UseCaseFactory(GetOutboxBacklogUseCase, session_factory),
+        **options,
+    )
+
+
+async def publish(session_factory, topic, payloads, *, key=None):
+    async with session_factory() as session:
+        outbox = OutboxService(SqlAlchemyOutboxRepository(session))
+        for payload in payloads:
+            outbox.publish(topic, payload, key=key)
+        await outbox.before_commit()
+        await session.commit()
+
+
+async def create_ticket_type(session_factory, capacity=5) -> int:
+    async with session_factory() as session:
+        event = await SqlAlchemyEventRepository(session).create(event_data)
+        ticket_type = await SqlAlchemyTicketTypeRepository(session).create(
+            {
+                "event_id": event.id,
+                "name": "GA",
+                "price_cents": 1000,
+                "capacity": capacity,
+            }
+        )
+        await session.commit()
+    return ticket_type.id
+
+
+async def test_reservations_are_charged_after_commit(session_factory):
+    provider = FakePaymentProvider()
+    dispatcher = make_dispatcher(session_factory)
+    for topic, handler in payment_handlers(provider).items():
+        dispatcher.register(topic, handler)
+    ticket_type_id = await create_ticket_type(session_factory)
+
+    async with _UseCaseFactory(ReserveTicketsUseCase, session_factory)() as uc:
+        reservation = await uc.execute(ticket_type_id, 2)
+    # A failed reservation publishes nothing
+    with pytest.raises(ConflictException):
+        async with _UseCaseFactory(ReserveTicketsUseCase, session_factory)() as uc:
+            await uc.execute(ticket_type_id, 5)
+
+    # Nothing is charged on the request path
+    assert provider.calls == []
+    assert (await dispatcher.backlog())["pending"] == 1
+
+    assert await dispatcher.dispatch() == 1
+    assert provider.charges == {f"charge:reservation:{reservation.id}": 2000}
+
+    async with _UseCaseFactory(CancelReservationUseCase, session_factory)() as uc:
+        await uc.execute(reservation.id)
+    await dispatcher.dispatch()
+
+    assert provider.refunds == {f"reservation:{reservation.id}"}
+    backlog = await dispatcher.backlog()
+    assert (backlog["pending"], backlog["dead"]) == (0, 0)
+    assert dispatcher.stats()["delivered"] == 2
+
+
+async def test_failed_delivery_is_retried_then_marked_dead(session_factory):
+    provider = FakePaymentProvider()
+    dispatcher = make_dispatcher(session_factory, max_attempts=2)
+    for topic, handler in payment_handlers(provider).items():
+        dispatcher.register(topic, handler)
+    payload = {"reservation_id": 1, "quantity": 1, "unit_price_cents": 500}
+    await publish(session_factory, "reservation.created", [payload])
+
+    provider.failures = 1
+    assert await dispatcher.dispatch() == 0
+    backlog = await dispatcher.backlog()
+    assert backlog["pending"] == 1
+    assert dispatcher.stats()["retried"] == 1
+
+    assert await dispatcher.dispatch() == 1
+    assert provider.charges == {"charge:reservation:1": 500}
+
+    await publish(session_factory, "reservation.created", [{**payload, "quantity": 2}])
+    provider.failures = 2
+    await dispatcher.dispatch()
+    await dispatcher.dispatch()
+
+    backlog = await dispatcher.backlog()
+    assert (backlog["pending"], backlog["dead"]) == (0, 1)
+    assert backlog["topics"]["reservation.created"]["dead"] == 1
+    assert dispatcher.stats()["dead"] == 1
+
+
+async def test_retries_back_off_exponentially(session_factory):
+    dispatcher = make_dispatcher(session_factory, retry_base=1.0, retry_max=30.0)
+
+    delays = [dispatcher.retry_delay(attempts) for attempts in range(1, 8)]
+
+    for attempts, delay in enumerate(delays, start=1):
+        full = min(30.0, 2.0 ** (attempts - 1))
+        assert full / 2 <= delay <= full
+
+
+async def test_backoff_delays_the_next_attempt(session_factory):
+    calls = []
+
+    async def failing(message):
+        calls.append(message.id)
+        raise RuntimeError("boom")
+
+    dispatcher = make_dispatcher(session_factory, retry_base=60.0, retry_max=60.0)
+    dispatcher.register("test.failing", failing)
+    await publish(session_factory, "test.failing", [{}])
+
+    await dispatcher.dispatch()
+    await dispatcher.dispatch()
+
+    assert len(calls) == 1
+    assert (await dispatcher.backlog())["due"] == 0
+
+
+async def test_messages_with_the_same_key_are_delivered_in_order(session_factory):
+    provider = FakePaymentProvider()
+    dispatcher = make_dispatcher(session_factory)
+    for topic, handler in payment_handlers(provider).items():
+        dispatcher.register(topic, handler)
+    payload = {"reservation_id": 7, "quantity": 1, "unit_price_cents": 500}
+    await publish(session_factory, "reservation.created", [payload], key="r7")
+    await publish(session_factory, "reservation.cancelled", [payload], key="r7")
+
+    # The refund waits for the charge, even while the charge is being retried
+    provider.failures = 1
+    await dispatcher.dispatch()
+    assert provider.calls == ["charge reservation:7"]
+
+    await dispatcher.dispatch()
+    await dispatcher.dispatch()
+    assert provider.calls == [
+        "charge reservation:7",
+        "charge reservation:7",
+        "refund reservation:7",
+    ]
+
+
+async def test_topics_without_a_handler_wait(session_factory):
+    dispatcher = make_dispatcher(session_factory)
+    await publish(session_factory, "search.reindex", [{"event_id": 1}])
+
+    assert await dispatcher.dispatch() == 0
+
+    backlog = await dispatcher.backlog()
+    assert backlog["topics"] == {"search.reindex": {"pending": 1, "dead": 0}}
+    assert backlog["oldest_pending_at"] is not None
+
+
+async def test_claims_of_a_dead_dispatcher_expire(session_factory):
+    await publish(session_factory, "test.topic", [{}])
+    now = datetime.now(UTC)
+
+    async def claim(at, claimed_until):
+        async with _UseCaseFactory(ClaimOutboxMessagesUseCase, session_factory)() as uc:
+            return await uc.execute(
+                ["test.topic"], now=at, claimed_until=claimed_until, limit=10
+            )
+
+    (message,) = await claim(now, now + timedelta(seconds=30))
+    assert message.attempts == 1
+    # Claimed, and never settled
+    assert await claim(now, now + timedelta(seconds=30)) == []
+
+    later = now + timedelta(seconds=31)
+    (message,) = await claim(later, later + timedelta(seconds=30))
+    assert message.attempts == 2
+
+
+async def test_concurrent_dispatchers_deliver_each_message_once(session_factory):
+    deliveries: Counter[int] = Counter()
+
+    async def handler(message):
+        await asyncio.sleep(0.001)
+        deliveries[message.payload["n"]] += 1
+
+    dispatchers = [make_dispatcher(session_factory, batch_size=5) for _ in range(4)]
+    for dispatcher in dispatchers:
+        dispatcher.register("test.topic", handler)
+    await publish(session_factory, "test.topic", [{"n": n} for n in range(100)])
+
+    delivered = await asyncio.gather(*(d.dispatch() for d in dispatchers))
+
+    assert sum(delivered) == 100
+    assert deliveries == Counter(range(100))
@@ -0,0 +1,68 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from app.application.http_exceptions import BadRequestException
+from app.application.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+    hash_filters,
+)
+
+
+def test_cursor_round_trip_normalizes_to_utc():
+    start_time = datetime(2030, 5, 1, 18, 30, tzinfo=timezone(timedelta(hours=8)))
+
+    cursor = encode_cursor(start_time, 42, sort="start_time", filters_hash="abc")
+
+    decoded_start_time, decoded_id = decode_cursor(
+        cursor, sort="start_time", filters_hash="abc"
+    )
+
+    assert decoded_start_time == start_time
+    assert decoded_start_time.tzinfo == UTC
+    assert decoded_id == 42
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "WyJ4IiwgMV0"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(BadRequestException):
+        decode_cursor(cursor, sort="start_time", filters_hash="abc")
+
+
+@pytest.mark.parametrize(
+    ("sort", "filters_hash"), [("-start_time", "abc"), ("start_time", "def")]
+)
+def test_decode_cursor_for_another_listing(sort, filters_hash):
+    cursor = encode_cursor(
+        datetime(2030, 5, 1, tzinfo=UTC), 42, sort="start_time", filters_hash="abc"
+    )
+
+    with pytest.raises(BadRequestException, match="does not match"):
+        decode_cursor(cursor, sort=sort, filters_hash=filters_hash)
+
+
+def test_hash_filters_normalizes_datetimes_to_utc():
+    start_time = datetime(2030, 5, 1, 18, 30, tzinfo=timezone(timedelta(hours=8)))
+
+    assert hash_filters({"starts_from": start_time}) == hash_filters(
+        {"starts_from": start_time.astimezone(UTC)}
+    )
+    assert hash_filters({"venue": "Cebu"}) != hash_filters({"venue": "Bohol"})
+
+
+def test_rank_cursor_round_trip():
+    assert decode_rank_cursor(encode_rank_cursor(1.2345678901234567, 7)) == (
+        1.2345678901234567,
+        7,
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor", ["", "not-a-cursor", "W10", "WyJ4IiwgMV0", "W3RydWUsIDFd"]
+)
+def test_decode_invalid_rank_cursor(cursor):
+    with pytest.raises(BadRequestException):
+        decode_rank_cursor(cursor)
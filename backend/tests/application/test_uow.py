@@ -58,3 +58,79 @@ async def test_get_repo_returns_repo_with_session():
         # Assertions
         assert isinstance(repo, DummyRepo)
         assert repo.session is mock_session
+
+
+async def test_uow_runs_commit_hooks_after_commit():
+    calls = []
+    mock_session = AsyncMock()
+    mock_session.commit.side_effect = lambda: calls.append("commit")
+    uow = SQLAlchemyUnitOfWork(lambda: mock_session)
+
+    async def hook():
+        calls.append("hook")
+
+    async with uow:
+        uow.add_commit_hook(hook)
+
+    assert calls == ["commit", "hook"]
+
+
+async def test_uow_skips_commit_hooks_on_rollback():
+    hook = AsyncMock()
+    uow = SQLAlchemyUnitOfWork(lambda: AsyncMock())
+
+    with pytest.raises(RuntimeError):
+        async with uow:
+            uow.add_commit_hook(hook)
+            raise RuntimeError("fail")
+
+    hook.assert_not_awaited()
+
+
+async def test_read_only_uow_never_commits():
+    mock_session = AsyncMock()
+    hook = AsyncMock()
+    uow = SQLAlchemyUnitOfWork(lambda: mock_session, read_only=True)
+
+    async with uow:
+        uow.add_commit_hook(hook)
+
+    mock_session.commit.assert_not_awaited()
+    mock_session.rollback.assert_awaited_once()
+    mock_session.close.assert_awaited_once()
+    hook.assert_not_awaited()
+
+
+async def test_uow_runs_pre_commit_hooks_in_the_transaction():
+    calls = []
+    mock_session = AsyncMock()
+    mock_session.commit.side_effect = lambda: calls.append("commit")
+    uow = SQLAlchemyUnitOfWork(lambda: mock_session)
+
+    async def pre_commit_hook():
+        calls.append("pre-commit hook")
+
+    async def hook():
+        calls.append("hook")
+
+    async with uow:
+        uow.add_commit_hook(hook)
+        uow.add_pre_commit_hook(pre_commit_hook)
+
+    assert calls == ["pre-commit hook", "commit", "hook"]
+
+
+async def test_failing_pre_commit_hook_rolls_back():
+    mock_session = AsyncMock()
+    hook = AsyncMock()
+    uow = SQLAlchemyUnitOfWork(lambda: mock_session)
+
+    with pytest.raises(RuntimeError):
+        async with uow:
+            uow.add_pre_commit_hook(AsyncMock(side_effect=RuntimeError("fail")))
+            uow.add_commit_hook(hook)
+
+    mock_session.commit.assert_not_awaited()
+    mock_session.rollback.assert_awaited_once()
+    mock_session.close.assert_awaited_once()
+    hook.assert_not_awaited()
@@ -1,16 +1,20 @@
+import inspect
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.api.v1.schemas.events_schema import EventCreateRequest
+from app.api.v1.schemas.events_schema import EventCreateRequest, EventUpdateRequest
 from app.application.use_case_factory.common import ServiceSpec
 from app.application.use_case_factory.factory import UseCaseFactory
-from app.application.use_cases import SERVICE_REGISTRY
+from app.application.use_cases import SERVICE_REGISTRY, event_cache
 from app.domain.entities.events.entities import Event
 from app.domain.entities.events.services import EventService
+from app.infrastructure.db.models.base import ModelBase
 from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventReadRepository,
     SqlAlchemyEventRepository,
 )
 
@@ -56,6 +60,13 @@ class CustomCreateEventUseCase:
         raise RuntimeError("Simulated RunTimeError")
 
 
+class ReadOnlyEventUseCase:
+    read_only = True
+
+    def __init__(self, event_service: EventService):
+        self.event_service = event_service
+
+
 # Update service registry for testing
 sample_service = {
     "sample_service": ServiceSpec(EventService, SqlAlchemyEventRepository),
@@ -65,6 +76,16 @@ SERVICE_REGISTRY.update(sample_service)
 UseCaseFactoryWithServices = UseCaseFactory.register_services(SERVICE_REGISTRY)
 
 
+@pytest.fixture(scope="module")
+async def replica_session_factory():
+    """A second, separate database standing in for a read replica."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(ModelBase.metadata.create_all)
+    yield async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
 event_data = {
     "title": "Concert",
     "description": "Some descr here.",
@@ -78,21 +99,17 @@ event_data = {
 class TestUseCaseFactoryGroup:
     async def test_use_case_factory_not_called(self, test_session_factory):
         """
-        Test that the factory's __call__ is awaited.
+        Test that the factory must be called to get a use case context.
 
-        Calling a factory generated `bare_uc` instead of `bare_uc()`
+        Using a factory generated `bare_uc` instead of `bare_uc()` fails loudly,
+        since the factory itself is shared and holds no per-request state.
         """
         bare_uc = UseCaseFactory(BareUseCase, test_session_factory)
 
-        with (
-            pytest.raises(AssertionError),
-            patch.object(bare_uc, "__call__", new_callable=AsyncMock) as mock_call,
-        ):
+        with pytest.raises(TypeError):
             async with bare_uc as use_case:
                 use_case.execute()
 
-            mock_call.assert_awaited_once()
-
     async def test_use_case_factory_having_no_registred_services(
         self, test_session_factory
     ):
@@ -168,3 +185,139 @@ class TestUseCaseFactoryGroup:
 
             # Created 3 instances
             assert result.id == 3
+
+    async def test_use_case_factory_read_only_uses_read_repo(
+        self, test_session_factory
+    ):
+        """Read-only use cases are wired with the registered read repository."""
+        read_uc = UseCaseFactoryWithServices(ReadOnlyEventUseCase, test_session_factory)
+        write_uc = UseCaseFactoryWithServices(
+            CustomCreateEventUseCase, test_session_factory
+        )
+
+        async with read_uc() as use_case:
+            repo = use_case.event_service._repo
+            assert isinstance(repo, SqlAlchemyEventReadRepository)
+
+        async with write_uc() as use_case:
+            repo = use_case._event_service._repo
+            assert not isinstance(repo, SqlAlchemyEventReadRepository)
+
+    async def test_use_case_factory_resolves_plan_once(self, test_session_factory):
+        """Constructor inspection happens once, not on every request."""
+        test_event_uc = UseCaseFactoryWithServices(
+            CustomCreateEventUseCase, test_session_factory
+        )
+
+        with patch(
+            "app.application.use_case_factory.factory.inspect.signature",
+            wraps=inspect.signature,
+        ) as signature:
+            for _ in range(3):
+                async with test_event_uc():
+                    pass
+
+        signature.assert_called_once()
+
+    async def test_use_case_factory_contexts_are_independent(
+        self, test_session_factory
+    ):
+        """Each call gets its own Unit of Work, even when contexts overlap."""
+        test_event_uc = UseCaseFactoryWithServices(
+            CustomCreateEventUseCase, test_session_factory
+        )
+        first_ctx, second_ctx = test_event_uc(), test_event_uc()
+
+        async with first_ctx as first, second_ctx as second:
+            assert first_ctx.uow is not second_ctx.uow
+            assert first._event_service._repo.session is first_ctx.uow.session
+            assert second._event_service._repo.session is second_ctx.uow.session
+
+    async def test_use_case_factory_routes_read_only_to_replica(
+        self, test_session_factory, replica_session_factory
+    ):
+        """Read-only use cases run on the read session factory, writes do not."""
+        read_uc = UseCaseFactoryWithServices(
+            ReadOnlyEventUseCase, test_session_factory, replica_session_factory
+        )
+        write_uc = UseCaseFactoryWithServices(
+            CustomCreateEventUseCase, test_session_factory, replica_session_factory
+        )
+
+        async with write_uc() as use_case:
+            await use_case.execute_happy_case(EventCreateRequest(**event_data))
+
+        async with read_uc() as use_case:
+            # The writes went to the primary only
+            _, total = await use_case.event_service.list_events(offset=0, limit=10)
+            assert total == 0
+
+        async with replica_session_factory() as session:
+            await SqlAlchemyEventRepository(session).create(event_data)
+            await session.commit()
+
+        ctx = read_uc()
+        async with ctx as use_case:
+            assert ctx.uow.read_only is True
+            _, total = await use_case.event_service.list_events(offset=0, limit=10)
+            assert total == 1
+
+    async def test_lagging_replica_read_is_not_cached(
+        self, test_session_factory, replica_session_factory
+    ):
+        """
+        After an update commits on the primary, a read served by a replica that
+        has not caught up yet returns the old row but does not cache it.
+        """
+
+        class UpdateEventUseCase:
+            def __init__(self, event_service: EventService):
+                self.event_service = event_service
+
+        read_uc = UseCaseFactoryWithServices(
+            ReadOnlyEventUseCase, test_session_factory, replica_session_factory
+        )
+        write_uc = UseCaseFactoryWithServices(
+            UpdateEventUseCase, test_session_factory, replica_session_factory
+        )
+
+        # The same row on both databases, as replicated
+        for session_factory in (test_session_factory, replica_session_factory):
+            async with session_factory() as session:
+                event = await SqlAlchemyEventRepository(session).create(event_data)
+                await session.commit()
+        assert event_cache is not None
+        key = f"event:{event.id}"
+
+        async with write_uc() as use_case:
+            await use_case.event_service.update_event(
+                event.id, EventUpdateRequest(title="Updated")
+            )
+
+        async with read_uc() as use_case:
+            stale = await use_case.event_service.get_event_by_id(event.id)
+        assert stale.title == event_data["title"]
+        assert await event_cache.get(key) is None
+
+        # The replica catches up
+        async with replica_session_factory() as session:
+            await SqlAlchemyEventRepository(session).update(
+                event.id, {"title": "Updated"}
+            )
+            await session.commit()
+
+        async with read_uc() as use_case:
+            await use_case.event_service.get_event_by_id(event.id)
+        assert (await event_cache.get(key)).title == "Updated"
+
+    async def test_use_case_factory_read_only_falls_back_to_primary(
+        self, test_session_factory
+    ):
+        """Without a read session factory, read-only use cases use the primary."""
+        read_uc = UseCaseFactoryWithServices(ReadOnlyEventUseCase, test_session_factory)
+
+        ctx = read_uc()
+        async with ctx as use_case:
+            assert ctx.uow.read_only is True
+            _, total = await use_case.event_service.list_events(offset=0, limit=10)
+            assert total > 0
@@ -0,0 +1,203 @@
+import heapq
+
+import pytest
+
+from app.application.http_exceptions import (
+    ForbiddenException,
+    TooManyRequestsException,
+)
+from app.application.waiting_room import WaitingRoom
+from app.infrastructure.waiting_room.memory_queue import InMemoryAdmissionQueue
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_room(clock, *, rate=10.0, burst=0, token_ttl=3600, secret=b"test-secret"):
+    return WaitingRoom(
+        InMemoryAdmissionQueue(),
+        secret=secret,
+        rate=rate,
+        burst=burst,
+        token_ttl=token_ttl,
+        clock=clock,
+    )
+
+
+async def test_burst_is_admitted_immediately(clock):
+    room = make_room(clock, burst=2)
+
+    statuses = [(await room.join(1))[1] for _ in range(3)]
+
+    assert [s.admitted for s in statuses] == [True, True, False]
+    assert (statuses[2].position, statuses[2].eta_seconds) == (1, 0.1)
+
+
+async def test_admission_follows_the_rate(clock):
+    room = make_room(clock, rate=10.0)
+    tokens = [(await room.join(1))[0] for _ in range(20)]
+
+    clock.now += 1.0
+    admitted = [(await room.status(token)).admitted for token in tokens]
+
+    assert admitted == [True] * 10 + [False] * 10
+
+
+async def test_queues_are_per_event(clock):
+    room = make_room(clock)
+    for _ in range(5):
+        await room.join(1)
+
+    _, status = await room.join(2)
+
+    assert status.position == 1
+    assert room.stats()["queues"] == 2
+
+
+async def test_admit_rejects_waiting_clients_with_retry_after(clock):
+    room = make_room(clock, rate=2.0)
+    for _ in range(4):
+        await room.join(1)
+    token, _ = await room.join(1)
+
+    with pytest.raises(TooManyRequestsException) as exc_info:
+        await room.admit(token)
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "3"}
+    assert exc_info.value.detail["position"] == 5
+
+    clock.now += 2.5
+    assert (await room.admit(token)).event_id == 1
+    assert (room.rejected, room.admitted) == (1, 1)
+
+
+async def test_configure_overrides_the_default_rate(clock):
+    room = make_room(clock, rate=1.0)
+    room.configure(1, rate=100.0, burst=0)
+    token, _ = await room.join(1)
+
+    clock.now += 0.01
+
+    assert (await room.status(token)).admitted
+    assert room.get_config(2).rate == 1.0
+
+
+@pytest.mark.parametrize("token", [None, "", "garbage", "a.b.c", "e30.e30"])
+async def test_invalid_tokens_are_forbidden(clock, token):
+    room = make_room(clock)
+
+    with pytest.raises(ForbiddenException):
+        await room.status(token)
+    assert room.invalid_tokens == 1
+
+
+async def test_tampered_token_is_forbidden(clock):
+    room = make_room(clock)
+    for _ in range(100):
+        await room.join(1)
+    token, _ = await room.join(1)
+    other_room_token, _ = await make_room(clock, secret=b"other").join(1)
+
+    # First in line, signed with the original place's signature
+    forged = other_room_token.split(".")[0] + "." + token.split(".")[1]
+
+    with pytest.raises(ForbiddenException):
+        await room.status(forged)
+    with pytest.raises(ForbiddenException):
+        await room.status(other_room_token)
+
+
+async def test_expired_token_is_forbidden(clock):
+    room = make_room(clock, token_ttl=60)
+    token, _ = await room.join(1)
+
+    clock.now += 61
+
+    with pytest.raises(ForbiddenException, match="expired"):
+        await room.status(token)
+
+
+async def test_on_sale_spike_simulation(clock):
+    """
+    20,000 clients join within two seconds and poll back at their ETA. The
+    room admits them in join order, never faster than burst + rate * t, and a
+    client needs only a couple of polls to get in.
+    """
+    clients, rate, burst = 20_000, 500.0, 200
+    room = make_room(clock, rate=rate, burst=burst)
+    start = clock.now
+
+    polls = []  # (time, join order, token)
+    for i in range(clients):
+        clock.now = start + 2.0 * i / clients
+        token, status = await room.join(1)
+        heapq.heappush(polls, (clock.now + status.eta_seconds, i, token))
+
+    admitted_order = []
+    poll_count = 0
+    while polls:
+        at, i, token = heapq.heappop(polls)
+        clock.now = max(clock.now, at)
+        poll_count += 1
+        try:
+            await room.admit(token)
+        except TooManyRequestsException as e:
+            heapq.heappush(polls, (clock.now + e.detail["eta_seconds"], i, token))
+            continue
+        admitted_order.append(i)
+        assert len(admitted_order) <= burst + rate * (clock.now - start) + 1
+
+    assert admitted_order == sorted(admitted_order)
+    assert len(admitted_order) == clients
+    assert poll_count <= 3 * clients
+
+
+async def test_admitted_token_is_good_for_one_purchase(clock):
+    room = make_room(clock, burst=1)
+    token, _ = await room.join(1)
+
+    await room.admit(token)
+    with pytest.raises(ForbiddenException, match="already been used"):
+        await room.admit(token)
+
+    await room.release(token)
+    assert (await room.admit(token)).admitted
+    assert (room.admitted, room.reused_tokens) == (1, 1)
+
+
+async def test_token_claimed_by_an_owner_is_bound_to_it(clock):
+    room = make_room(clock, burst=1)
+    token, _ = await room.join(1)
+
+    await room.admit(token, owner="key-1")
+    assert (await room.admit(token, owner="key-1")).admitted
+    with pytest.raises(ForbiddenException):
+        await room.admit(token, owner="key-2")
+    with pytest.raises(ForbiddenException):
+        await room.admit(token)
+
+
+async def test_claims_are_forgotten_once_tokens_expire(clock):
+    room = make_room(clock, rate=10.0, burst=1, token_ttl=60)
+
+    for _ in range(5_000):
+        token, _ = await room.join(1)
+        clock.now += 0.1
+        await room.admit(token)
+
+    # Only tokens still within their TTL (10 a second for 60s) keep a claim
+    assert room.admitted == 5_000
+    assert room.stats()["claimed"] <= 10 * 61
+    with pytest.raises(ForbiddenException, match="already been used"):
+        await room.admit(token)
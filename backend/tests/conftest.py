@@ -5,9 +5,18 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.application.use_cases import _UseCaseFactory
+from app.application.use_cases import (
+    _UseCaseFactory,
+    event_cache,
+    event_version_cache,
+    idempotency_cache,
+    price_cache,
+    search_index,
+    ticket_type_cache,
+)
 from app.infrastructure.db.models.base import ModelBase
 from app.main import api
+from benchmarks.utils import bind_use_cases
 
 DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -33,6 +42,36 @@ async def test_db_engine():
     await engine.dispose()
 
 
+@pytest.fixture(scope="module", autouse=True)
+async def clear_caches():
+    # Each test module has its own database, so cached rows must not leak
+    if event_cache is not None:
+        await event_cache.clear()
+        await event_version_cache.clear()
+    await ticket_type_cache.clear()
+    await idempotency_cache.clear()
+    await price_cache.clear()
+    await search_index.clear()
+
+
+@pytest.fixture(scope="function")
+async def file_session_factory(tmp_path):
+    """
+    A file-backed database, so concurrent sessions get separate connections
+    instead of sharing the single in-memory one.
+    """
+    # SQLite's busy handler is not fair: give starved writers more than the
+    # default 5 seconds
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.sqlite3'}",
+        connect_args={"timeout": 60},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(ModelBase.metadata.create_all)
+    yield async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
 @pytest.fixture(scope="module")
 async def test_session_factory(test_db_engine):
     session_factory = async_sessionmaker(
@@ -86,8 +125,14 @@ async def test_client():
 @pytest.fixture(scope="module")
 def wrap_uc_with_test_session(test_session_factory):
     def wrapper(uc_class):
-        for _, value in vars(uc_class).items():
-            if hasattr(value, "_session_factory"):
-                value._session_factory = test_session_factory
+        bind_use_cases(uc_class, test_session_factory)
+
+    return wrapper
+
+
+@pytest.fixture(scope="function")
+def wrap_uc_with_file_session(file_session_factory):
+    def wrapper(uc_class):
+        bind_use_cases(uc_class, file_session_factory)
 
     return wrapper
@@ -33,3 +33,8 @@ def test_event_creation():
     """
     event = Event(id=None, created_at=None, updated_at=None, **event_data)
     assert event.title == event_data["title"]
+
+
+def test_event_is_slotted():
+    event = Event(id=None, created_at=None, updated_at=None, **event_data)
+    assert not hasattr(event, "__dict__")
@@ -0,0 +1,136 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import ANY, AsyncMock
+
+from app.domain.entities.tickets.pricing import (
+    SECONDS_PER_DAY,
+    PricingInputs,
+    PricingPolicy,
+    compute_prices,
+    price_events,
+)
+from app.domain.entities.tickets.services import PricingService
+from app.infrastructure.cache.memory_cache import InMemoryCache
+
+policy = PricingPolicy()
+FAR_AWAY = 30 * SECONDS_PER_DAY
+
+
+def test_price_rises_with_sell_through():
+    prices = compute_prices(
+        [10_000, 10_000, 10_000],
+        [100, 100, 100],
+        [0, 50, 100],
+        [FAR_AWAY] * 3,
+        policy,
+    )
+    # 1 + 0.5 * sell_through ** 2
+    assert prices.tolist() == [10_000, 11_300, 15_000]
+
+
+def test_price_rises_as_the_event_gets_closer():
+    prices = compute_prices(
+        10_000,
+        100,
+        0,
+        [FAR_AWAY, 3.5 * SECONDS_PER_DAY, 0, -SECONDS_PER_DAY],
+        policy,
+    )
+    assert prices.tolist() == [10_000, 11_300, 12_500, 12_500]
+
+
+def test_price_is_clipped_and_rounded_up():
+    prices = compute_prices(
+        [10_000, 350, 10_000],
+        [100, 100, 0],
+        [100, 1, 0],
+        [0, FAR_AWAY, 0],
+        PricingPolicy(demand_markup=2.0),
+    )
+    # Capped at twice the base; a tiny markup is still a whole step; no
+    # capacity counts as sold out
+    assert prices.tolist() == [20_000, 450, 20_000]
+
+
+def test_price_events_groups_by_event():
+    now = datetime.now(UTC).timestamp()
+    inputs = PricingInputs(
+        ticket_type_ids=[1, 2, 3],
+        event_ids=[20, 10, 20],
+        base_cents=[1_000, 2_000, 3_000],
+        capacity=[10, 10, 10],
+        sold=[0, 10, 5],
+        start_ts=[now + FAR_AWAY] * 3,
+    )
+
+    result = {
+        prices.event_id: prices for prices in price_events(inputs, policy, now=now)
+    }
+
+    assert result[10].items() == [(2, 3_000)]
+    assert result[20].items() == [(1, 1_000), (3, 3_400)]
+    assert result[20].price_of(2) is None
+    assert price_events(PricingInputs.from_rows([]), policy, now=now) == []
+
+
+def test_apply_sold_delta_reprices_one_ticket_type():
+    now = datetime.now(UTC).timestamp()
+    inputs = PricingInputs(
+        [1, 2], [10, 10], [1_000, 1_000], [10, 10], [0, 0], [now + FAR_AWAY] * 2
+    )
+    (prices,) = price_events(inputs, policy, now=now)
+
+    assert prices.apply_sold_delta(1, 20, policy=policy, now=now) is True
+    assert prices.items() == [(1, 1_500), (2, 1_000)]
+    assert prices.inputs.sold.tolist() == [10, 0]
+
+    assert prices.apply_sold_delta(1, -15, policy=policy, now=now) is True
+    assert prices.price_of(1) == 1_000
+    assert prices.apply_sold_delta(3, 1, policy=policy, now=now) is False
+
+
+def pricing_repo(sold: int = 0) -> AsyncMock:
+    start_time = datetime.now(UTC) + timedelta(days=30)
+    repo = AsyncMock()
+    repo.get_pricing_inputs.side_effect = lambda *args, **kwargs: (
+        PricingInputs.from_rows([(1, 10, 1_000, 10, sold, start_time)])
+    )
+    return repo
+
+
+async def test_prices_are_served_from_cache():
+    repo = pricing_repo()
+    service = PricingService(repo, cache=InMemoryCache(max_size=10, ttl=60))
+
+    assert await service.get_price(10, 1) == 1_000
+    assert await service.get_price(10, 1) == 1_000
+    repo.get_pricing_inputs.assert_awaited_once_with([10], starts_after=None)
+
+    assert await service.get_price(10, 2) is None
+
+
+async def test_committed_sales_reprice_the_cached_entry():
+    repo = pricing_repo()
+    cache = InMemoryCache(max_size=10, ttl=60)
+    service = PricingService(repo, cache=cache)
+    await service.get_price(10, 1)
+
+    service.record_sold(10, 1, 6)
+    service.record_sold(10, 1, 4)
+    assert await service.get_price(10, 1) == 1_000
+    await service.on_commit()
+
+    assert await PricingService(repo, cache=cache).get_price(10, 1) == 1_500
+    repo.get_pricing_inputs.assert_awaited_once()
+
+
+async def test_old_prices_are_recomputed():
+    repo = pricing_repo(sold=10)
+    cache = InMemoryCache(max_size=10, ttl=60)
+    service = PricingService(repo, cache=cache)
+    prices = (await service.reprice_events())[10]
+    prices.priced_at -= policy.max_age_seconds + 1
+    prices.prices[:] = 0
+
+    assert await service.get_price(10, 1) == 1_500
+    assert repo.get_pricing_inputs.await_count == 2
+    repo.get_pricing_inputs.assert_any_await(None, starts_after=ANY)
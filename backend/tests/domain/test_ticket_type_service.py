@@ -0,0 +1,69 @@
+from unittest.mock import AsyncMock
+
+from app.domain.entities.tickets.services import SHARD_MIN_STOCK, TicketTypeService
+from app.infrastructure.cache.memory_cache import InMemoryCache
+
+
+def sharded_repo(shard_count: int = 4, available: int = 3) -> AsyncMock:
+    repo = AsyncMock()
+    repo.reserve.return_value = None
+    repo.get.return_value.sharded = True
+    repo.get.return_value.shard_count = shard_count
+    repo.get.return_value.available = available
+    return repo
+
+
+async def test_reserve_unsharded_uses_ticket_type_row():
+    repo = AsyncMock()
+    service = TicketTypeService(repo, cache=InMemoryCache(max_size=10, ttl=60))
+
+    assert await service.reserve_tickets(1, 2) is True
+    repo.reserve.assert_awaited_once_with(1, 2)
+    repo.reserve_from_shard.assert_not_awaited()
+
+
+async def test_reserve_sharded_caches_shard_count():
+    repo = sharded_repo()
+    repo.reserve_from_shard.return_value = True
+    service = TicketTypeService(repo, cache=InMemoryCache(max_size=10, ttl=60))
+
+    assert await service.reserve_tickets(1, 2) is True
+    assert await service.reserve_tickets(1, 2) is True
+
+    # Only the first call had to find out the ticket type is sharded
+    repo.get.assert_awaited_once()
+    repo.reserve.assert_awaited_once()
+    assert repo.reserve_from_shard.await_count == 2
+
+
+async def test_reserve_sharded_falls_through_to_other_shards():
+    repo = sharded_repo()
+    repo.reserve_from_shard.return_value = False
+    repo.reserve_from_any_shard.return_value = True
+    service = TicketTypeService(repo)
+
+    assert await service.reserve_tickets(1, 2) is True
+    repo.reserve_from_any_shard.assert_awaited_once_with(1, 2)
+
+
+async def test_reserve_sharded_rebalances_fragmented_stock():
+    repo = sharded_repo(available=3)
+    repo.reserve_from_shard.return_value = False
+    repo.reserve_from_any_shard.side_effect = [False, False, True]
+    service = TicketTypeService(repo)
+
+    assert await service.reserve_tickets(1, 3) is False
+    repo.rebalance_shards.assert_not_awaited()
+
+    assert await service.reserve_tickets(1, 3, rebalance=True) is True
+    repo.rebalance_shards.assert_awaited_once_with(1, min_per_shard=SHARD_MIN_STOCK)
+
+
+async def test_reserve_sharded_does_not_rebalance_when_sold_out():
+    repo = sharded_repo(available=2)
+    repo.reserve_from_shard.return_value = False
+    repo.reserve_from_any_shard.return_value = False
+    service = TicketTypeService(repo)
+
+    assert await service.reserve_tickets(1, 3, rebalance=True) is False
+    repo.rebalance_shards.assert_not_awaited()
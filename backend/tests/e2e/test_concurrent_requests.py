@@ -0,0 +1,68 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.application.use_cases import EventUseCases
+
+REQUESTS = 300
+
+event = {
+    "title": "Concert",
+    "description": "Concert for a cause",
+    "event_type": "concert",
+    "venue": "Cebu City",
+    "capacity": 4,
+    "start_time": (datetime.now(UTC) + timedelta(weeks=4)).isoformat(),
+}
+
+
+@pytest.fixture(scope="function")
+def override_event_uc(wrap_uc_with_file_session):
+    wrap_uc_with_file_session(EventUseCases)
+
+
+async def test_overlapping_requests_do_not_share_units_of_work(
+    test_client, override_event_uc
+):
+    resp = await test_client.post("/api/v1/events/bulk", json=[event] * 20)
+    event_ids = [item["event"]["id"] for item in resp.json()["items"]]
+
+    async def get(i: int):
+        event_id = event_ids[i % len(event_ids)]
+        resp = await test_client.get(f"/api/v1/events/{event_id}")
+        return resp.status_code == 200 and resp.json()["id"] == event_id
+
+    async def update(i: int):
+        event_id = event_ids[i % len(event_ids)]
+        title = f"Concert {i}"
+        resp = await test_client.patch(
+            f"/api/v1/events/{event_id}", json={"title": title}
+        )
+        data = resp.json()
+        return resp.status_code == 200 and (data["id"], data["title"]) == (
+            event_id,
+            title,
+        )
+
+    async def create(i: int):
+        resp = await test_client.post(
+            "/api/v1/events/", json={**event, "title": f"New {i}"}
+        )
+        data = resp.json()
+        return resp.status_code == 201 and data["title"] == f"New {i}"
+
+    async def list_(i: int):
+        resp = await test_client.get("/api/v1/events/", params={"page_size": 5})
+        return resp.status_code == 200 and len(resp.json()["items"]) == 5
+
+    actions = [get, update, create, list_]
+    results = await asyncio.gather(
+        *(actions[i % len(actions)](i) for i in range(REQUESTS))
+    )
+
+    assert all(results)
+
+    # Every create landed exactly once
+    resp = await test_client.get("/api/v1/events/", params={"page_size": 1})
+    assert resp.json()["total"] == len(event_ids) + REQUESTS // len(actions)
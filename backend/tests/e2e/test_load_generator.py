@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from app.application.use_cases import EventUseCases
+from benchmarks.loadgen import (
+    SCENARIOS,
+    LoadRunner,
+    Operations,
+    Stage,
+    parse_stages,
+    run_load,
+    users_at,
+)
+
+
+@pytest.fixture(scope="function")
+def override_event_uc(wrap_uc_with_file_session):
+    wrap_uc_with_file_session(EventUseCases)
+
+
+def test_users_follow_the_stages():
+    stages = parse_stages("10:20, 5:20,10:0")
+
+    assert stages == [Stage(10, 20), Stage(5, 20), Stage(10, 0)]
+    assert [users_at(stages, t) for t in (0, 5, 10, 12, 20, 25)] == [
+        0,
+        10,
+        20,
+        20,
+        10,
+        None,
+    ]
+
+
+async def test_on_sale_load_runs_in_process(test_client, override_event_uc):
+    stats = await run_load(
+        test_client,
+        scenario="on_sale",
+        stages=[Stage(0.2, 8), Stage(0.5, 8)],
+        events=50,
+        random_seed=1,
+    )
+
+    summary = stats.summary()
+    assert summary["peak_users"] == 8
+    assert summary["total"]["requests"] > 0
+    assert summary["errors"] == {}
+    assert set(summary["operations"]) == set(SCENARIOS["on_sale"])
+
+
+async def test_failed_requests_are_counted_without_ending_the_run():
+    class FailingOperations(Operations):
+        async def detail(self):
+            raise RuntimeError("boom")
+
+    runner = LoadRunner(
+        FailingOperations(None, [1], random.Random(1)),
+        {"detail": 1},
+        [Stage(0.2, 2)],
+        think_time=0.0,
+    )
+
+    summary = (await runner.run()).summary()
+    assert summary["total"]["requests"] == summary["total"]["errors"] > 0
+    assert set(summary["errors"]) == {"detail: RuntimeError"}
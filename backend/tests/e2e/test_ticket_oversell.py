@@ -0,0 +1,80 @@
+import asyncio
+import random
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.application.use_cases import EventUseCases, TicketUseCases
+from app.infrastructure.db.models.ticket_model import ReservationModel
+
+RESERVATIONS = 2_000
+CAPACITY = 500
+
+event = {
+    "title": "Concert",
+    "description": "Concert for a cause",
+    "event_type": "concert",
+    "venue": "Cebu City",
+    "capacity": CAPACITY,
+    "start_time": (datetime.now(UTC) + timedelta(weeks=4)).isoformat(),
+}
+
+
+@pytest.fixture(scope="function")
+def override_uc(wrap_uc_with_file_session):
+    wrap_uc_with_file_session(EventUseCases)
+    wrap_uc_with_file_session(TicketUseCases)
+
+
+@pytest.mark.parametrize("shards", [0, 16])
+async def test_concurrent_reservations_never_oversell(
+    test_client, override_uc, file_session_factory, shards
+):
+    resp = await test_client.post("/api/v1/events/", json=event)
+    resp = await test_client.post(
+        f"/api/v1/events/{resp.json()['id']}/ticket-types",
+        json={"name": "General Admission", "price_cents": 1000, "capacity": CAPACITY},
+    )
+    ticket_type_id = resp.json()["id"]
+    if shards:
+        await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/shards", json={"shards": shards}
+        )
+
+    rng = random.Random(0)
+    quantities = [rng.randint(1, 3) for _ in range(RESERVATIONS)]
+
+    async def reserve(quantity: int) -> tuple[int, int]:
+        resp = await test_client.post(
+            f"/api/v1/ticket-types/{ticket_type_id}/reservations",
+            json={"quantity": quantity},
+        )
+        return resp.status_code, quantity
+
+    results = await asyncio.gather(*(reserve(q) for q in quantities))
+
+    statuses = Counter(status for status, _ in results)
+    assert set(statuses) <= {201, 409}
+    # Demand is about 4x capacity, so it must have sold out
+    assert statuses[409] > 0
+
+    reserved = sum(quantity for status, quantity in results if status == 201)
+    assert reserved <= CAPACITY
+    # Sold out means fewer than 3 tickets (the largest request) can be left
+    assert reserved > CAPACITY - 3
+
+    resp = await test_client.get(f"/api/v1/ticket-types/{ticket_type_id}")
+    assert resp.json()["sold"] == reserved
+
+    # Every successful reservation, and nothing else, was recorded
+    async with file_session_factory() as session:
+        count, total = (
+            await session.execute(
+                select(func.count(), func.sum(ReservationModel.quantity)).where(
+                    ReservationModel.ticket_type_id == ticket_type_id
+                )
+            )
+        ).one()
+    assert (count, total) == (statuses[201], reserved)
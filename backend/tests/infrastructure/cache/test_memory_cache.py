@@ -0,0 +1,65 @@
+import pytest
+
+from app.infrastructure.cache.memory_cache import InMemoryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_cache_hit_and_miss_counters():
+    cache = InMemoryCache(max_size=10, ttl=60)
+    await cache.set("a", 1)
+
+    assert await cache.get("a") == 1
+    assert await cache.get("b") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+async def test_cache_evicts_least_recently_used():
+    cache = InMemoryCache(max_size=2, ttl=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    # Touch "a" so "b" becomes the least recently used entry
+    await cache.get("a")
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+async def test_cache_entries_expire():
+    clock = FakeClock()
+    cache = InMemoryCache(max_size=10, ttl=30, clock=clock)
+    await cache.set("a", 1)
+
+    clock.now = 29
+    assert await cache.get("a") == 1
+
+    clock.now = 31
+    assert await cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+async def test_cache_delete():
+    cache = InMemoryCache(max_size=10, ttl=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+
+    await cache.delete("a", "missing")
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == 2
+
+
+def test_cache_requires_positive_size():
+    with pytest.raises(ValueError):
+        InMemoryCache(max_size=0, ttl=60)
@@ -2,12 +2,15 @@ import random
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.schemas.events_schema import EventCreateRequest
 from app.core.config import settings
+from app.domain.entities.events.entities import EventFilters, EventSort
 from app.infrastructure.db.models.event_model import EventModel
 from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventReadRepository,
     SqlAlchemyEventRepository,
 )
 from tests.utils import get_non_nullable_fields, is_timezone_aware
@@ -58,3 +61,250 @@ async def test_event_repo_create_with_missing_not_nullable_field(test_db_session
     setattr(event, column, None)
     with pytest.raises(IntegrityError):
         await repo.create(event.model_dump())
+
+
+async def test_event_repo_keyset_pagination(test_db_session):
+    repo = SqlAlchemyEventRepository(test_db_session)
+
+    # Same start time for two events to exercise the `id` tie-breaker
+    for days in (3, 1, 1):
+        data = EventCreateRequest(
+            **{**event_data, "start_time": datetime.now(UTC) + timedelta(days=days)}
+        ).model_dump()
+        await repo.create(data)
+
+    total = await repo.count()
+
+    seen = []
+    after = None
+    while True:
+        page = await repo.get_events_after(after=after, limit=2)
+        if not page:
+            break
+        seen.extend(page)
+        after = (page[-1].start_time, page[-1].id)
+
+    keys = [(event.start_time, event.id) for event in seen]
+    assert len(seen) == total
+    assert keys == sorted(keys)
+    assert len(set(keys)) == total
+
+
+async def test_event_repo_paginated_events_with_total(test_db_session):
+    repo = SqlAlchemyEventRepository(test_db_session)
+    total = await repo.count()
+
+    events, page_total = await repo.get_paginated_events_with_total(offset=0, limit=2)
+    assert len(events) == min(total, 2)
+    assert page_total == total
+
+    # Past-the-end pages still report the total
+    events, page_total = await repo.get_paginated_events_with_total(
+        offset=total, limit=2
+    )
+    assert events == []
+    assert page_total == total
+
+
+async def test_event_repo_estimate_count_unsupported_on_sqlite(test_db_session):
+    repo = SqlAlchemyEventRepository(test_db_session)
+    assert await repo.estimate_count() is None
+
+
+async def test_event_read_repo_bypasses_identity_map(test_session_factory):
+    async with test_session_factory() as session:
+        orm_events, _ = await SqlAlchemyEventRepository(
+            session
+        ).get_paginated_events_with_total(offset=0, limit=10)
+
+    async with test_session_factory() as session:
+        repo = SqlAlchemyEventReadRepository(session)
+        events, _ = await repo.get_paginated_events_with_total(offset=0, limit=10)
+        event = await repo.get(events[0].id)
+
+        assert events == orm_events
+        assert event == orm_events[0]
+        assert len(session.identity_map) == 0
+
+
+async def test_event_read_repo_rejects_writes(test_db_session):
+    repo = SqlAlchemyEventReadRepository(test_db_session)
+
+    with pytest.raises(RuntimeError, match="read-only"):
+        await repo.create(EventCreateRequest(**event_data).model_dump())
+
+
+async def test_event_repo_update_is_single_statement(test_db_engine, test_db_session):
+    repo = SqlAlchemyEventRepository(test_db_session)
+    created = await repo.create(EventCreateRequest(**event_data).model_dump())
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(test_db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        updated = await repo.update(created.id, {"title": "Updated"})
+    finally:
+        event.remove(test_db_engine.sync_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+    assert updated.title == "Updated"
+    assert updated.updated_at >= created.updated_at
+    assert updated.updated_at.tzinfo == settings.DEFAULT_TIMEZONE
+
+
+async def test_event_repo_update_non_existing(test_db_session):
+    repo = SqlAlchemyEventRepository(test_db_session)
+    assert await repo.update(999, {"title": "Updated"}) is None
+
+
+async def test_event_repo_exists(test_db_session):
+    repo = SqlAlchemyEventRepository(test_db_session)
+    event = await repo.create(EventCreateRequest(**event_data).model_dump())
+
+    assert await repo.exists(event.id) is True
+    assert await repo.exists(event.id + 1000) is False
+
+
+async def test_event_repo_create_many_keeps_order(test_db_session):
+    repo = SqlAlchemyEventRepository(test_db_session)
+    titles = [f"Bulk {i}" for i in range(5)]
+    data = [
+        EventCreateRequest(**{**event_data, "title": title}).model_dump()
+        for title in titles
+    ]
+
+    events = await repo.create_many(data)
+
+    assert [e.title for e in events] == titles
+    assert all(e.id is not None and e.created_at is not None for e in events)
+    assert await repo.create_many([]) == []
+
+
+async def test_event_read_repo_streams_in_batches(test_db_session):
+    repo = SqlAlchemyEventReadRepository(test_db_session)
+
+    batches = [batch async for batch in repo.stream_events(batch_size=2)]
+    events = [event for batch in batches for event in batch]
+
+    assert all(len(batch) <= 2 for batch in batches)
+    assert len(events) == await repo.count()
+    assert events == await repo.get_paginated_events(offset=0, limit=len(events))
+
+
+async def test_event_repo_filters_and_sorts(test_db_session):
+    repo = SqlAlchemyEventRepository(test_db_session)
+    now = datetime.now(UTC)
+    for days, event_type, venue in [
+        (2, "festival", "Davao"),
+        (5, "festival", "Davao"),
+        (5, "festival", "Manila"),
+        (9, "festival", "Davao"),
+    ]:
+        await repo.create(
+            EventCreateRequest(
+                **{
+                    **event_data,
+                    "event_type": event_type,
+                    "venue": venue,
+                    "start_time": now + timedelta(days=days),
+                }
+            ).model_dump()
+        )
+    filters = EventFilters(
+        event_type="festival",
+        venue="Davao",
+        starts_from=now + timedelta(days=2),
+        starts_before=now + timedelta(days=9),
+    )
+
+    events, total = await repo.get_paginated_events_with_total(
+        offset=0, limit=10, filters=filters
+    )
+    assert total == await repo.count(filters) == 2
+    assert [e.start_time for e in events] == sorted(e.start_time for e in events)
+
+    # Walk the descending order by keyset, one event per page
+    seen, after = [], None
+    while page := await repo.get_events_after(
+        after=after,
+        limit=1,
+        filters=EventFilters(event_type="festival", upcoming=True),
+        sort=EventSort.START_TIME_DESC,
+    ):
+        seen.extend(page)
+        after = (page[-1].start_time, page[-1].id)
+    keys = [(e.start_time, e.id) for e in seen]
+    assert len(keys) == 4
+    assert keys == sorted(keys, reverse=True)
+
+    past = EventFilters(event_type="festival", starts_before=now)
+    assert await repo.get_paginated_events(offset=0, limit=10, filters=past) == []
+
+
+@pytest.mark.parametrize(
+    "filters, sort, index",
+    [
+        (None, EventSort.START_TIME, "ix_events_start_time_id"),
+        (None, EventSort.START_TIME_DESC, "ix_events_start_time_id"),
+        (None, EventSort.CREATED_AT_DESC, "ix_events_created_at_id"),
+        (EventFilters(upcoming=True), EventSort.START_TIME, "ix_events_start_time_id"),
+        (
+            EventFilters(event_type="concert"),
+            EventSort.START_TIME,
+            "ix_events_event_type_start_time_id",
+        ),
+        (
+            EventFilters(event_type="concert", upcoming=True),
+            EventSort.START_TIME_DESC,
+            "ix_events_event_type_start_time_id",
+        ),
+        (
+            EventFilters(venue="Cebu City", upcoming=True),
+            EventSort.START_TIME,
+            "ix_events_venue_start_time_id",
+        ),
+        (
+            EventFilters(
+                event_type="concert",
+                starts_from=datetime.now(UTC),
+                starts_before=datetime.now(UTC) + timedelta(weeks=8),
+            ),
+            EventSort.START_TIME,
+            "ix_events_event_type_start_time_id",
+        ),
+    ],
+)
+async def test_event_repo_listing_uses_an_index(
+    test_db_engine, test_db_session, filters, sort, index
+):
+    """
+    Common filter and sort combinations search the matching composite index,
+    with no table scan and no sort step.
+    """
+    repo = SqlAlchemyEventRepository(test_db_session)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    event.listen(test_db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        await repo.get_events_after(
+            after=(datetime.now(UTC), 1), limit=10, filters=filters, sort=sort
+        )
+    finally:
+        event.remove(test_db_engine.sync_engine, "before_cursor_execute", record)
+
+    ((statement, parameters),) = statements
+    connection = await test_db_session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+    plan = [row[-1] for row in result]
+
+    assert len(plan) == 1, plan
+    assert plan[0].startswith(f"SEARCH events USING INDEX {index} ("), plan
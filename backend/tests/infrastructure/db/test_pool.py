@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.infrastructure.db.pool import InstrumentedAsyncAdaptedQueuePool, pool_stats
+from app.infrastructure.db.session import engine_options
+
+
+@pytest.fixture
+async def small_pool_engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.sqlite3'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    yield engine
+    await engine.dispose()
+
+
+def test_engine_options_follow_settings():
+    options = engine_options()
+
+    assert options["poolclass"] is InstrumentedAsyncAdaptedQueuePool
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert options["pool_pre_ping"] == settings.DB_POOL_PRE_PING
+    assert (
+        options["connect_args"]["prepared_statement_cache_size"]
+        == settings.DB_STATEMENT_CACHE_SIZE
+    )
+
+
+async def test_pool_records_checkout_wait(small_pool_engine):
+    async def hold_connection():
+        async with small_pool_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = pool_stats(small_pool_engine.pool)
+            await asyncio.sleep(0.05)
+            return stats
+
+    in_flight = await asyncio.gather(hold_connection(), hold_connection())
+    stats = pool_stats(small_pool_engine.pool)
+
+    assert all(s["in_use"] == 1 for s in in_flight)
+    assert stats["in_use"] == 0
+    assert stats["checkouts"] == 2
+    # The second caller waited for the first to give the connection back
+    assert stats["max_wait_ms"] >= 40
+
+
+async def test_pool_counts_timeouts(small_pool_engine):
+    async with small_pool_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        with pytest.raises(exc.TimeoutError):
+            async with small_pool_engine.connect():
+                pass
+
+    assert pool_stats(small_pool_engine.pool)["timeouts"] == 1
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+from app.infrastructure.db.session import Database
+
+
+def test_importing_the_app_creates_no_engine():
+    code = (
+        "import sys\n"
+        "from app.main import api\n"
+        "from app.infrastructure.db.session import database\n"
+        "assert database._engine is None\n"
+        "assert 'asyncpg' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+async def test_engines_are_created_on_first_use_and_disposed():
+    database = Database()
+    assert database._engine is None
+
+    session = database.session()
+    engine = database.engine
+    assert session.bind is engine
+    # Read sessions fall back to the primary without a replica
+    assert database.read_session().bind.pool is engine.pool
+
+    await database.dispose()
+    assert database._engine is None
+    assert database.engine is not engine
+    await database.dispose()
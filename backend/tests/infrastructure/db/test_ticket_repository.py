@@ -0,0 +1,133 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.infrastructure.db.repositories.sqlalchemy.event_repo import (
+    SqlAlchemyEventRepository,
+)
+from app.infrastructure.db.repositories.sqlalchemy.ticket_repo import (
+    SqlAlchemyReservationRepository,
+    SqlAlchemyTicketTypeRepository,
+)
+
+event_data = {
+    "title": "Concert",
+    "description": "Live",
+    "event_type": "concert",
+    "venue": "Cebu City",
+    "capacity": 20,
+    "start_time": datetime.now(UTC) + timedelta(weeks=5),
+}
+
+
+@pytest.fixture(scope="function")
+async def ticket_type(test_db_session):
+    event = await SqlAlchemyEventRepository(test_db_session).create(event_data)
+    return await SqlAlchemyTicketTypeRepository(test_db_session).create(
+        {"event_id": event.id, "name": "VIP", "price_cents": 5000, "capacity": 5}
+    )
+
+
+async def test_ticket_type_repo_create(ticket_type):
+    assert ticket_type.id is not None
+    assert (ticket_type.sold, ticket_type.available) == (0, 5)
+
+
+async def test_ticket_type_repo_reserve_up_to_capacity(test_db_session, ticket_type):
+    repo = SqlAlchemyTicketTypeRepository(test_db_session)
+
+    result = await repo.reserve(ticket_type.id, 3)
+    assert result.sold == 3
+
+    result = await repo.reserve(ticket_type.id, 2)
+    assert result.sold == 5
+
+
+async def test_ticket_type_repo_reserve_past_capacity(test_db_session, ticket_type):
+    repo = SqlAlchemyTicketTypeRepository(test_db_session)
+    await repo.reserve(ticket_type.id, 4)
+
+    assert await repo.reserve(ticket_type.id, 2) is None
+    assert await repo.reserve(9999, 1) is None
+
+    # A failed reservation leaves the count untouched
+    result = await repo.get(ticket_type.id)
+    assert result.sold == 4
+
+
+async def test_ticket_type_repo_release(test_db_session, ticket_type):
+    repo = SqlAlchemyTicketTypeRepository(test_db_session)
+    await repo.reserve(ticket_type.id, 4)
+
+    result = await repo.release(ticket_type.id, 3)
+    assert result.sold == 1
+
+    # Never below zero
+    assert await repo.release(ticket_type.id, 2) is None
+
+
+async def test_reservation_repo_cancel_once(test_db_session, ticket_type):
+    repo = SqlAlchemyReservationRepository(test_db_session)
+    reservation = await repo.create(
+        {
+            "ticket_type_id": ticket_type.id,
+            "quantity": 2,
+            "unit_price_cents": 5000,
+            "status": "reserved",
+        }
+    )
+
+    result = await repo.cancel(reservation.id)
+    assert result.status == "cancelled"
+
+    assert await repo.cancel(reservation.id) is None
+
+
+async def test_ticket_type_repo_enable_shards(test_db_session, ticket_type):
+    repo = SqlAlchemyTicketTypeRepository(test_db_session)
+    await repo.reserve(ticket_type.id, 1)
+
+    assert await repo.enable_shards(ticket_type.id, 3) is True
+    assert await repo.enable_shards(ticket_type.id, 3) is False
+    assert await repo.enable_shards(9999, 3) is False
+
+    # The 4 remaining tickets are spread over the shards
+    assert await repo.rebalance_shards(ticket_type.id) == [2, 1, 1]
+
+    result = await repo.get(ticket_type.id)
+    assert (result.shard_count, result.sold, result.available) == (3, 1, 4)
+
+
+async def test_ticket_type_repo_reserve_from_shards(test_db_session, ticket_type):
+    repo = SqlAlchemyTicketTypeRepository(test_db_session)
+    await repo.enable_shards(ticket_type.id, 2)  # [3, 2]
+
+    assert await repo.reserve_from_shard(ticket_type.id, 1, 3) is False
+    assert await repo.reserve_from_shard(ticket_type.id, 1, 2) is True
+    # Falls through to the shard that still has stock
+    assert await repo.reserve_from_any_shard(ticket_type.id, 2) is True
+    assert await repo.reserve_from_any_shard(ticket_type.id, 2) is False
+
+    result = await repo.get(ticket_type.id)
+    assert (result.sold, result.available) == (4, 1)
+
+
+async def test_ticket_type_repo_rebalance_collects_released_stock(
+    test_db_session, ticket_type
+):
+    repo = SqlAlchemyTicketTypeRepository(test_db_session)
+    await repo.enable_shards(ticket_type.id, 2)
+    await repo.reserve_from_any_shard(ticket_type.id, 3)
+    await repo.reserve_from_any_shard(ticket_type.id, 2)
+
+    # Released tickets go back to the ticket type row
+    await repo.release(ticket_type.id, 3)
+    result = await repo.get(ticket_type.id)
+    assert (result.sold, result.available) == (2, 3)
+
+    assert await repo.rebalance_shards(ticket_type.id) == [2, 1]
+    result = await repo.get(ticket_type.id)
+    assert (result.sold, result.available) == (2, 3)
+
+    # Too little stock to give every shard 2 tickets
+    assert await repo.rebalance_shards(ticket_type.id, min_per_shard=2) == [3, 0]
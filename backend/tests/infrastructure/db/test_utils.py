@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+
+from app.core.config import settings
+from app.domain.entities.events.entities import Event
+from app.infrastructure.db.models.event_model import EventModel
+from app.infrastructure.db.utils import from_orm, register_mapper
+
+orm_event = EventModel(
+    id=1,
+    title="Concert",
+    description="Live",
+    event_type="concert",
+    venue="Cebu City",
+    capacity=20,
+    start_time=datetime(2030, 1, 1, 10, tzinfo=UTC),
+    # SQLite hands back naive timestamps
+    created_at=datetime(2029, 1, 1, 10),
+    updated_at=datetime(2029, 1, 1, 10),
+)
+
+
+def test_register_mapper_is_compiled_once():
+    assert register_mapper(EventModel, Event) is register_mapper(EventModel, Event)
+
+
+def test_mapper_converts_and_normalizes_timezones():
+    event = register_mapper(EventModel, Event)(orm_event)
+
+    assert isinstance(event, Event)
+    assert event.title == orm_event.title
+    assert event.start_time.tzinfo == settings.DEFAULT_TIMEZONE
+    assert event.created_at.tzinfo == settings.DEFAULT_TIMEZONE
+    assert event == from_orm(orm_event, Event)
+
+
+def test_mapper_rejects_fields_that_are_not_columns():
+    @dataclass(slots=True)
+    class EventWithExtra:
+        id: int
+        extra: str
+
+    with pytest.raises(TypeError, match="not columns"):
+        register_mapper(EventModel, EventWithExtra)
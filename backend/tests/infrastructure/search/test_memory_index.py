@@ -0,0 +1,62 @@
+from datetime import UTC, datetime, timedelta
+
+from app.infrastructure.search.memory_index import InMemorySearchIndex, tokenize
+
+now = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def make_index() -> InMemorySearchIndex:
+    return InMemorySearchIndex(weights={"title": 10, "venue": 4, "description": 2})
+
+
+def test_tokenize_lowercases_words():
+    assert tokenize("Jazz-Night at Café 21!") == ["jazz", "night", "at", "café", "21"]
+
+
+async def test_title_matches_rank_above_other_fields():
+    index = make_index()
+    await index.add(1, {"title": "Night market", "description": "jazz"}, version=now)
+    await index.add(2, {"title": "Jazz night", "venue": "Cebu"}, version=now)
+    await index.add(3, {"title": "Rock night", "venue": "Jazz Hall"}, version=now)
+
+    results = await index.search("JAZZ", after=None, limit=10)
+
+    assert [doc_id for doc_id, _ in results] == [2, 3, 1]
+
+
+async def test_every_query_term_must_match():
+    index = make_index()
+    await index.add(1, {"title": "Jazz night"}, version=now)
+    await index.add(2, {"title": "Jazz brunch"}, version=now)
+
+    results = await index.search("jazz night", after=None, limit=10)
+    assert [doc_id for doc_id, _ in results] == [1]
+    assert await index.search("jazz opera", after=None, limit=10) == []
+    assert await index.search("...", after=None, limit=10) == []
+
+
+async def test_pages_follow_the_keyset():
+    index = make_index()
+    for doc_id in range(1, 8):
+        await index.add(doc_id, {"title": "Jazz"}, version=now)
+
+    first = await index.search("jazz", after=None, limit=3)
+    second = await index.search("jazz", after=(first[-1][1], first[-1][0]), limit=3)
+
+    # Equal scores are ordered by id
+    assert [doc_id for doc_id, _ in first] == [1, 2, 3]
+    assert [doc_id for doc_id, _ in second] == [4, 5, 6]
+
+
+async def test_updates_replace_terms_and_stale_versions_are_ignored():
+    index = make_index()
+    await index.add(1, {"title": "Jazz night"}, version=now)
+    await index.add(1, {"title": "Rock night"}, version=now + timedelta(seconds=1))
+    # Arrives late, from an older write
+    await index.add(1, {"title": "Blues night"}, version=now)
+
+    assert await index.search("jazz", after=None, limit=10) == []
+    assert await index.search("blues", after=None, limit=10) == []
+    assert len(await index.search("rock", after=None, limit=10)) == 1
+    assert index.stats()["terms"] == 2
+    assert len(index) == 1